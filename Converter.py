@@ -45,8 +45,23 @@ import itertools
 from itertools import chain
 import time
 import numpy as np
-from mathutils import Vector
+from mathutils import Vector, Matrix
+from bpy_extras.io_utils import axis_conversion
 import csv
+import argparse
+import socket
+import hashlib
+import functools
+import tempfile
+import subprocess
+import io
+import secrets
+import hmac
+import types
+
+# Texture and process utilities shared with the add-on that don't need Blender, kept next to Converter.py.
+sys.path.append(str(Path(__file__).parent.resolve()))
+from Textures import read_image_header, pillow_formats, pillow_extensions, get_process_memory, is_process_alive
 
 
 
@@ -77,23 +92,144 @@ def read_json(json_file):
         logging.exception(f"Could Not Read {json_file.name}")
 
 
-# Set global variables from JSON dictionary.
+# Every setting that a settings file or Converter service job may set, and its value when it's missing, e.g. from a settings file written by an older version of Transmogrifier or by hand.  Settings that aren't listed here are rejected.
+default_settings = {
+    "link_import_settings": True,
+    "import_directory": "//",
+    "link_export_settings": True,
+    "set_data_names": True,
+    "export_adjacent": True,
+    "overwrite_files": True,
+    "export_directory": "//",
+    "scale": 1.0,
+    "use_subdirectories": True,
+    "copy_original_contents": False,
+    "prefix": "",
+    "suffix": "",
+    "use_textures": True,
+    "edit_textures": True,
+    "keep_temporary_textures": False,
+    "edit_textures_preset": "PBR_Standard",
+    "link_texture_settings": True,
+    "regex_textures": True,
+    "textures_source": "External",
+    "textures_custom_dir": "//",
+    "copy_textures_custom_dir": False,
+    "overwrite_textures": False,
+    "use_linked_blend_textures": False,
+    "texture_resolution": 1024,
+    "texture_format": "JPEG",
+    "image_quality": 90,
+    "rename_uvs": True,
+    "rename_uvs_name": "UVMap",
+    "export_uv_layout": False,
+    "modified_uvs": False,
+    "uv_export_location": "UV",
+    "uv_directory_custom": "//",
+    "uv_combination": "Material",
+    "uv_resolution": 1024,
+    "uv_format": "PNG",
+    "uv_image_quality": 90,
+    "uv_fill_opacity": 0.0,
+    "set_transforms": False,
+    "set_transforms_filter": ["Rotation", "Scale", "Location"],
+    "set_location": [0.0, 0.0, 0.0],
+    "set_rotation": [0.0, 0.0, 0.0],
+    "set_scale": [1.0, 1.0, 1.0],
+    "apply_transforms": True,
+    "apply_transforms_filter": ["Rotation", "Scale", "Location"],
+    "use_animations": True,
+    "unit_system": "METRIC",
+    "length_unit": "CENTIMETERS",
+    "optimize": False,
+    "optimize_skip_existing_below_target": False,
+    "optimize_overwrite_filter": "All",
+    "optimize_target_file_size": 15.0,
+    "optimize_show_methods": True,
+    "optimize_draco": True,
+    "optimize_texture_resize": True,
+    "optimize_texture_reformat": True,
+    "optimize_decimate": False,
+    "compression_level": 6,
+    "resize_textures_limit": 512,
+    "include_normal_maps": False,
+    "decimate_limit": 3,
+    "mark_as_assets": False,
+    "asset_quality": "Highest Fidelity",
+    "asset_types_to_mark": ["Collections"],
+    "asset_extract_previews": False,
+    "asset_extract_previews_filter": ["Collections"],
+    "assets_allow_duplicates": False,
+    "assets_allow_duplicates_filter": [],
+    "mark_only_master_collection": True,
+    "asset_object_types_filter": ["FONT", "GPENCIL", "CAMERA", "SURFACE", "CURVE", "META", "ARMATURE", "LIGHT", "MESH"],
+    "asset_library": "(no library)",
+    "asset_catalog": "(no catalog)",
+    "asset_blend_location": "Move",
+    "asset_pack_resources": True,
+    "asset_use_absolute_paths": False,
+    "asset_add_metadata": True,
+    "asset_description": "",
+    "asset_license": "",
+    "asset_copyright": "",
+    "asset_author": "",
+    "asset_tags": "",
+    "link_script_settings": False,
+    "trigger": "Before_Export",
+    "logging_save_summary": False,
+    "logging_summary_filter": ["File Size", "Objects", "Materials", "Polycount", "File Path", "Dimensions", "Date", "Textures"],
+    "logging_save_log": False,
+    "logging_unit_system": "METRIC",
+    "logging_length_unit": "METERS",
+    "logging_length_unit_abbr": "m",
+    "logging_bounds_x": 1.0,
+    "logging_bounds_y": 1.0,
+    "logging_bounds_z": 1.0,
+    "imports": [],
+    "exports": [],
+    "textures": [],
+    "scripts": [],
+    "use_background_mode": False,
+    "import_order": "Found",
+    "use_isolation": False,
+    "isolation_group_size": 1,
+    "isolation_timeout": 600,
+    "isolation_memory_limit": 0,
+    "use_worker_pool": False,
+    "worker_count": 2,
+    "use_converter_service": False,
+    "converter_service_port": 52525,
+    "worker_index": None,
+    "report_file": None,
+    "use_resume": False,
+    "use_manifest": False,
+    "use_cached_append": False,
+    "use_fast_reset": False,
+    "use_memory_watermark": False,
+    "memory_watermark": 0,
+    "use_linked_textures": False,
+    "use_texture_cache": False,
+    "texture_cache_size": 0,
+    "texture_cache_dir": "",
+    "use_texture_pool": False,
+    "texture_pool_workers": 0,
+    "use_shared_custom_materials": False,
+}
+
+
+# Set global variables from JSON dictionary.  Only known settings are set, so that a settings file or job can't overwrite anything else in Converter.py.
 def set_settings(json_dict):
     try:
         for key, value in json_dict.items():
-            # Preserve quotation marks during exec() if value is a string type object.
-            if isinstance(value, str):
-                value = repr(value)
-            
-            # Don't preserve quotation marks during exec() if value is not a string type object.
-            else:
-                value = str(value)
-            
-            # Concatenate command.
-            variable_assignment_command = f"globals()['{key}'] = {value}"
-            
-            # Execute variable assignment.
-            exec(variable_assignment_command)
+            if key not in default_settings:
+                print(f"Ignored unknown setting: {key}")
+                logging.warning(f"Ignored unknown setting: {key}")
+                continue
+
+            globals()[key] = value
+
+            # Remember which variables came from settings so they can be fingerprinted for the manifest.
+            globals().setdefault("settings_names", set()).add(key)
         
         print("Set setting from JSON")
         logging.info("Set settings from JSON")
@@ -102,6 +238,18 @@ def set_settings(json_dict):
         logging.exception("Could not set settings from JSON")
 
 
+# Forget every setting set so far and go back to the default settings, so that settings of one job can't carry over to the next in the same Blender session.
+def reset_settings():
+    try:
+        for name in globals().get("settings_names", set()):
+            globals().pop(name, None)
+        globals()["settings_names"] = set()
+        set_settings(default_settings)
+
+    except Exception as Argument:
+        logging.exception("Could not reset settings")
+
+
 # Read dictionary of settings from JSON file.
 def get_settings(json_files):
     try:
@@ -123,6 +271,163 @@ def get_settings(json_files):
         logging.exception("Could not get settings from JSON")
 
 
+# Parse a shard argument formatted as "I/N" into a zero-based shard index and a shard count.  Raises an error for argparse to report.
+def parse_shard(shard):
+    match = re.fullmatch(r"(\d+)/(\d+)", shard)
+    if not match or not int(match.group(1)) < int(match.group(2)):
+        raise argparse.ArgumentTypeError(f"Shard must be formatted as I/N where 0 <= I < N: {shard}")
+    
+    return int(match.group(1)), int(match.group(2))
+
+
+# Parse the arguments passed to Converter.py after "--".
+def get_arguments():
+    try:
+        argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+
+        parser = argparse.ArgumentParser(prog="Converter.py", description="Batch convert 3D files and associated textures into other formats.")
+        parser.add_argument("--settings", metavar="PATH", help="Settings JSON file to convert with (default: Settings.json next to Converter.py)")
+        parser.add_argument("--files-from", metavar="PATH", help="Text file listing one import file per line to convert instead of the files in the settings")
+        parser.add_argument("--shard", type=parse_shard, metavar="I/N", help="Only convert shard I (zero-based) of N equal shares of the import files")
+        parser.add_argument("--output-report", metavar="PATH", help="JSON file to write the conversion report to (default: Converter_Report.json next to Converter.py)")
+        parser.add_argument("--serve", type=int, metavar="PORT", help="Keep Blender open and serve conversion jobs on a local port instead of converting once")
+        parser.add_argument("--token-file", metavar="PATH", help="File to write the Converter service's access token to, readable only by you.  Every job sent to the service must include the token (required with --serve)")
+        parser.add_argument("--queue", metavar="DIR", help="Work on a queue directory on shared storage together with any number of other Converters, creating it from --settings and --files-from if it doesn't exist yet")
+        parser.add_argument("--lease", type=int, default=300, metavar="SECONDS", help="Seconds after a queue worker's last sign of life that its items are returned to the queue.  Workers renew their lease after each stage of a conversion, so this must be longer than the longest single import, export or texture step (default: 300)")
+        parser.add_argument("--benchmark", nargs="+", metavar="FILE", help="Benchmark the fast importer against the import operator on the given STL, OBJ or PLY files instead of converting")
+        parser.add_argument("--benchmark-reset", type=int, metavar="ITEMS", help="Benchmark resetting the scene between the given number of stand-in items with and without Fast Reset instead of converting")
+        parser.add_argument("--reset-mode", choices=["Standard", "Fast"], help="Only benchmark this reset mode with --benchmark-reset, in this Blender process instead of a fresh one per mode")
+        parser.add_argument("--repeat", type=int, default=3, metavar="N", help="Number of times to import each file with each importer when benchmarking (default: 3)")
+        parser.add_argument("--resume", action="store_true", help="Resume an interrupted batch conversion from its journal, skipping the items that already finished")
+
+        return parser.parse_args(argv)
+
+    except Exception as Argument:
+        logging.exception("Could not get arguments")
+
+
+# Read a list of import files from a text file with one file path per line.
+def read_files_list(files_list):
+    try:
+        with open(files_list, 'r') as openfile:
+            files = [str(Path(line.strip()).resolve()) for line in openfile if line.strip()]
+
+        print(f"Read {len(files)} files from list: {Path(files_list).name}")
+        logging.info(f"Read {len(files)} files from list: {Path(files_list).name}")
+
+        return files
+
+    except Exception as Argument:
+        logging.exception(f"Could not read files from list: {Path(files_list).name}")
+
+
+# Raised when the process writing an import files manifest quits before marking its end, so that the batch conversion fails instead of waiting for more files forever.
+class ManifestWriterError(Exception):
+    pass
+
+
+# Read the import files listed in a streaming manifest one at a time.  The manifest is a JSON Lines file that may still be being written while it's read, so wait for more files until the manifest's end is reached.
+def read_import_files_manifest(manifest_file, writer_pid=None):
+    try:
+        with open(manifest_file, 'r') as openfile:
+            line = ""
+            writer_gone = False
+            while True:
+                line += openfile.readline()
+                
+                # Wait for the rest of a line that hasn't been written yet, but only while the process writing the manifest is alive.  Once it's gone, read what it wrote before failing the batch conversion.
+                if not line.endswith("\n"):
+                    if writer_gone:
+                        raise ManifestWriterError(f"Import files manifest was abandoned before its end: {Path(manifest_file).name}")
+                    if writer_pid and not is_process_alive(writer_pid):
+                        writer_gone = True
+                        continue
+                    time.sleep(0.1)
+                    continue
+
+                entry = json.loads(line)
+                line = ""
+                if entry.get("end"):
+                    return
+                yield entry["file"]
+
+    except ManifestWriterError:
+        logging.exception(f"Could not read import files manifest: {Path(manifest_file).name}")
+        raise
+
+    except Exception as Argument:
+        logging.exception(f"Could not read import files manifest: {Path(manifest_file).name}")
+
+
+# Get the import files of an import instance, either listed in the settings or streamed from a manifest while they're still being found.
+def get_import_files(import_settings_dict):
+    try:
+        if "files" in import_settings_dict:
+            return import_settings_dict["files"]
+        if "files_manifest" in import_settings_dict:
+            return read_import_files_manifest(import_settings_dict["files_manifest"], import_settings_dict.get("files_manifest_writer"))
+        return []
+
+    except Exception as Argument:
+        logging.exception("Could not get import files")
+        return []
+
+
+# Keep only one shard's share of the import files.  Files are dealt out to the shards in order, so every shard gets a similar share of every import instance.
+def shard_imports(shard_index, shard_count):
+    try:
+        file_index = 0
+        for import_settings_dict in imports:
+            files = []
+            for file in get_import_files(import_settings_dict):
+                if file_index % shard_count == shard_index:
+                    files.append(file)
+                file_index += 1
+            import_settings_dict["files"] = files
+
+        print(f"Sharded imports: {shard_index}/{shard_count}")
+        logging.info(f"Sharded imports: {shard_index}/{shard_count}")
+
+    except Exception as Argument:
+        logging.exception(f"Could not shard imports: {shard_index}/{shard_count}")
+
+
+# Apply command-line arguments on top of the settings.
+def apply_arguments(arguments):
+    try:
+        if arguments.output_report:
+            set_settings({"report_file": str(Path(arguments.output_report).resolve())})
+
+        if arguments.resume:
+            set_settings({"use_resume": True})
+
+        if arguments.files_from:
+            assign_files_to_imports(read_files_list(arguments.files_from))
+
+        # Give each shard its own log, summary and temporary textures, the same as a worker in a worker pool.
+        if arguments.shard:
+            shard_index, shard_count = arguments.shard
+            shard_imports(shard_index, shard_count)
+            set_settings({"worker_index": shard_index})
+
+        print("Applied arguments")
+        logging.info("Applied arguments")
+
+    except Exception as Argument:
+        logging.exception("Could not apply arguments")
+
+
+# Get a suffix to distinguish the files of a worker in a worker pool from those of other workers.
+def get_worker_suffix():
+    try:
+        if worker_index is not None:
+            return f"_Worker_{worker_index}"
+        return ""
+
+    except Exception as Argument:
+        logging.exception("Could not get worker suffix")
+
+
 # Copy finished log file to other import directories.
 def copy_log_file(log_file):
     try:
@@ -142,7 +447,7 @@ def make_log_file():
     timestamp = str(datetime.datetime.now().strftime("%Y%m%d_%H%M%S"))
     
     log_directory = imports[0]["directory"]
-    log_file = Path(log_directory, f"Transmogrifier_Log_{timestamp}.txt")
+    log_file = Path(log_directory, f"Transmogrifier_Log_{timestamp}{get_worker_suffix()}.txt")
     
     # Create log file.
     if logging_save_log:
@@ -170,20 +475,64 @@ def enable_addons():
         logging.exception("Could not enable addons")
 
 
-# Copy file from source to destination.
-def copy_file(directory, file_source):
+# ioctl request to clone a file's data, i.e. make a reflink, on Linux filesystems that share data between copies (e.g. Btrfs, XFS).
+FICLONE = 0x40049409
+
+
+# Stage a texture file from source to destination without duplicating its data if Link Textures is enabled: as a reflink where the filesystem supports it, otherwise as a hard link, otherwise as a copy.
+# A hard-linked texture shares its data with the original, so it must be unshared with unshare_staged_file() before Blender writes to it.
+def stage_file(file_source, file_destination):
+    if use_linked_textures:
+        try:
+            import fcntl
+            with open(file_source, 'rb') as infile, open(file_destination, 'wb') as outfile:
+                fcntl.ioctl(outfile.fileno(), FICLONE, infile.fileno())
+            shutil.copymode(file_source, file_destination)
+            return file_destination
+        except (ImportError, OSError):
+            Path(file_destination).unlink(missing_ok=True)
+
+        try:
+            os.link(file_source, file_destination)
+            return file_destination
+        except OSError:
+            pass
+
+    return shutil.copy(file_source, file_destination)
+
+
+# Give a hard-linked texture file its own copy of its data before Blender writes to it, so that the original texture isn't changed with it.
+def unshare_staged_file(file):
+    try:
+        file = Path(file)
+        if not file.is_file() or file.stat().st_nlink < 2:
+            return
+
+        file_copy = file.with_name(f"{file.name}.unshared")
+        shutil.copy(file, file_copy)
+        os.replace(file_copy, file)
+
+        print(f"Unshared staged file: {file.name}")
+        logging.info(f"Unshared staged file: {file.name}")
+
+    except Exception as Argument:
+        logging.exception(f"Could not unshare staged file: {Path(file).name}")
+
+
+# Copy file from source to destination.  Stage textures instead of copying them if requested.
+def copy_file(directory, file_source, stage=False):
     try:
         file_destination = Path(directory, Path(file_source).name)  # Set destination path.
         
         if Path(file_source).is_dir():  # Check if "file" is a directory.
             if Path(file_destination).exists():
                 shutil.rmtree(file_destination)  # Remove any existing destination directory.
-            shutil.copytree(file_source, file_destination)  # Copy the directory.
+            shutil.copytree(file_source, file_destination, copy_function=stage_file if stage else shutil.copy2)  # Copy the directory.
 
         elif Path(file_source).is_file():  # Check if "file" is a file.
             if Path(file_destination).is_file():
                 Path.unlink(file_destination)  # Remove any existing destination file.
-            shutil.copy(file_source, file_destination)  # Copy the file.
+            (stage_file if stage else shutil.copy)(file_source, file_destination)  # Copy the file.
 
         else:
             return  # Return nothing if source file doesn't exist.
@@ -257,10 +606,13 @@ def use_fake_user():
 
 
 # Sometimes purge orphans won't delete data blocks (e.g. images) even though they have no users. This will force the deletion of any data blocks within a specified bpy.data.[data type]
-def clean_data_block(block):
+def clean_data_block(block, keep_linked=False):
     try:
-        # iterate over every entry in the data block
-        for data in block:
+        # iterate over a copy of the data block so that removing entries doesn't skip any
+        for data in list(block):
+            # Keep data linked from libraries if requested so it can be reused by later items.
+            if keep_linked and data.library:
+                continue
             block.remove(data)
 
         print(f"Cleaned data block: {str(block).upper()}")
@@ -294,7 +646,12 @@ def add_collection(item_name):
 # Recursively delete orphaned data blocks.
 def purge_orphans():
     try:
-        bpy.ops.outliner.orphans_purge(do_local_ids=True, do_linked_ids=True, do_recursive=True)
+        # Keep linked data for the rest of the batch when appending blend files with the cache.
+        # Purge through the data API instead of the Outliner operator for Fast Reset.
+        if use_fast_reset and hasattr(bpy.data, "orphans_purge"):
+            bpy.data.orphans_purge(do_local_ids=True, do_linked_ids=not use_cached_append, do_recursive=True)
+        else:
+            bpy.ops.outliner.orphans_purge(do_local_ids=True, do_linked_ids=not use_cached_append, do_recursive=True)
 
         print("Purged orphaned data blocks recursively")
         logging.info("Purged orphaned data blocks recursively")
@@ -303,12 +660,41 @@ def purge_orphans():
         logging.exception("Could not purge orphaned data blocks recursively")
 		
 
+# Remove every entry of the given data blocks with one call to bpy.data.batch_remove, instead of one entry at a time.
+def batch_clean_data_blocks(blocks):
+    try:
+        # Keep data linked from libraries for the rest of the batch when appending blend files with the cache.
+        ids = [data for block in blocks for data in block if not (use_cached_append and data.library)]
+        bpy.data.batch_remove(ids)
+
+        print(f"Batch cleaned data blocks: {len(ids)} entries")
+        logging.info(f"Batch cleaned data blocks: {len(ids)} entries")
+
+    except Exception as Argument:
+        logging.exception("Could not batch clean data blocks")
+
+
+# Remove the given data blocks and purge the data they used, either all at once for Fast Reset or one entry at a time.
+def clear_data_blocks(blocks):
+    try:
+        if use_fast_reset:
+            batch_clean_data_blocks(blocks)
+        else:
+            for block in blocks:
+                clean_data_block(block, use_cached_append)
+        purge_orphans()
+
+        print("Cleared data blocks")
+        logging.info("Cleared data blocks")
+
+    except Exception as Argument:
+        logging.exception("Could not clear data blocks")
+
+
 # Enable addon dependencies and clear the scene
 def setup_scene(item_name):
     try:
-        clean_data_block(bpy.data.objects)
-        clean_data_block(bpy.data.collections)
-        purge_orphans()
+        clear_data_blocks([bpy.data.objects, bpy.data.collections])
         add_collection(item_name)
 
         print("Set up scene")
@@ -318,9 +704,98 @@ def setup_scene(item_name):
         logging.exception("Could not set up scene")
 		
 
+# Get the absolute path of a linked library, to compare it with import files.
+def get_library_path(library):
+    return str(Path(bpy.path.abspath(library.filepath)).resolve())
+
+
+# Remove the least recently used libraries linked with Cached Append, and all data read from them, once more than cached_library_limit blend files were linked.  This keeps memory from growing with every distinct blend file in the batch.  Only call it while the scene is cleared between items.
+def evict_cached_libraries(import_file):
+    try:
+        import_path = str(Path(import_file).resolve())
+        if import_path in cached_libraries:
+            cached_libraries.remove(import_path)
+        cached_libraries.append(import_path)
+
+        while len(cached_libraries) > cached_library_limit:
+            evicted_path = cached_libraries.pop(0)
+
+            # Libraries linked indirectly through the evicted library go with it, unless they were linked as blend files of their own.
+            evicted_libraries = []
+            for library in bpy.data.libraries:
+                ancestor = library
+                while ancestor and get_library_path(ancestor) != evicted_path:
+                    ancestor = ancestor.parent
+                if ancestor and (library == ancestor or get_library_path(library) not in cached_libraries):
+                    evicted_libraries.append(library)
+
+            for library in evicted_libraries:
+                bpy.data.libraries.remove(library)
+
+            print(f"Evicted cached library: {Path(evicted_path).name}")
+            logging.info(f"Evicted cached library: {Path(evicted_path).name}")
+
+    except Exception as Argument:
+        logging.exception(f"Could not evict cached libraries: {Path(import_file).name}")
+
+
+# Make the linked data that the scene uses local, e.g. before saving a blend file that shouldn't link back to the blend files it was converted from.
+# Data that's also used by other linked data is copied instead, so the rest of the cache stays linked.
+def make_linked_data_local():
+    try:
+        # Making data local exposes the linked data it uses to local users in turn, so repeat a few levels deep.
+        made_local = 0
+        for depth in range(16):
+            user_map = bpy.data.user_map()
+            linked_ids = [data for data, users in user_map.items() if data.library and any(user.library is None for user in users)]
+            if not linked_ids:
+                break
+            for data in linked_ids:
+                data.make_local()
+            made_local += len(linked_ids)
+
+        print(f"Made linked data local: {made_local} entries")
+        logging.info(f"Made linked data local: {made_local} entries")
+
+    except Exception as Argument:
+        logging.exception("Could not make linked data local")
+
+
+# Link a blend file's objects to Converter.blend and make only the objects and their object data local.  The materials, node groups, images and other data they use stay linked, so data shared between blend files (e.g. from a common asset library) is read once and reused by the next items instead of being appended again for every item.
+def link_blend_objects(import_file):
+    try:
+        # Keep only the most recently linked libraries before linking another.
+        evict_cached_libraries(import_file)
+
+        # Linking a library that's already linked reuses the data already read from it.
+        with bpy.data.libraries.load(str(import_file), link=True) as (data_from, data_to):
+            data_to.objects = [object for object in data_from.objects]
+
+        for object in data_to.objects:
+            if object is None:
+                continue
+            
+            # Make the object and its object data editable so that they can be transformed and optimized.
+            object = object.make_local()
+            if object.data and object.data.library:
+                object.data = object.data.make_local()
+            bpy.context.collection.objects.link(object)
+
+        print(f"Linked blend file objects: {import_file.name}")
+        logging.info(f"Linked blend file objects: {import_file.name}")
+
+    except Exception as Argument:
+        logging.exception(f"Could not link blend file objects: {import_file.name}")
+
+
 # Append a blend file's objects to Converter.blend.
 def append_blend_objects(import_file_command, import_file_options, import_file):
     try:
+        # Reuse data shared between blend files if requested by User.
+        if use_cached_append:
+            link_blend_objects(import_file)
+            return
+
         with bpy.data.libraries.load(str(import_file), link=False) as (data_from, data_to):  # Append all objects.
             data_to.objects = [object for object in data_from.objects]
         
@@ -335,33 +810,334 @@ def append_blend_objects(import_file_command, import_file_options, import_file):
         logging.exception(f"Could not append blend file objects: {import_file.name}")
 
 
+# Time spent in each stage of the batch conversion (e.g. "Import FBX"), as a call count and total seconds.
+stage_timings = {}
+
+# Hits and misses of the texture cache in the batch conversion, and the estimated size of the cache in bytes once known.
+texture_cache_stats = {"hits": 0, "misses": 0}
+texture_cache_bytes = None
+
+# Blend files linked with Cached Append, least recently used first, and how many of them to keep linked between items.
+cached_libraries = []
+cached_library_limit = 8
+
+# Command line this Converter was started with, if it can restart itself to continue a batch conversion in a new Blender process.
+restart_argv = None
+
+# Texture sets of the textures directory that materials were last created from, as indexed by get_texture_set_index().
+texture_set_index = {}
+
+# Names of the materials built once from the "Custom" textures source and shared by every item in the batch conversion.
+shared_custom_materials = set()
+
+# Claim file of the queue item being converted, whose lease is renewed after each stage of the batch conversion.
+held_claim_file = None
+
+
+# Resolve an operator stored as a string (e.g. "bpy.ops.import_scene.fbx(**") and its options stored as a string to the operator itself and a dictionary of options.  Resolved once per batch conversion rather than once per file.
+@functools.lru_cache(maxsize=None)
+def resolve_operator(operator, options):
+    try:
+        operator_module, operator_name = operator.removeprefix("bpy.ops.").removesuffix("(**").split(".")
+
+        return getattr(getattr(bpy.ops, operator_module), operator_name), eval(options)
+
+    except Exception as Argument:
+        logging.exception(f"Could not resolve operator: {operator}")
+
+
+# Record how long a call took under the given stage.
+def record_stage_timing(stage, seconds):
+    stage_timing = stage_timings.setdefault(stage, {"count": 0, "seconds": 0})
+    stage_timing["count"] += 1
+    stage_timing["seconds"] += seconds
+    renew_lease()
+
+
+# Renew the lease of the queue item being converted, if any.  Renewed from the main loop between stages rather than from a background thread, which a long operator holding the GIL would keep from running.
+def renew_lease():
+    if held_claim_file is None:
+        return
+
+    try:
+        os.utime(held_claim_file)
+    except OSError:
+        pass
+
+
+# Call an operator with options and record how long it took under the given stage.
+def call_operator(stage, operator, options):
+    start_time = time.perf_counter()
+    operator(**options)
+    seconds = time.perf_counter() - start_time
+    record_stage_timing(stage, seconds)
+
+    return seconds
+
+
+# Build a mesh object from arrays of vertex coordinates, the vertex index of every face corner, and the number of corners of every face.
+def build_fast_mesh(name, vertices, loop_vertex_indices, loop_totals):
+    mesh = None
+    object = None
+    try:
+        mesh = bpy.data.meshes.new(name)
+
+        mesh.vertices.add(len(vertices))
+        mesh.vertices.foreach_set("co", np.ascontiguousarray(vertices, dtype=np.float32).ravel())
+
+        mesh.loops.add(len(loop_vertex_indices))
+        mesh.loops.foreach_set("vertex_index", np.ascontiguousarray(loop_vertex_indices, dtype=np.int32))
+
+        loop_totals = np.ascontiguousarray(loop_totals, dtype=np.int32)
+        loop_starts = np.zeros(len(loop_totals), dtype=np.int32)
+        np.cumsum(loop_totals[:-1], out=loop_starts[1:])
+        mesh.polygons.add(len(loop_totals))
+        mesh.polygons.foreach_set("loop_start", loop_starts)
+        # Face sizes are derived from the loop starts since Blender 4.0.
+        if bpy.app.version < (4, 0, 0):
+            mesh.polygons.foreach_set("loop_total", loop_totals)
+
+        mesh.update(calc_edges=True)
+        mesh.validate()
+
+        # Link the object to the scene and select it, the same as an import operator.
+        object = bpy.data.objects.new(name, mesh)
+        bpy.context.collection.objects.link(object)
+        object.select_set(True)
+        bpy.context.view_layer.objects.active = object
+
+        return object
+
+    except Exception as Argument:
+        logging.exception(f"Could not build fast mesh: {name}")
+
+        # Remove the partially built object and mesh so that the import operator falls back to an empty scene.
+        if object is not None:
+            bpy.data.objects.remove(object)
+        if mesh is not None:
+            bpy.data.meshes.remove(mesh)
+
+
+# Read the triangles of a binary or ASCII STL file as unique vertices and the vertex index of every triangle corner.  Binary files are memory-mapped.
+def read_stl(import_file):
+    size = import_file.stat().st_size
+    with open(import_file, 'rb') as openfile:
+        header = openfile.read(84)
+    
+    # A binary STL is an 80 byte header, a triangle count, and 50 bytes per triangle.  Some binary STLs start with "solid" too, so check the size rather than the header.
+    if size >= 84 and 84 + 50 * int(np.frombuffer(header[80:84], dtype="<u4")[0]) == size:
+        triangle_dtype = np.dtype([("normal", "<f4", (3,)), ("vertices", "<f4", (3, 3)), ("attribute", "<u2")])
+        triangles = np.memmap(import_file, dtype=triangle_dtype, mode='r', offset=84)
+        corners = np.ascontiguousarray(triangles["vertices"]).reshape(-1, 3)
+    else:
+        with open(import_file, 'rb') as openfile:
+            corners = np.array(re.findall(rb"vertex\s+(\S+)\s+(\S+)\s+(\S+)", openfile.read())).astype(np.float32).reshape(-1, 3)
+
+    # Merge corners at the same location into shared vertices, the same as the STL import operator.
+    unique_corners, loop_vertex_indices = np.unique(corners.view(np.dtype((np.void, corners.dtype.itemsize * 3))).ravel(), return_inverse=True)
+    vertices = unique_corners.view(np.float32).reshape(-1, 3)
+    loop_totals = np.full(len(corners) // 3, 3, dtype=np.int32)
+
+    return vertices, loop_vertex_indices.ravel(), loop_totals
+
+
+# Read the vertices and faces of an OBJ file.  Only geometry is read: UVs, normals, materials and object groups are not.
+def read_obj(import_file):
+    vertices = []
+    loop_vertex_indices = []
+    loop_totals = []
+    with open(import_file, 'rb') as openfile:
+        for line in openfile:
+            if line.startswith(b"v "):
+                vertices.append(line.split()[1:4])
+            elif line.startswith(b"f "):
+                # Each corner is "v", "v/vt", "v//vn" or "v/vt/vn", counting from 1, or from the end if negative.
+                face = [int(corner.split(b"/")[0]) for corner in line.split()[1:]]
+                loop_vertex_indices.extend(index - 1 if index > 0 else len(vertices) + index for index in face)
+                loop_totals.append(len(face))
+
+    vertices = np.array(vertices).astype(np.float32).reshape(-1, 3)
+
+    return vertices, np.array(loop_vertex_indices, dtype=np.int32), np.array(loop_totals, dtype=np.int32)
+
+
+# Read the vertices and faces of an ASCII or binary PLY file.  Binary files are memory-mapped.  Returns None for layouts the fast importer doesn't support.
+def read_ply(import_file):
+    ply_types = {
+        "char": "i1", "int8": "i1", "uchar": "u1", "uint8": "u1",
+        "short": "i2", "int16": "i2", "ushort": "u2", "uint16": "u2",
+        "int": "i4", "int32": "i4", "uint": "u4", "uint32": "u4",
+        "float": "f4", "float32": "f4", "double": "f8", "float64": "f8",
+    }
+
+    # Read the header's format and elements, each a name, count and list of properties.
+    elements = []
+    with open(import_file, 'rb') as openfile:
+        if openfile.readline().strip() != b"ply":
+            return None
+        for line in openfile:
+            words = line.decode("ascii", "ignore").split()
+            if not words or words[0] in ["comment", "obj_info"]:
+                continue
+            if words[0] == "format":
+                ply_format = words[1]
+            elif words[0] == "element":
+                elements.append((words[1], int(words[2]), []))
+            elif words[0] == "property":
+                elements[-1][2].append(words[1:])
+            elif words[0] == "end_header":
+                break
+        header_size = openfile.tell()
+
+    vertices = None
+    loop_vertex_indices = None
+    loop_totals = None
+
+    # ASCII
+    if ply_format == "ascii":
+        with open(import_file, 'rb') as openfile:
+            openfile.seek(header_size)
+            lines = openfile.read().split(b"\n")
+        line_index = 0
+        for name, count, properties in elements:
+            element_lines = lines[line_index:line_index + count]
+            line_index += count
+            property_names = [property[-1] for property in properties]
+            if name == "vertex":
+                values = np.array([line.split()[:len(properties)] for line in element_lines]).astype(np.float64)
+                vertices = values[:, [property_names.index("x"), property_names.index("y"), property_names.index("z")]]
+            elif name == "face":
+                if properties[0][0] != "list":
+                    return None
+                faces = [line.split() for line in element_lines]
+                loop_totals = np.array([int(face[0]) for face in faces], dtype=np.int32)
+                loop_vertex_indices = np.array([index for face in faces for index in face[1:1 + int(face[0])]]).astype(np.int32)
+
+    # Binary
+    else:
+        byte_order = "<" if ply_format == "binary_little_endian" else ">"
+        data = np.memmap(import_file, dtype=np.uint8, mode='r', offset=header_size)
+        offset = 0
+        for name, count, properties in elements:
+            has_list = any(property[0] == "list" for property in properties)
+
+            # Elements of fixed-size properties, e.g. vertices.
+            if not has_list:
+                element_dtype = np.dtype([(property[1], byte_order + ply_types[property[0]]) for property in properties])
+                values = np.frombuffer(data, dtype=element_dtype, count=count, offset=offset)
+                offset += count * element_dtype.itemsize
+                if name == "vertex":
+                    vertices = np.column_stack((values["x"], values["y"], values["z"]))
+            
+            # Faces that are nothing but a list of vertex indices.
+            elif name == "face" and len(properties) == 1:
+                count_type = np.dtype(byte_order + ply_types[properties[0][1]])
+                index_type = np.dtype(byte_order + ply_types[properties[0][2]])
+
+                # Read faces that all have the same number of corners (e.g. triangles) at once.
+                corner_count = int(np.frombuffer(data, dtype=count_type, count=1, offset=offset)[0]) if count else 0
+                face_dtype = np.dtype([("count", count_type), ("indices", index_type, (corner_count,))])
+                if offset + count * face_dtype.itemsize <= len(data):
+                    faces = np.frombuffer(data, dtype=face_dtype, count=count, offset=offset)
+                    if np.all(faces["count"] == corner_count):
+                        loop_totals = faces["count"].astype(np.int32)
+                        loop_vertex_indices = faces["indices"].astype(np.int32).ravel()
+                        offset += count * face_dtype.itemsize
+                        continue
+
+                # Otherwise read faces one at a time.
+                loop_totals = np.zeros(count, dtype=np.int32)
+                face_indices = []
+                for face_index in range(count):
+                    corner_count = int(np.frombuffer(data, dtype=count_type, count=1, offset=offset)[0])
+                    offset += count_type.itemsize
+                    face_indices.append(np.frombuffer(data, dtype=index_type, count=corner_count, offset=offset))
+                    offset += corner_count * index_type.itemsize
+                    loop_totals[face_index] = corner_count
+                loop_vertex_indices = np.concatenate(face_indices).astype(np.int32) if face_indices else np.zeros(0, dtype=np.int32)
+
+            # Stop at any other element with lists, since the size of what follows is unknown.
+            else:
+                break
+
+    if vertices is None:
+        return None
+    if loop_totals is None:
+        loop_vertex_indices = np.zeros(0, dtype=np.int32)
+        loop_totals = np.zeros(0, dtype=np.int32)
+
+    return vertices, loop_vertex_indices, loop_totals
+
+
+# Import a geometry-only file with NumPy instead of the import operator.  Returns False if the file can't be imported this way, so that the import operator can be used instead.
+def fast_import_file(import_file, options):
+    try:
+        # Reader of each format and the default forward and up axes of its import operator.
+        readers = {
+            ".stl": (read_stl, "Y", "Z"),
+            ".obj": (read_obj, "NEGATIVE_Z", "Y"),
+            ".ply": (read_ply, "Y", "Z"),
+        }
+        if import_file.suffix.lower() not in readers:
+            return False
+        reader, forward_axis, up_axis = readers[import_file.suffix.lower()]
+
+        mesh_data = reader(import_file)
+        if mesh_data is None:
+            return False
+        
+        vertices, loop_vertex_indices, loop_totals = mesh_data
+
+        # Convert from the preset's axes to Blender's, the same as the import operator.  Newer operators name the options "forward_axis" and "up_axis", older ones "axis_forward" and "axis_up".
+        forward_axis = options.get("forward_axis", options.get("axis_forward", forward_axis))
+        up_axis = options.get("up_axis", options.get("axis_up", up_axis))
+        axis_matrix = np.array(axis_conversion(from_forward=forward_axis.replace("NEGATIVE_", "-"), from_up=up_axis.replace("NEGATIVE_", "-")), dtype=np.float64)
+        vertices = (vertices @ axis_matrix.T) * options.get("global_scale", 1.0)
+
+        bpy.ops.object.select_all(action='DESELECT')
+        object = build_fast_mesh(import_file.stem, vertices, loop_vertex_indices, loop_totals)
+        
+        return object is not None
+
+    except Exception as Argument:
+        logging.exception(f"Could not fast import file: {import_file.name}")
+        return False
+
+
 # Import file of a format type supplied by the user.
 def import_a_file(import_file, import_settings_dict):
     try:
-        # Get import options as a dictionary.
-        options = eval(import_settings_dict["options"])
+        # Get import operator and a copy of its options as a dictionary.
+        operator, options = resolve_operator(import_settings_dict["operator"], import_settings_dict["options"])
+        options = dict(options)
 
         # Update options with filepath to the location of the model to be imported.
         options["filepath"] = str(import_file)
         
-        # Get import operator.
-        operator = import_settings_dict["operator"]
-        
         # Select "Objects" Library to append from current .blend file if importing a blend file.
-        if operator == "bpy.ops.wm.append(**": 
-            append_blend_objects(operator, options, import_file)
+        if import_settings_dict["operator"] == "bpy.ops.wm.append(**": 
+            append_blend_objects(import_settings_dict["operator"], options, import_file)
             return
         
-        # Concatenate the import command with the import options dictionary
-        operator = f"{operator}{options})"
-        print(operator)
-        logging.info(operator)
+        # Import geometry-only formats with the fast importer if requested by User, falling back to the import operator for files it can't read.
+        if import_settings_dict.get("importer") == "Fast":
+            start_time = time.perf_counter()
+            if fast_import_file(import_file, options):
+                seconds = time.perf_counter() - start_time
+                record_stage_timing(f"Import {import_settings_dict['name']} (Fast)", seconds)
+
+                print(f"Fast imported file: {import_file.name} ({seconds:.2f} s)")
+                logging.info(f"Fast imported file: {import_file.name} ({seconds:.2f} s)")
+                return
 
-        # Run operator, which is stored as a string and won't run otherwise.
-        exec(operator)
+        print(f"{import_settings_dict['operator']}{options})")
+        logging.info(f"{import_settings_dict['operator']}{options})")
 
-        print(f"Imported file: {import_file.name}")
-        logging.info(f"Imported file: {import_file.name}")
+        # Run operator.
+        seconds = call_operator(f"Import {import_settings_dict['name']}", operator, options)
+
+        print(f"Imported file: {import_file.name} ({seconds:.2f} s)")
+        logging.info(f"Imported file: {import_file.name} ({seconds:.2f} s)")
 
     except Exception as Argument:
         logging.exception(f"Could not import file: {import_file.name}")
@@ -427,7 +1203,7 @@ def apply_transformations(apply_transforms_filter):
 
         # Select all objects
         bpy.ops.object.select_all(action='SELECT')
-        obj = bpy.context.window.scene.objects[0]
+        obj = bpy.context.scene.objects[0]
         bpy.context.view_layer.objects.active = obj
 
         # Apply transformations according to filter
@@ -440,11 +1216,22 @@ def apply_transformations(apply_transforms_filter):
         logging.exception(f"Could not apply transformations: {apply_transforms_filter}")
 		
 
+# Remove every material slot of the selected objects.  Material Utilities' operator needs a 3D Viewport, so the slots are removed through the data API in background mode.
+def remove_all_material_slots():
+    if not bpy.app.background:
+        bpy.ops.view3d.materialutilities_remove_all_material_slots(only_active=False)
+        return
+
+    for object in bpy.context.selected_objects:
+        if object.data is not None and hasattr(object.data, "materials"):
+            object.data.materials.clear()
+
+
 # Clear all users of all materials.
 def clear_materials_users():
     try:
         # Remove any imported materials.
-        bpy.ops.view3d.materialutilities_remove_all_material_slots(only_active=False)
+        remove_all_material_slots()
         
         # Delete any old materials that might have the same name as the imported object.
         purge_orphans()
@@ -490,7 +1277,7 @@ def select_only_meshes():
 
         for object in objects:
             object.select_set(object.type == "MESH")
-            object = bpy.context.window.scene.objects[0]
+            object = bpy.context.scene.objects[0]
             bpy.context.view_layer.objects.active = object
 
         print("Selected only mesh-type objects")
@@ -503,7 +1290,15 @@ def select_only_meshes():
 # Select all objects again before exporting. The previously actively selected object should still be a MESH type object, although this should no longer matter.
 def select_by_material(material):
     try:
-        bpy.ops.view3d.materialutilities_select_by_material_name(material_name = material.name)
+        # Material Utilities' operator needs a 3D Viewport, so select the objects through the data API in background mode.
+        if bpy.app.background:
+            objects = [object for object in bpy.context.view_layer.objects if any(slot.material == material for slot in object.material_slots)]
+            for object in objects:
+                object.select_set(True)
+            if objects:
+                bpy.context.view_layer.objects.active = objects[0]
+        else:
+            bpy.ops.view3d.materialutilities_select_by_material_name(material_name = material.name)
 
         print(f"Selected objects with material: {material.name}")
         logging.info(f"Selected objects with material: {material.name}")
@@ -632,11 +1427,11 @@ def create_textures_temp(item_dir, textures_dir, textures_temp_dir):
                     for image in image_list:
                         image_src = Path(item_dir, image)
                         image_dest = Path(textures_temp_dir, image)
-                        shutil.copy(image_src, image_dest)  # Copy each potential image texture to textures_temp
+                        stage_file(image_src, image_dest)  # Copy each potential image texture to textures_temp
 
             # If a textures directory exists and is not empty, assume it contains images or texture set subdirectories containing images.
             else:
-                shutil.copytree(textures_dir, textures_temp_dir)
+                shutil.copytree(textures_dir, textures_temp_dir, copy_function=stage_file)
         
         # If no textures directory exists, make one and fill it with images.
         else: 
@@ -652,7 +1447,7 @@ def create_textures_temp(item_dir, textures_dir, textures_temp_dir):
                 for image in image_list:
                     image_src = Path(item_dir, image)
                     image_dest = Path(textures_temp_dir, image)
-                    shutil.copy(image_src, image_dest)  # Copy each potential image texture to textures_temp
+                    stage_file(image_src, image_dest)  # Copy each potential image texture to textures_temp
 
         print("Created temporary textures directory")
         logging.info("Created temporary textures directory")
@@ -661,26 +1456,32 @@ def create_textures_temp(item_dir, textures_dir, textures_temp_dir):
         logging.exception("Could not create temporary textures directory")
 		
 
-# Split image texture name into components to be regexed in find_replace_pbr_tag function.
+# Split a name into components without logging it.  Memoized, so a name is only split once per batch.
 # The following code is adapted from Blender 3.5, Node Wrangler 3.43, __util.py__, Line 7
+@functools.lru_cache(maxsize=None)
+def get_name_components(string):
+    """
+    Split filename into components
+    'WallTexture_diff_2k.002.jpg' -> ('WallTexture', 'diff', '2k', '002', 'jpg')
+    """
+    # Remove file path.
+    string = Path(string).name
+
+    # Replace common separators with SPACE.
+    separators = ["_", ",", ".", "-", "__", "--", "#"]
+    for sep in separators:
+        string = string.replace(sep, " ")
+
+    return tuple(string.split(" "))
+
+
+# Split image texture name into components to be regexed in find_replace_pbr_tag function.
 def split_into_components(string):
     try:
-        """
-        Split filename into components
-        'WallTexture_diff_2k.002.jpg' -> ['WallTexture', 'diff', '2k', '002', 'jpg']
-        """
         # Get original string name for printout.
         string_original = string
 
-        # Remove file path.
-        string = Path(string).name
-        
-        # Replace common separators with SPACE.
-        separators = ["_", ",", ".", "-", "__", "--", "#"]
-        for sep in separators:
-            string = string.replace(sep, " ")
-
-        components = string.split(" ")
+        components = list(get_name_components(str(string)))
         
         print(f"Split into components: {Path(string_original).name} --> {components}")
         logging.info(f"Split into components: {Path(string_original).name} --> {components}")
@@ -691,124 +1492,178 @@ def split_into_components(string):
         logging.exception(f"Could not split into components: {Path(string_original).name} --> {components}")
 		
 
-# Regex, i.e. find and replace messy/misspelled PBR tag with clean PBR tag in a given image texture's name supplied by the regex_textures_external function.
-def find_replace_pbr_tag(texture):
+# Regex keys matching messy/misspelled PBR tags, and the clean PBR tag each is replaced with.  Keys are tried in order.
+pbr_tags = (
+    ('^basecolou?r$|^albedo$|^d?iffuse$|^d?iff$|^colou?r$|^col$', 'BaseColor'),
+    ('^subsurf.*|^sss$', 'Subsurface'),
+    ('^m?etall?ic$|^m?etalness?$|^metal$|^mtl$', 'Metallic'),
+    ('^specul.*|^spe?c$', 'Specular'),
+    ('^rou?gh$|^rou?ghn.*|^rgh$', 'Roughness'),
+    ('^gloss?y?$|^gloss?iness?$|^gls$', 'Gloss'),
+    ('^no?rma?l?$|^nor$', 'Normal'),
+    ('^bu?mp$|^bumpiness?$', 'Bump'),
+    ('^displacem?e?n?t?$|^di?sp$|^he?i?ght$|^hi?e?ght$', 'Height'),
+    ('^tra?nsmi?ss?i?o?n$', 'Transmission'),
+    ('^emiss.*|^emit$', 'Emission'),
+    ('^alpha$|^opac.*|^tra?ns?pa.*|^transpr.*', 'Opacity'),
+    ('^ambi?e?nt$|^occ?lus.*|^ambi?e?ntocc?lusion$|^ao$', 'Occlusion'),
+)
+
+# Regex keys matching messy/misspelled transparency tags in object and material names, and the clean tag each is replaced with.
+transparency_tags = (
+    ('^alpha$|^opac.*|^tra?ns?pa.*|^transpr.*|^glass$', 'transparent'),
+    ('^cutout$|^cut$|^out$', 'cutout'),
+)
+
+# Node Wrangler principled tag preferences, and the clean PBR tag of each.
+nw_pbr_tags = (
+    ('base_color', 'BaseColor'),
+    ('sss_color', 'Subsurface'),
+    ('metallic', 'Metallic'),
+    ('specular', 'Specular'),
+    ('rough', 'Roughness'),
+    ('gloss', 'Gloss'),
+    ('normal', 'Normal'),
+    ('bump', 'Bump'),
+    ('displacement', 'Height'),
+    ('transmission', 'Transmission'),
+    ('emission', 'Emission'),
+    ('alpha', 'Opacity'),
+    ('ambient_occlusion', 'Occlusion'),
+)
+
+
+# Compile a classifier of name components from a table of regex keys and tags.  The table is compiled once, and each component is classified once, so classifying the same component again is only a lookup.
+@functools.lru_cache(maxsize=None)
+def get_tag_classifier(tag_table):
+    patterns = [(re.compile(pattern, re.IGNORECASE), tag) for pattern, tag in tag_table]
+
+    @functools.lru_cache(maxsize=None)
+    def classify(component):
+        for pattern, tag in patterns:
+            if pattern.match(component):
+                return tag
+        return None
+
+    return classify
+
+
+# Tables of Node Wrangler tags read from its preferences for the current batch conversion, cleared when the next one starts.
+nw_tag_tables = {}
+
+
+# Get a table of exact-match regex keys for the tags set in Node Wrangler's preferences, e.g. custom tags added by the User.  Empty if Node Wrangler isn't enabled.  The preferences are only read once per batch conversion.
+def get_nw_tag_table(nw_tags):
+    if nw_tags in nw_tag_tables:
+        return nw_tag_tables[nw_tags]
+
     try:
-        # Set original texture name.
-        texture_original = texture
-
-        # Dictionary with regex keys will be used as the pattern by turning it into a list then to a string.
-        pbr_dict = {
-            '(?i)^basecolou?r$|^albedo$|^d?iffuse$|^d?iff$|^colou?r$|^col$': 'BaseColor',
-            '(?i)^subsurf.*|^sss$': 'Subsurface',
-            '(?i)^m?etall?ic$|^m?etalness?$|^metal$|^mtl$': 'Metallic', 
-            '(?i)^specul.*|^spe?c$': 'Specular',
-            '(?i)^rou?gh$|^rou?ghn.*|^rgh$': 'Roughness',
-            '(?i)^gloss?y?$|^gloss?iness?$|^gls$': 'Gloss',
-            '(?i)^no?rma?l?$|^nor$': 'Normal',
-            '(?i)^bu?mp$|^bumpiness?$': 'Bump',
-            '(?i)^displacem?e?n?t?$|^di?sp$|^he?i?ght$|^hi?e?ght$': 'Height',
-            '(?i)^tra?nsmi?ss?i?o?n$': 'Transmission',
-            '(?i)^emiss.*|^emit$': 'Emission',
-            '(?i)^alpha$|^opac.*|^tra?ns?pa.*|^transpr.*': 'Opacity',
-            '(?i)^ambi?e?nt$|^occ?lus.*|^ambi?e?ntocc?lusion$|^ao$': 'Occlusion'
-        }
+        principled_tags = bpy.context.preferences.addons['node_wrangler'].preferences.principled_tags
+        nw_tag_table = tuple((f"^{re.escape(word)}$", tag) for attribute, tag in nw_tags for word in getattr(principled_tags, attribute).split(' ') if word)
 
-        dictkeys_pattern = re.compile('|'.join(pbr_dict), re.IGNORECASE)
-
-        #If string is found in the pattern, match to key in the dictionary and return corresponding value.
-        texture_found = re.findall(dictkeys_pattern, texture)
-        if texture_found:
-            texture = []
-            for i in texture_found: 
-                for k, v in pbr_dict.items():
-                    if re.match(k, i, re.IGNORECASE):
-                        texture.append(v)
-            return texture
-        else:
-            texture = None
-            return texture
+    except (KeyError, AttributeError):
+        nw_tag_table = ()
+
+    nw_tag_tables[nw_tags] = nw_tag_table
+    return nw_tag_table
 
-        print(f"Found and replaced pbr tag: {texture_original} --> {texture}")
-        logging.info(f"Found and replaced pbr tag: {texture_original} --> {texture}")
+
+# Get the PBR tag classifiers: one of Transmogrifier's own regex keys, then one of the current Node Wrangler tags.  A name is only classified by Node Wrangler's tags if none of its components match Transmogrifier's own, so that broad tags like "base" don't take precedence.
+def get_pbr_tag_classifiers():
+    return (get_tag_classifier(pbr_tags), get_tag_classifier(get_nw_tag_table(nw_pbr_tags)))
+
+
+# Get the transparency tag classifiers: one of Transmogrifier's own regex keys, then one of the current Node Wrangler alpha tags.  As with PBR tags, a name is only classified by Node Wrangler's tags if none of its components match Transmogrifier's own.
+def get_transparency_tag_classifiers():
+    return (get_tag_classifier(transparency_tags), get_tag_classifier(get_nw_tag_table((('alpha', 'transparent'),))))
+
+
+# Regex, i.e. find and replace messy/misspelled PBR tag with clean PBR tag in a given image texture's name component.
+def find_replace_pbr_tag(texture):
+    try:
+        for classify in get_pbr_tag_classifiers():
+            tag = classify(texture)
+            if tag:
+                return [tag]
+        return None
 
     except Exception as Argument:
-        logging.exception(f"Could not find and replace pbr tag: {texture_original} --> {texture}")
+        logging.exception(f"Could not find and replace pbr tag: {texture}")
 		
 
-# Regex, i.e. find and replace messy/misspelled transparency tag with clean PBR tag in a given object's name supplied by the regex_transparent_objects function.
+# Regex, i.e. find and replace messy/misspelled transparency tag with clean PBR tag in a given object's name component.
 def find_replace_transparency_tag(mesh_object):
     try:
-        # Set original mesh_object name.
-        mesh_object_original = mesh_object
+        for classify in get_transparency_tag_classifiers():
+            tag = classify(mesh_object)
+            if tag:
+                return [tag]
+        return None
 
-        # Dictionary with regex keys will be used as the pattern by turning it into a list then to a string.
-        pbr_dict = {
-            '(?i)^alpha$|^opac.*|^tra?ns?pa.*|^transpr.*|^glass$': 'transparent',
-            '(?i)^cutout$|^cut$|^out$': 'cutout',
-        }
+    except Exception as Argument:
+        logging.exception(f"Could not find and replace transparency tag: {mesh_object}")
 
-        dictkeys_pattern = re.compile('|'.join(pbr_dict), re.IGNORECASE)
-
-        #If string is found in the pattern, match to key in the dictionary and return corresponding value.
-        mesh_object_found = re.findall(dictkeys_pattern, mesh_object)
-        if mesh_object_found:
-            mesh_object = []
-            for i in mesh_object_found: 
-                for k, v in pbr_dict.items():
-                    if re.match(k, i, re.IGNORECASE):
-                        mesh_object.append(v)
-            return mesh_object
-        else:
-            mesh_object = None
-            return mesh_object
 
-        print(f"Found and replaced transparency tag: {mesh_object_original} --> {mesh_object}")
-        logging.info(f"Found and replaced transparency tag: {mesh_object_original} --> {mesh_object}")
+# Replace the first messy/misspelled PBR tag among a texture name's components (not its extension) with its clean PBR tag.  A component right after it that means the same thing is dropped, e.g. "Ambient_Occlusion" becomes "Occlusion".
+def replace_pbr_tag(components, classifiers):
+    components = list(components)
+    for classify in classifiers:
+        for tag_index, component in enumerate(components[:-1]):
+            pbr_tag = classify(component)
+            if pbr_tag is None:
+                continue
+
+            components[tag_index] = pbr_tag
+            if pbr_tag == "BaseColor" and tag_index > 0 and components[tag_index-1].lower() == "base":
+                components.pop(tag_index-1)  # Was getting "...base_BaseColor..." when original name was "base_color"
+            elif tag_index + 2 < len(components) and classify(components[tag_index+1]) == pbr_tag:
+                components.pop(tag_index+1)  # Was getting "...Ambient_Occlusion_Occlusion..." when original name was "Ambient_Occlusion"
+            return components
+
+    return components
+
+
+# Replace every messy/misspelled transparency tag among an object or material name's components with its clean tag, using the first classifier that matches any of them.
+def replace_transparency_tags(components, classifiers):
+    for classify in classifiers:
+        tags = [classify(component) for component in components]
+        if any(tags):
+            return [tag or component for tag, component in zip(tags, components)]
+
+    return list(components)
+
+
+# Classify a whole listing of texture file names at once, and get the clean name of each texture whose name has a messy/misspelled PBR tag.
+def classify_texture_names(names, classifiers):
+    try:
+        names_renamed = {}
+        for name in names:
+            components = get_name_components(name)
+            components_renamed = replace_pbr_tag(components, classifiers)
+            if components_renamed != list(components):
+                names_renamed[name] = '_'.join(components_renamed[:-1]) + '.' + components_renamed[-1]
+
+        return names_renamed
 
     except Exception as Argument:
-        logging.exception(f"Could not find and replaced transparency tag: {mesh_object_original} --> {mesh_object}")
+        logging.exception("Could not classify texture names")
+        return {}
 
 
 # Find and rename image textures from a dictionary with regex keys.
 def regex_textures_external(textures_temp_dir):
     try:
+        classifiers = get_pbr_tag_classifiers()
+        renamed_count = 0
         for subdir, dirs, files in os.walk(textures_temp_dir):
-            for file in files:
-                file = Path(subdir, file)
-                texture = file
-                texture_path = Path(texture).parent.resolve()
-                components_original = split_into_components(texture)
-                components = split_into_components(texture)
-
-                for component in components:
-                    pbr_tag_renamed = find_replace_pbr_tag(component)
-                    if pbr_tag_renamed != None:
-                        pbr_tag_renamed = pbr_tag_renamed[0]
-                        print(f"Found a match for {pbr_tag_renamed}")
-                        logging.info(f"Found a match for {pbr_tag_renamed}")
-                        tag_index = components.index(component)
-                        components[tag_index] = pbr_tag_renamed
-                        if pbr_tag_renamed == "BaseColor" and components[tag_index-1].lower() == "base":
-                            components.pop(tag_index-1)  # Was getting "...base_BaseColor..." when original name was "base_color"
-                        elif pbr_tag_renamed == "Occlusion" and components[tag_index-1].lower() == "occlusion":
-                            components.pop(tag_index+1)  # Was getting "...Ambient_Occlusion_Occlusion..." when original name was "Ambient_Occlusion"
-                        break
-
-                if components_original != components:
-                    texture = Path(texture_path, texture)
-                    texture_renamed = '_'.join(components[:-1])
-                    texture_renamed = Path(texture_path, texture_renamed + '.' + components[-1])
-                    print(f"Renamed texture: {Path(texture).name} --> {Path(texture_renamed).name}")
-                    logging.info(f"Renamed texture: {Path(texture).name} --> {Path(texture_renamed).name}")
-                    Path(texture).rename(texture_renamed)
-                        
-                else:
-                    print("No PBR match found for current texture.")
-                    logging.info("No PBR match found for current texture.")
+            for name, name_renamed in classify_texture_names(files, classifiers).items():
+                print(f"Renamed texture: {name} --> {name_renamed}")
+                logging.info(f"Renamed texture: {name} --> {name_renamed}")
+                Path(subdir, name).rename(Path(subdir, name_renamed))
+                renamed_count += 1
 
-        print("Regexed external textures")
-        logging.info("Regexed external textures")
+        print(f"Regexed external textures: {renamed_count} renamed")
+        logging.info(f"Regexed external textures: {renamed_count} renamed")
 
     except Exception as Argument:
         logging.exception("Could not regex external textures")
@@ -817,31 +1672,18 @@ def regex_textures_external(textures_temp_dir):
 # Find and rename image textures from a dictionary with regex keys.
 def regex_textures_packed():
     try:
+        # Classify packed textures the same way as external textures, so that both get the same clean names.
+        classifiers = get_pbr_tag_classifiers()
         for texture in bpy.data.images:
             texture_name = texture.name
-            components_original = split_into_components(texture_name)
-            components = split_into_components(texture_name)
-
-            for component in components:
-                pbr_tag_renamed = find_replace_pbr_tag(component)
-                if pbr_tag_renamed != None:
-                    pbr_tag_renamed = pbr_tag_renamed[0]
-                    print(f"Found a match for {pbr_tag_renamed}")
-                    logging.info(f"Found a match for {pbr_tag_renamed}")
-                    tag_index = components.index(component)
-                    if pbr_tag_renamed == "Opacity" and len(components) - tag_index != -2:  # Don't rename any transparency string if it's not at the end of the texture name.
-                        continue
-                    components[tag_index] = pbr_tag_renamed
-                    if pbr_tag_renamed == "BaseColor" and components[tag_index-1].lower() == "base":
-                        components.pop(tag_index-1)  # Was getting "...base_BaseColor..." when original name was "base_color"
-                    elif pbr_tag_renamed == "Occlusion" and components[tag_index+1].lower() == "occlusion":
-                        components.pop(tag_index+1)  # Was getting "...Ambient_Occlusion_Occlusion..." when original name was "Ambient_Occlusion"
+            components_original = list(get_name_components(texture_name))
+            components = replace_pbr_tag(components_original, classifiers)
 
             if components_original != components:
                 texture_renamed = '_'.join(components[:-1])
                 texture.name = texture_renamed
-                print(f"Renamed texture: {Path(texture).name} --> {Path(texture_renamed).name}")
-                logging.info(f"Renamed texture: {Path(texture).name} --> {Path(texture_renamed).name}")
+                print(f"Renamed texture: {texture_name} --> {texture_renamed}")
+                logging.info(f"Renamed texture: {texture_name} --> {texture_renamed}")
                         
             else:
                 print("No PBR match found for current texture.")
@@ -857,20 +1699,12 @@ def regex_textures_packed():
 # Find and rename transparent objects that have mispellings of transparency with regex keys.
 def regex_transparent_objects():
     try:
+        classifiers = get_transparency_tag_classifiers()
         objects = bpy.context.selected_objects
         for object in objects:
             object_name = object.name
-            components_original = split_into_components(object_name)
-            components = split_into_components(object_name)
-
-            for component in components:
-                transparency_tag_renamed = find_replace_transparency_tag(component)
-                if transparency_tag_renamed != None:
-                    transparency_tag_renamed = transparency_tag_renamed[0]
-                    print(f"Found a match for {transparency_tag_renamed}")
-                    logging.info(f"Found a match for {transparency_tag_renamed}")
-                    tag_index = components.index(component)
-                    components[tag_index] = transparency_tag_renamed
+            components_original = list(get_name_components(object_name))
+            components = replace_transparency_tags(components_original, classifiers)
 
             if components_original != components:
                 object_renamed = '_'.join(components)
@@ -889,91 +1723,88 @@ def regex_transparent_objects():
         logging.exception("Could not regex transparent objects")
 		
 
-# Determine if current item_name has multiple texture sets present in textures_temp_dir. If so, loop through each texture set and create a material from the image textures in that set.
-def create_materials(item_name, textures_temp_dir):
+# Index the texture sets in textures_temp_dir with a single pass over the directory, so that creating, assigning and reimporting materials never has to list it again.
+# Maps each texture set's name (also its material's name) to its directory, its image textures, the Principled BSDF socket each texture maps to, and whether it has an opacity map.
+def get_texture_set_index(item_name, textures_temp_dir):
     try:
         image_ext = supported_image_ext()  # Get a list of image extensions that could be used as textures
 
-        # Check if textures are stored in subdirectories.
-        # Check if there are subdirectories.
-        texture_set_dir_list = next(os.walk(textures_temp_dir))[1]
-
-        # Check if there are images in subdirectories or if these folders are used for other purposes.
-        if texture_set_dir_list:
-            for texture_set_dir in texture_set_dir_list:
-                texture_set_dir = Path(textures_temp_dir, texture_set_dir)
-                textures_in_subdirs = [texture.name for texture in Path.iterdir(texture_set_dir) if texture.name.lower().endswith(image_ext)]
-            # If there are images stored in subdirectories, assume all texture sets are organized in subdirectories and use these to create materials.
-            if textures_in_subdirs:
-                for texture_set_dir in texture_set_dir_list:
-                    texture_set_dir = Path(textures_temp_dir, texture_set_dir)
-                    texture_set = Path(texture_set_dir).name # Get the subdirectory's name, which will be used as the material name.
-                    # Add texture set prefix to images based on texture set directory name.
-                    for texture in Path.iterdir(texture_set_dir):
-                        texture_path = Path(texture_set_dir, texture)
-                        texture_renamed = texture_set + "_" + texture.name
-                        texture_renamed_path = Path(texture_set_dir, texture_renamed)
-                        if not texture.name.startswith(texture_set) and texture_set != "textures_temp":  # If all textures exist directly in textures_temp_dir, don't add that directory name as a prefix.
-                            Path(texture_path).rename(texture_renamed_path)
-                        else:
-                            continue
-                    textures = [texture.name for texture in Path.iterdir(texture_set_dir)]
+        textures_list = []
+        textures_in_subdirs = {}
+        with os.scandir(textures_temp_dir) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    with os.scandir(entry.path) as subdir_entries:
+                        textures_in_subdirs[entry.name] = sorted(subdir_entry.name for subdir_entry in subdir_entries if subdir_entry.is_file() and subdir_entry.name.lower().endswith(image_ext))
+                elif entry.name.lower().endswith(image_ext):
+                    textures_list.append(entry.name)
+        textures_list.sort()
+
+        index = {}
+        # If there are images stored in subdirectories, assume all texture sets are organized in subdirectories, named by the subdirectories.
+        if any(textures_in_subdirs.values()):
+            for texture_set, textures in sorted(textures_in_subdirs.items()):
+                if textures:
+                    index[texture_set] = index_texture_set(Path(textures_temp_dir, texture_set), textures)
+
+        # If there is more than one BaseColor image directly in textures_temp_dir, assume that there are multiple texture sets, named by the textures' prefixes.
+        elif sum("BaseColor" in texture for texture in textures_list) > 1:
+            for texture_set in dict.fromkeys(texture.split('_')[0] for texture in textures_list):
+                index[texture_set] = index_texture_set(Path(textures_temp_dir), [texture for texture in textures_list if texture.startswith(texture_set)])
+
+        # Otherwise assume there is only one texture set, named after the item.
+        elif textures_list:
+            index[item_name] = index_texture_set(Path(textures_temp_dir), textures_list)
+
+        return index
+
+    except Exception as Argument:
+        logging.exception(f"Could not index texture sets: {Path(textures_temp_dir).name}")
+        return {}
+
+
+# Index one texture set from the names of its image textures.
+def index_texture_set(texture_set_dir, textures):
+    maps = {socketname: Path(texture_set_dir, texture) for socketname, texture in match_textures_to_sockets(textures).items()}
+    return {
+        "directory": Path(texture_set_dir),
+        "textures": list(textures),
+        "maps": maps,
+        "opacity": "Alpha" in maps,
+    }
+
+
+# Determine if current item_name has multiple texture sets present in textures_temp_dir. If so, loop through each texture set and create a material from the image textures in that set.
+def create_materials(item_name, textures_temp_dir):
+    global texture_set_index
+    try:
+        texture_set_index = get_texture_set_index(item_name, textures_temp_dir)
 
-                    create_a_material(item_name=texture_set, textures_temp_dir=texture_set_dir, textures=textures)  # Parameters are temporarily reassigned in order that the create_a_material function can be reused.
-            
-            # If there are no subdirectories containing images, then determine how many texture sets exists in textures_temp directory.
-            elif not textures_in_subdirs:
-                textures_list = [image.name for image in Path.iterdir(textures_temp_dir) if image.name.lower().endswith(image_ext)]
-                basecolor_count = 0
-                # Count how many times the regexed "BaseColor" string occurs in the list of images.
-                for texture in textures_list:
-                    if "BaseColor" in texture:
-                        basecolor_count += 1
-                # If there is more than one BaseColor image, assume that there are multiple texture sets.
-                if basecolor_count > 1:
-                    texture_sets = list(set([image.split('_')[0] for image in textures_list]))
-                    print(f"Detected {basecolor_count} texture sets: {texture_sets}")
-                    logging.info(f"Detected {basecolor_count} texture sets: {texture_sets}")
-                    for texture_set in texture_sets:
-                        textures = [texture for texture in textures_list if texture.startswith(texture_set)]
-                        create_a_material(item_name=texture_set, textures_temp_dir=textures_temp_dir, textures=textures)
-                # If there are less than or equal to 6 images in textures_temp, assume there is only one texture set.
-                elif basecolor_count <= 1:
-                    print(f"Detected {basecolor_count} texture set")
-                    logging.info(f"Detected {basecolor_count} texture set")
-                    textures = textures_list
-
-                    create_a_material(item_name, textures_temp_dir, textures)
-
-        # If there are no subdirectories containing images, then determine how many texture sets exists in textures_temp directory.
-        elif not texture_set_dir_list:
-            textures_list = [image.name for image in Path.iterdir(textures_temp_dir) if image.name.lower().endswith(image_ext)]
-            basecolor_count = 0
-            # Count how many times the regexed "BaseColor" string occurs in the list of images.
-            for texture in textures_list:
-                if "BaseColor" in texture:
-                    basecolor_count += 1
-            # If there is more than one BaseColor image, assume that there are multiple texture sets.
-            if basecolor_count > 1:
-                texture_sets = list(set([image.split('_')[0] for image in textures_list]))
-                print(f"Detected {basecolor_count} texture sets: {texture_sets}")
-                logging.info(f"Detected {basecolor_count} texture sets: {texture_sets}")
-                for texture_set in texture_sets:
-                    textures = [texture for texture in textures_list if texture.startswith(texture_set)]
-                    create_a_material(item_name=texture_set, textures_temp_dir=textures_temp_dir, textures=textures)
-            # If there are less than or equal to 6 images in textures_temp, assume there is only one texture set.
-            elif basecolor_count <= 1:
-                print(f"Detected {basecolor_count} texture set")
-                logging.info(f"Detected {basecolor_count} texture set")
-                textures = textures_list
-
-                create_a_material(item_name, textures_temp_dir, textures)
-        
         # If there are no textures, print a message.
-        else:
+        if not texture_set_index:
             print("No textures were found.")
             logging.info("No textures were found.")
-                
+
+        else:
+            print(f"Detected {len(texture_set_index)} texture set(s): {list(texture_set_index)}")
+            logging.info(f"Detected {len(texture_set_index)} texture set(s): {list(texture_set_index)}")
+
+        for texture_set, texture_set_entry in texture_set_index.items():
+            texture_set_dir = texture_set_entry["directory"]
+
+            # Add texture set prefix to images based on texture set directory name.
+            if texture_set_dir != Path(textures_temp_dir) and texture_set != "textures_temp":  # If all textures exist directly in textures_temp_dir, don't add that directory name as a prefix.
+                textures_renamed = []
+                for texture in texture_set_entry["textures"]:
+                    if not texture.startswith(texture_set):
+                        texture_renamed = texture_set + "_" + texture
+                        Path(texture_set_dir, texture).rename(Path(texture_set_dir, texture_renamed))
+                        texture = texture_renamed
+                    textures_renamed.append(texture)
+                texture_set_index[texture_set] = texture_set_entry = index_texture_set(texture_set_dir, textures_renamed)
+
+            create_a_material(item_name=texture_set, textures_temp_dir=texture_set_dir, textures=texture_set_entry["textures"])  # Parameters are temporarily reassigned in order that the create_a_material function can be reused.
+
         print("Created materials")
         logging.info("Created materials")
 
@@ -981,61 +1812,152 @@ def create_materials(item_name, textures_temp_dir):
         logging.exception("Could not create materials")
 		
 
-# Add principled setup with Node Wrangler.
+# Add principled setup the way Node Wrangler's "Add Principled Setup" does, but by building the node tree directly rather than running the operator in a Node Editor, so that it's faster and works without a user interface.
 def add_principled_setup(material, textures_temp_dir, textures):
     try:
-        # Select shader before importing textures.
+        build_principled_setup(material, textures_temp_dir, textures)
+
+    except Exception as Argument:
+        logging.exception(f"Could not Add Principled Setup for {material.name}")
+
+
+# Split image texture name into lowercase tags the same way Node Wrangler does when matching textures to sockets.
+# The following code is adapted from Blender 3.5, Node Wrangler 3.43, __util.py__, Line 7
+def split_into_tags(texture):
+    try:
+        # Remove extension and digits, then separate CamelCase by space.
+        string = Path(texture).stem
+        string = "".join(character for character in string if not character.isdigit())
+        string = re.sub(r"([a-z])([A-Z])", r"\g<1> \g<2>", string)
+        
+        # Replace common separators with SPACE.
+        separators = ["_", ".", "-", "__", "--", "#"]
+        for sep in separators:
+            string = string.replace(sep, " ")
+
+        return [component.lower() for component in string.split(" ") if component]
+
+    except Exception as Argument:
+        logging.exception(f"Could not split into tags: {texture}")
+
+
+# Get the Principled BSDF input for a socket name, allowing for inputs renamed in newer versions of Blender (e.g. "Specular" --> "Specular IOR Level").
+def get_principled_input(principled, socketname):
+    try:
+        for input_name in [socketname, f"{socketname} Weight", f"{socketname} Color", f"{socketname} IOR Level"]:
+            if input_name in principled.inputs:
+                return principled.inputs[input_name]
+
+    except Exception as Argument:
+        logging.exception(f"Could not get Principled BSDF input: {socketname}")
+
+
+# Get the Principled BSDF socket names and the set of lowercase tags of each from Node Wrangler Preferences, in Node Wrangler's order.
+def get_nw_socket_tags():
+    return {socketname: set(tag.lower() for tag in socket_tags if tag) for socketname, socket_tags, _ in get_nw_socketnames()}
+
+
+# Match image textures to Principled BSDF sockets the way Node Wrangler does: each socket gets the first texture with one of that socket's tags.
+def match_textures_to_sockets(textures):
+    try:
+        matched_textures = {}
+        for socketname, socket_tags in get_nw_socket_tags().items():
+            for texture in textures:
+                if texture == '.DS_Store' or texture in matched_textures.values():
+                    continue
+                if socket_tags.intersection(split_into_tags(texture)):
+                    matched_textures[socketname] = texture
+                    break
+
+        return matched_textures
+
+    except Exception as Argument:
+        logging.exception("Could not match textures to sockets")
+        return {}
+
+
+# Add principled setup by adding and linking nodes directly in the material's node tree, matching textures to sockets with Node Wrangler's tags.
+def build_principled_setup(material, textures_temp_dir, textures):
+    try:
         material.use_nodes = True
-        tree = material.node_tree
-        nodes = tree.nodes
+        nodes = material.node_tree.nodes
+        links = material.node_tree.links
+        principled = nodes.get("Principled BSDF")
+        output = nodes.get("Material Output")
 
-        # Make sure the Principled BSDF shader is selected.
-        material.node_tree.nodes['Material Output'].select = False
-        material.node_tree.nodes['Principled BSDF'].select = True
-        material.node_tree.nodes.active = material.node_tree.nodes.get("Principled BSDF")
+        tags = get_nw_principled_tags()
+        bump_tags = set(tags.bump.lower().split(' '))
+        gloss_tags = set(tags.gloss.lower().split(' '))
+
+        matched_textures = match_textures_to_sockets(textures)
 
         # Log the textures to be used for this material.
         print("Textures for " + str(material.name) + ": " + str(textures))
         logging.info("Textures for " + str(material.name) + ": " + str(textures))
 
-        # Get context.
-        win = bpy.context.window
-        scr = win.screen
-        areas = [area for area in scr.areas if area.type == 'NODE_EDITOR']
-        areas[0].spaces.active.node_tree = material.node_tree
-        override = override_context('NODE_EDITOR', 'WINDOW')
-        
-        # Get textures to import.
-        files = []
-        for texture in textures:
-            if texture == '.DS_Store':
-                continue
+        # Share one Texture Coordinate and Mapping node between all image textures.
+        texture_coordinate = nodes.new("ShaderNodeTexCoord")
+        texture_coordinate.location = (principled.location.x - 1300, principled.location.y)
+        mapping = nodes.new("ShaderNodeMapping")
+        mapping.location = (principled.location.x - 1100, principled.location.y)
+        links.new(texture_coordinate.outputs["UV"], mapping.inputs["Vector"])
+
+        for index, (socketname, texture) in enumerate(matched_textures.items()):
+            # Add image texture.
+            image_texture = nodes.new("ShaderNodeTexImage")
+            image_texture.location = (principled.location.x - 800, principled.location.y - 300 * index)
+            image_texture.image = bpy.data.images.load(str(Path(textures_temp_dir, texture)), check_existing=True)
+
+            # Path images relative to the blend file like Node Wrangler's "relative_path" option, so that saved blend files can be moved with their textures.
+            if bpy.data.filepath:
+                try:
+                    image_texture.image.filepath = bpy.path.relpath(image_texture.image.filepath)
+                except ValueError:
+                    pass  # E.g. the texture is on another drive than the blend file on Windows.
+            links.new(mapping.outputs["Vector"], image_texture.inputs["Vector"])
+            
+            # Only color maps are in sRGB.
+            if socketname not in ["Base Color", "Subsurface Color", "Emission"]:
+                image_texture.image.colorspace_settings.is_data = True
 
-            files.append(
-                {
-                    "name": texture,
-                    "name": texture
-                }
-            )
+            texture_tags = set(split_into_tags(texture))
             
-        filepath = str(textures_temp_dir) + '/'
-        directory = str(textures_temp_dir) + '/'
-        relative_path = True
-        
-        # Add principled setup.
-        with bpy.context.temp_override(**override):
-            bpy.ops.node.nw_add_textures_for_principled(
-                filepath=filepath,
-                directory=directory,
-                files=files,
-                relative_path=relative_path
-            )
-        
-        print(f"Added Principled Setup for {material.name}")
-        logging.info(f"Added Principled Setup for {material.name}")
-    
+            # Link through a Displacement node.
+            if socketname == "Displacement":
+                displacement = nodes.new("ShaderNodeDisplacement")
+                displacement.location = (principled.location.x + 100, principled.location.y - 700)
+                links.new(image_texture.outputs["Color"], displacement.inputs["Height"])
+                links.new(displacement.outputs["Displacement"], output.inputs["Displacement"])
+            
+            # Link through a Bump node for bump maps or a Normal Map node for normal maps.
+            elif socketname == "Normal":
+                if bump_tags.intersection(texture_tags):
+                    normal = nodes.new("ShaderNodeBump")
+                    links.new(image_texture.outputs["Color"], normal.inputs["Height"])
+                else:
+                    normal = nodes.new("ShaderNodeNormalMap")
+                    links.new(image_texture.outputs["Color"], normal.inputs["Color"])
+                normal.location = (principled.location.x - 250, image_texture.location.y)
+                links.new(normal.outputs["Normal"], principled.inputs["Normal"])
+            
+            # Link through an Invert node for gloss maps.
+            elif socketname == "Roughness" and gloss_tags.intersection(texture_tags):
+                invert = nodes.new("ShaderNodeInvert")
+                invert.location = (principled.location.x - 250, image_texture.location.y)
+                links.new(image_texture.outputs["Color"], invert.inputs["Color"])
+                links.new(invert.outputs["Color"], principled.inputs["Roughness"])
+            
+            # Link directly to the Principled BSDF.
+            else:
+                principled_input = get_principled_input(principled, socketname)
+                if principled_input is not None:
+                    links.new(image_texture.outputs["Color"], principled_input)
+
+        print(f"Built Principled Setup for {material.name}")
+        logging.info(f"Built Principled Setup for {material.name}")
+
     except Exception as Argument:
-        logging.exception(f"Could not Add Principled Setup for {material.name}")
+        logging.exception(f"Could not build Principled Setup for {material.name}")
 
 
 # Add materials, import textures, and assign materials to objects.
@@ -1073,11 +1995,38 @@ def create_a_material(item_name, textures_temp_dir, textures):
         logging.exception(f"Could not create a material: {item_name}")
 		
 
-# Get alpha tags from Node Wrangler Preferences to use for checking if an object's indicates that it should be assigned a transparent material.
-def get_nw_alpha_tags():
+# Node Wrangler's default principled tags, for building materials the same way when Node Wrangler isn't enabled.
+nw_default_principled_tags = {
+    "base_color": "diffuse diff albedo base col color basecolor",
+    "sss_color": "sss subsurface",
+    "metallic": "metallic metalness metal mtl",
+    "specular": "specularity specular spec spc",
+    "normal": "normal nor nrm nrml norm",
+    "bump": "bump bmp",
+    "rough": "roughness rough rgh",
+    "gloss": "gloss glossy glossiness",
+    "displacement": "displacement displace disp dsp height heightmap",
+    "transmission": "transmission transparency",
+    "emission": "emission emissive emit",
+    "alpha": "alpha opacity",
+    "ambient_occlusion": "ao ambient occlusion",
+}
+
+
+# Get the principled tags from Node Wrangler Preferences, or Node Wrangler's default tags if it isn't enabled.
+def get_nw_principled_tags():
+    try:
+        return bpy.context.preferences.addons['node_wrangler'].preferences.principled_tags
+
+    except (KeyError, AttributeError):
+        return types.SimpleNamespace(**nw_default_principled_tags)
+
+
+# Get the Principled BSDF socket names and their tags from Node Wrangler Preferences.
+def get_nw_socketnames():
     try:
         # The following code is adapted from Blender 3.5, Node Wrangler 3.43, __init.py__, Line 2725
-        tags = bpy.context.preferences.addons['node_wrangler'].preferences.principled_tags
+        tags = get_nw_principled_tags()
 
         normal_abbr = tags.normal.split(' ')
         bump_abbr = tags.bump.split(' ')
@@ -1097,6 +2046,17 @@ def get_nw_alpha_tags():
             ['Ambient Occlusion', tags.ambient_occlusion.split(' '), None],
         ]
 
+        return socketnames
+
+    except Exception as Argument:
+        logging.exception("Could not get Node Wrangler socket names")
+
+
+# Get alpha tags from Node Wrangler Preferences to use for checking if an object's indicates that it should be assigned a transparent material.
+def get_nw_alpha_tags():
+    try:
+        socketnames = get_nw_socketnames()
+
         alpha_tags = tuple(socketnames[9][1])  # Get a tuple of only the alpha tags.
 
         return alpha_tags
@@ -1116,20 +2076,33 @@ def assign_materials(item_name):
         for object in bpy.context.selected_objects: # Loop only through selected MESH type objects.
             object_count += 1
 
-        # Determine how many texture sets were imported.
-        material_count = 0
-        for material in bpy.data.materials:
-            material_count += 1
-
         # Assuming object names have been regexed for transparency tags, assign the transparency regex dictionary value to variable.
         transparency_tag = "transparent"
         cutout_tag = "cutout"
-        # Test for presence of transparent versions of opaque materials.
-        transparent_materials = [material.name for material in bpy.data.materials if transparency_tag in material.name and material.name.replace("_" + transparency_tag, "") in bpy.data.materials]
+
+        # Get the materials created from each indexed texture set, and the transparent versions of those with an opacity map.
+        materials = []
+        transparent_materials = []
+        for texture_set, texture_set_entry in texture_set_index.items():
+            if texture_set in bpy.data.materials:
+                materials.append(bpy.data.materials[texture_set])
+            material_transparent_name = f"{texture_set}_{transparency_tag}"
+            if texture_set_entry["opacity"] and material_transparent_name in bpy.data.materials:
+                materials.append(bpy.data.materials[material_transparent_name])
+                if texture_set in bpy.data.materials:
+                    transparent_materials.append(material_transparent_name)
+
+        # If materials weren't created from indexed texture sets, test for presence of transparent versions of opaque materials.
+        if not materials:
+            materials = list(bpy.data.materials)
+            transparent_materials = [material.name for material in materials if transparency_tag in material.name and material.name.replace("_" + transparency_tag, "") in bpy.data.materials]
+
+        # Determine how many texture sets were imported.
+        material_count = len(materials)
 
         # Only one texture set was imported (one opaque or one transparent material)
         if material_count == 1:
-            material = bpy.data.materials[0]
+            material = materials[0]
             material_name = str(material.name) # Get the material's name from that material's data block list.
             for object in bpy.context.selected_objects: # Loop only through selected MESH type objects.
                 if object.type == 'MESH':
@@ -1139,7 +2112,7 @@ def assign_materials(item_name):
 
         # Only one texture set was imported (one opaque material, one transparent version/copy of that opaque material).
         elif material_count == 2 and transparent_materials:
-            for material in bpy.data.materials:
+            for material in materials:
                 material_name = str(material.name) # Get the material's name from that material's data block list.
                 for object in bpy.context.selected_objects: # Loop only through selected MESH type objects.
                     if object.type == 'MESH' and material_name.replace("_" + transparency_tag, "") == item_name: # Ignore the "_transparent" suffix of the transparent material.
@@ -1163,7 +2136,7 @@ def assign_materials(item_name):
 
         # More than one texture set was imported.
         elif material_count >= 2:
-            for material in bpy.data.materials:
+            for material in materials:
                 material_name = str(material.name) # Get the material's name from that material's data block list.
                 for object in bpy.context.selected_objects:
                     if object.type == 'MESH': # Loop only through selected MESH type objects.
@@ -1192,18 +2165,169 @@ def assign_materials(item_name):
         logging.exception("Could not assign materials to objects")
 		
 
+# Get the directory of the texture cache, shared by every batch conversion and worker.  Unless the settings name a directory, it's kept in Transmogrifier's directory of the User's Blender configuration, where it survives updating or reinstalling the add-on.
+def get_texture_cache_dir():
+    if texture_cache_dir:
+        return Path(bpy.path.abspath(texture_cache_dir)).resolve()
+
+    return Path(bpy.utils.user_resource('CONFIG', path="transmogrifier"), "Texture_Cache")
+
+
+# Get the file in the texture cache of a texture modified with the given parameters.  It's named by a hash of the texture's contents and every parameter that changes the result, so the same texture modified the same way is found again whichever item or batch conversion it comes from.
+def get_texture_cache_file(image_file, suffix, *parameters):
+    try:
+        image_file = Path(image_file)
+        if not use_texture_cache or not image_file.is_file():
+            return None
+
+        stat = image_file.stat()
+        key = json.dumps([hash_file(str(image_file), stat.st_size, stat.st_mtime_ns)] + list(parameters), default=str)
+
+        return get_texture_cache_dir() / f"{hashlib.sha256(key.encode()).hexdigest()}{suffix}"
+
+    except Exception as Argument:
+        logging.exception(f"Could not get texture cache file: {Path(image_file).name}")
+
+
+# Put a texture from the texture cache in place of the given file.  Returns whether the texture was in the cache.
+def fetch_cached_texture(cache_file, image_file):
+    try:
+        if cache_file is None:
+            return False
+
+        if not cache_file.is_file():
+            texture_cache_stats["misses"] += 1
+            return False
+
+        Path(image_file).unlink(missing_ok=True)
+        stage_file(cache_file, image_file)
+
+        # Mark the cached texture as recently used so that it's evicted last.
+        os.utime(cache_file)
+        texture_cache_stats["hits"] += 1
+
+        print(f"Fetched cached texture: {Path(image_file).name}")
+        logging.info(f"Fetched cached texture: {Path(image_file).name}")
+
+        return True
+
+    except Exception as Argument:
+        logging.exception(f"Could not fetch cached texture: {Path(image_file).name}")
+        return False
+
+
+# Add a modified texture to the texture cache.  The texture is written under a temporary name first so that other workers never read a partially written texture.
+def store_cached_texture(image_file, cache_file):
+    global texture_cache_bytes
+    try:
+        if cache_file is None or not Path(image_file).is_file():
+            return
+
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file_temp = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        shutil.copy(image_file, cache_file_temp)
+        os.replace(cache_file_temp, cache_file)
+
+        # Only list the cache again once it might have grown past its size limit.
+        if texture_cache_bytes is not None:
+            texture_cache_bytes += cache_file.stat().st_size
+        if texture_cache_bytes is None or texture_cache_bytes > texture_cache_size * 1024 ** 3:
+            evict_texture_cache()
+
+    except Exception as Argument:
+        logging.exception(f"Could not store cached texture: {Path(image_file).name}")
+
+
+# Delete the least recently used textures from the texture cache until it fits its size limit.
+def evict_texture_cache():
+    global texture_cache_bytes
+    try:
+        cache_files = []
+        with os.scandir(get_texture_cache_dir()) as entries:
+            for entry in entries:
+                if entry.is_file() and not entry.name.endswith(".tmp"):
+                    stat = entry.stat()
+                    cache_files.append((stat.st_mtime, stat.st_size, entry.path))
+
+        texture_cache_bytes = sum(size for mtime, size, path in cache_files)
+        evicted_count = 0
+        for mtime, size, path in sorted(cache_files):
+            if texture_cache_bytes <= texture_cache_size * 1024 ** 3:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            texture_cache_bytes -= size
+            evicted_count += 1
+
+        if evicted_count:
+            print(f"Evicted cached textures: {evicted_count}")
+            logging.info(f"Evicted cached textures: {evicted_count}")
+
+    except Exception as Argument:
+        logging.exception("Could not evict cached textures")
+
+
+# Read the header of an image file.  Cached by the file's size and modification time, so each version of a file is only read once for the rest of the batch.
+@functools.lru_cache(maxsize=None)
+def read_image_file_header(file, size, mtime_ns):
+    with open(file, 'rb') as openfile:
+        return read_image_header(openfile, Path(file).suffix)
+
+
+# Get the width, height, channel count and bit depth of an image from the header of its file or packed data, so that Blender doesn't have to load and decode the whole image to know them.  Returns None if the header can't be read.
+def get_image_header(image):
+    try:
+        if image.packed_file:
+            return read_image_header(io.BytesIO(image.packed_file.data), Path(image.filepath).suffix)
+
+        image_file = Path(bpy.path.abspath(image.filepath))
+        stat = image_file.stat()
+        return read_image_file_header(str(image_file), stat.st_size, stat.st_mtime_ns)
+
+    except (OSError, ValueError):
+        return None
+
+
+# Get the width and height of an image.  Images that Blender hasn't loaded yet are measured from their header instead of being loaded.
+def get_image_size(image):
+    try:
+        if not image.has_data:
+            image_header = get_image_header(image)
+            if image_header:
+                return image_header["width"], image_header["height"]
+
+        return tuple(image.size)
+
+    except Exception as Argument:
+        logging.exception(f"Could not get image size: {image.name}")
+        return tuple(image.size)
+
+
 # Resize image textures in textures_temp folder before export.
-def resize_textures(texture_map, texture_resolution, resize_all):
+def resize_textures(texture_map, texture_resolution, resize_all, skip_images=set()):
     try:
         for image in bpy.data.images:
             try:
+                if image.name in skip_images:
+                    continue
                 if texture_map in image.name or resize_all:
-                    width, height = image.size
+                    width, height = get_image_size(image)
                     if texture_resolution < width:
-                        image.scale(texture_resolution, texture_resolution) # (width, height)
-                        image.save()
+                        # Reuse the same texture resized the same way before if it's in the texture cache.
+                        image_file = Path(bpy.path.abspath(image.filepath))
+                        cache_file = get_texture_cache_file(image_file, image_file.suffix, "Resize", texture_resolution, image.colorspace_settings.name)
+                        if fetch_cached_texture(cache_file, image_file):
+                            image.reload()
+                        else:
+                            image.scale(texture_resolution, texture_resolution) # (width, height)
+                            unshare_staged_file(image_file)
+                            image.save()
+                            store_cached_texture(image_file, cache_file)
                         print(f"Resized Image ({image.name}): {width, height} --> {texture_resolution, texture_resolution}")
                         logging.info(f"Resized Image ({image.name}): {width, height} --> {texture_resolution, texture_resolution}")
+                        renew_lease()
                     
                     elif texture_resolution > width:
                         print(f"Skipped Resize Image ({image.name}) to avoid upscaling: {width, height} --> {texture_resolution, texture_resolution}")
@@ -1296,7 +2420,7 @@ def set_color_management(
 		
 
 # Convert images to specified format.
-def reformat_images(texture_map, texture_format, image_quality, reformat_all, include_normal_map):
+def reformat_images(texture_map, texture_format, image_quality, reformat_all, include_normal_map, skip_images=set()):
     try:
         # Get dictionary.
         ext_dict = image_texture_ext_dict()
@@ -1317,8 +2441,8 @@ def reformat_images(texture_map, texture_format, image_quality, reformat_all, in
         # Convert each relevant image.
         for image in bpy.data.images:
             
-            # Ignore images other than image textures.
-            if image.name == "Render Result" or image.name == "Viewer Node":
+            # Ignore images other than image textures, and images already processed by the texture pool.
+            if image.name == "Render Result" or image.name == "Viewer Node" or image.name in skip_images:
                 continue
 
             # Skip normal map if auto-optimizing file size and it's not elected to be reformatted.
@@ -1343,8 +2467,11 @@ def reformat_images(texture_map, texture_format, image_quality, reformat_all, in
                     logging.info(f"Skipped Reformat Image ({image.name}): Current format ({image_ext.upper()[1:]}) = New format ({texture_format})")
                     continue
 
-                # Save image as input specified by the User.
-                image.save_render(filepath = str(image_path_new))
+                # Save image as input specified by the User, or reuse the same image reformatted the same way before if it's in the texture cache.
+                cache_file = get_texture_cache_file(image_path, image_ext_new, "Reformat", texture_format, image_quality, image.colorspace_settings.name, image.alpha_mode)
+                if not fetch_cached_texture(cache_file, image_path_new):
+                    image.save_render(filepath = str(image_path_new))
+                    store_cached_texture(image_path_new, cache_file)
                 if image_path != image_path_new and image_path.exists():  # Don't delete image if converting to the same file format.
                     Path.unlink(image_path)
 
@@ -1382,6 +2509,125 @@ def reformat_images(texture_map, texture_format, image_quality, reformat_all, in
         logging.exception("Could not reformat images")
 		    
 
+# Get the texture pool jobs of the image textures to be edited: one job per image, combining every Edit Textures instance whose PBR map matches the image.
+# Images that are packed, or whose current or new format can't be processed outside Blender, are left to Blender.
+def get_texture_pool_jobs():
+    try:
+        ext_dict = image_texture_ext_dict()
+        jobs = {}
+        for image in bpy.data.images:
+            if image.name == "Render Result" or image.name == "Viewer Node" or image.packed_file:
+                continue
+
+            image_file = Path(bpy.path.abspath(image.filepath)).resolve()
+            if image_file.suffix.lower() not in pillow_extensions or not image_file.is_file():
+                continue
+
+            # Resize to the smallest resolution and reformat to the last format requested for the image, the same as editing it one instance after another.
+            resolution = None
+            texture_format = None
+            image_quality = 90
+            for edit_textures_dict in textures:
+                if edit_textures_dict["texture_map"] not in image.name:
+                    continue
+                if edit_textures_dict["texture_resolution"] != "Default":
+                    resolution = min(resolution or edit_textures_dict["texture_resolution"], edit_textures_dict["texture_resolution"])
+                if edit_textures_dict["texture_format"] != "Default":
+                    texture_format = edit_textures_dict["texture_format"]
+                    image_quality = edit_textures_dict["image_quality"]
+
+            # Don't reformat between identical formats.
+            if texture_format and ext_dict[texture_format] == image_file.suffix.lower():
+                texture_format = None
+            if not resolution and not texture_format:
+                continue
+            if texture_format and texture_format not in pillow_formats:
+                continue
+
+            # Blender reformats through the scene's sRGB Standard view (see reformat_images()), which leaves the pixels unchanged only for images in the sRGB color space.  Leave reformatting other images (e.g. Non-Color normal maps) to Blender so that both give the same textures.
+            if texture_format and image.colorspace_settings.name != 'sRGB':
+                continue
+
+            output_file = image_file.with_suffix(ext_dict[texture_format]) if texture_format else image_file
+            jobs[image.name] = {"file": str(image_file), "output_file": str(output_file), "resolution": resolution, "format": texture_format, "quality": image_quality}
+
+        return jobs
+
+    except Exception as Argument:
+        logging.exception("Could not get texture pool jobs")
+        return {}
+
+
+# Resize and reformat the image textures to be edited in a pool of Python processes outside Blender, using every processor core, then point the images at their new files.
+# Textures.py does the work with Pillow, run by the Python that comes with Blender.  Returns the names of the images that were processed so that Blender can skip them.
+def modify_textures_in_pool():
+    try:
+        jobs = get_texture_pool_jobs()
+
+        # Take textures processed the same way before from the texture cache.  Keyed apart from textures resized to keep their aspect ratio by older versions of the texture pool.
+        pool_jobs = []
+        cache_files = {}
+        for image_name, job in jobs.items():
+            cache_file = get_texture_cache_file(job["file"], Path(job["output_file"]).suffix, "Pool", "Square", job["resolution"], job["format"], job["quality"])
+            if fetch_cached_texture(cache_file, job["output_file"]):
+                job["result"] = {"output_file": job["output_file"]}
+            else:
+                cache_files[job["file"]] = cache_file
+                pool_jobs.append(job)
+
+        if pool_jobs:
+            with tempfile.TemporaryDirectory() as pool_dir:
+                jobs_file = Path(pool_dir, "Jobs.json")
+                results_file = Path(pool_dir, "Results.json")
+                with open(jobs_file, 'w') as outfile:
+                    json.dump(pool_jobs, outfile)
+
+                # Leave every texture to Blender if the texture pool can't run.
+                try:
+                    subprocess.run([sys.executable, str(Path(__file__).parent.resolve() / "Textures.py"), str(jobs_file), str(results_file), "--workers", str(texture_pool_workers)], check=True)
+                    with open(results_file, 'r') as openfile:
+                        results = {result["file"]: result for result in json.load(openfile)}
+                except (OSError, ValueError, subprocess.CalledProcessError):
+                    logging.exception("Could not run texture pool")
+                    results = {}
+
+            for job in pool_jobs:
+                job["result"] = results.get(job["file"], {"error": "No result"})
+                if "error" in job["result"]:
+                    print(f"Left texture to Blender ({Path(job['file']).name}): {job['result']['error']}")
+                    logging.info(f"Left texture to Blender ({Path(job['file']).name}): {job['result']['error']}")
+                else:
+                    store_cached_texture(job["output_file"], cache_files[job["file"]])
+
+        # Point each processed image at its new file, the same as Blender resizing and reformatting it.
+        processed_images = set()
+        for image_name, job in jobs.items():
+            if "error" in job["result"]:
+                continue
+
+            image = bpy.data.images[image_name]
+            image_file = Path(job["file"])
+            output_file = Path(job["output_file"])
+            if output_file != image_file:
+                image_file.unlink(missing_ok=True)
+                image.name = output_file.name
+            image.filepath = str(output_file)
+            image.reload()
+            processed_images.add(image.name)
+
+            print(f"Processed Image in texture pool ({image_file.name}) --> {output_file.name}")
+            logging.info(f"Processed Image in texture pool ({image_file.name}) --> {output_file.name}")
+
+        print("Modified textures in texture pool")
+        logging.info("Modified textures in texture pool")
+
+        return processed_images
+
+    except Exception as Argument:
+        logging.exception("Could not modify textures in texture pool")
+        return set()
+
+
 def save_blend(blend):
     try:
         # Reset color management to the default Blender file, sRGB Filmic.
@@ -1400,10 +2646,11 @@ def save_blend(blend):
         # Preserve unused materials & textures by setting fake user(s).
         use_fake_user()
 
-        # Frame object(s) in the viewport before saving.
-        override = override_context('VIEW_3D', 'WINDOW')
-        with bpy.context.temp_override(**override):
-            bpy.ops.view3d.view_all(center=False)
+        # Frame object(s) in the viewport before saving.  There is no viewport in background mode.
+        if not bpy.app.background:
+            override = override_context('VIEW_3D', 'WINDOW')
+            with bpy.context.temp_override(**override):
+                bpy.ops.view3d.view_all(center=False)
 
         # Save the file.
         bpy.ops.wm.save_as_mainfile(
@@ -1563,19 +2810,11 @@ def rename_objects_by_material_prefixes():
 # Find and rename transparent materials that have mispellings of transparency with regex keys. Regex transparent materials to prepare for the next function, which deletes any opaque versions of those transparent materials by relying on "transparent" existing in the material name.
 def regex_transparent_materials():
     try:
+        classifiers = get_transparency_tag_classifiers()
         for material in bpy.data.materials:
             material_name = material.name
-            components_original = split_into_components(material_name)
-            components = split_into_components(material_name)
-
-            for component in components:
-                transparency_tag_renamed = find_replace_transparency_tag(component)
-                if transparency_tag_renamed != None:
-                    transparency_tag_renamed = transparency_tag_renamed[0]
-                    print(f"Found a match for {transparency_tag_renamed}")
-                    logging.info(f"Found a match for {transparency_tag_renamed}")
-                    tag_index = components.index(component)
-                    components[tag_index] = transparency_tag_renamed
+            components_original = list(get_name_components(material_name))
+            components = replace_transparency_tags(components_original, classifiers)
 
             if components_original != components:
                 material_renamed = '_'.join(components)
@@ -1923,6 +3162,9 @@ def rename_textures_unpacked(textures_temp_dir):
 # For packed textures, reimport textures to respective existing materials after they have been unpacked and separated.
 def reimport_textures_to_existing_materials(textures_temp_dir, mapped_textures):
     try:
+        # Index the unpacked and separated textures once for all materials.
+        textures_available = list(dict.fromkeys(texture for texture_set_entry in get_texture_set_index(textures_temp_dir.name, textures_temp_dir).values() if texture_set_entry["directory"] == Path(textures_temp_dir) for texture in texture_set_entry["textures"]))
+
         for material in bpy.data.materials:
             if material.name == "Dots Stroke":
                 continue
@@ -1931,9 +3173,7 @@ def reimport_textures_to_existing_materials(textures_temp_dir, mapped_textures):
             material = material
 
             # Import textures with Node Wrangler addon
-            image_ext = supported_image_ext()  # Get a list of image extensions that could be used as textures
-            textures_available = [image.name for image in Path.iterdir(textures_temp_dir) if image.name.lower().endswith(image_ext)]
-            textures = [texture for texture in textures_available if Path(texture).stem in mapped_textures[material.name]]
+            textures = [texture for texture in textures_available if Path(texture).stem in mapped_textures.get(material.name, [])]
 
            # Add principled setup via Node Wrangler.
             add_principled_setup(material, textures_temp_dir, textures)
@@ -2013,9 +3253,29 @@ def rename_UV_maps():
         logging.exception("Could not rename uv maps")
 
 
+# Transform selected objects around the world origin by a matrix.  Used instead of the transform operators, which need a 3D Viewport, in background mode.
+def transform_selected_objects(matrix):
+    try:
+        for object in bpy.context.selected_objects:
+            # Children follow their transformed parents.
+            if object.parent and object.parent.select_get():
+                continue
+            object.matrix_world = matrix @ object.matrix_world
+
+        print("Transformed selected objects")
+        logging.info("Transformed selected objects")
+
+    except Exception as Argument:
+        logging.exception("Could not transform selected objects")
+
+
 # Scale all objects by the factors provided.
 def transform_resize(scales_list):
     try:
+        if bpy.app.background:
+            transform_selected_objects(Matrix.Diagonal((*scales_list, 1.0)))
+            return
+
         bpy.ops.transform.resize(
             value=tuple(scales_list), 
             orient_type='GLOBAL', 
@@ -2035,6 +3295,12 @@ def transform_resize(scales_list):
 def transform_rotate(angles_list):
     try:
         axes = ["X", "Y", "Z"]
+        # The rotate operator turns the opposite way to Matrix.Rotation for the same angle, so negate the angle to rotate the same way in background mode.
+        if bpy.app.background:
+            for axis_index, angle in enumerate(angles_list):
+                transform_selected_objects(Matrix.Rotation(-angle, 4, axes[axis_index]))
+            return
+
         axis_index = 0
         for angle in angles_list:
             constraint_axes = [False, False, False]
@@ -2060,6 +3326,10 @@ def transform_rotate(angles_list):
 # Move all objects by lengths provided.
 def transform_translate(lengths_list):
     try:
+        if bpy.app.background:
+            transform_selected_objects(Matrix.Translation(lengths_list))
+            return
+
         bpy.ops.transform.translate(
             value=tuple(lengths_list), 
             orient_type='GLOBAL'
@@ -2138,8 +3408,9 @@ def export_a_model(item_name, item_dir, textures_temp_dir, export_settings_dict,
         if apply_transforms:
             apply_transformations(apply_transforms_filter)
         
-        # Get export options as a dictionary.
-        options = eval(export_settings_dict["options"])
+        # Get export operator and a copy of its options as a dictionary.
+        operator, options = resolve_operator(export_settings_dict["operator"], export_settings_dict["options"])
+        options = dict(options)
 
         # Set filepath to the location of the model to be exported.
         options["filepath"] = str(export_file)
@@ -2149,22 +3420,21 @@ def export_a_model(item_name, item_dir, textures_temp_dir, export_settings_dict,
             options["export_draco_mesh_compression_enable"] = True
             options["export_draco_mesh_compression_level"] = compression_level
 
-        # Get export operator.
-        operator = export_settings_dict["operator"]
-        operator = f"{operator}{options})"  # Concatenate the export command with the export options dictionary.
-
         # Create export directory if it doesn't yet exist (e.g. when exporting to a non-adjacent directory with subdirectories)
         make_directory(export_dir.parent, export_dir.name)
 
         # Use pack_and_save_blend function instead of generic "bpy.ops.wm.save_as_mainfile" that doesn't take into account some User options.
         if export_file.suffix == ".blend":
+            # Don't let the blend file link back to the blend files it was converted from.
+            if use_cached_append:
+                make_linked_data_local()
             pack_and_save_blend(item_name, export_file, textures_temp_dir, export_settings_dict["pack_resources"], export_settings_dict["use_absolute_paths"])
 
-        # Run operator, which is stored as a string and won't run otherwise.
+        # Run operator.
         else:
-            exec(operator)
-            print(operator)
-            logging.info(operator)
+            seconds = call_operator(f"Export {export_settings_dict['name']}", operator, options)
+            print(f"{export_settings_dict['operator']}{options}) ({seconds:.2f} s)")
+            logging.info(f"{export_settings_dict['operator']}{options}) ({seconds:.2f} s)")
 
         # Reset scale
         export_scale_reset = 1 / export_scale
@@ -2251,7 +3521,7 @@ def get_texture_resolution_maximum():
     try:
         resolution_list = []
         for image in bpy.data.images:
-            width, height = image.size
+            width, height = get_image_size(image)
             resolution_list.append(width)
             resolution_list.append(height)  # Check both in case non-square textures are used.
         
@@ -2441,6 +3711,9 @@ def optimize_export_file(item_dir, item_name, import_file, textures_dir, texture
 # Modify textures if requested.
 def modify_textures():
     try:
+        # Process textures outside Blender first if requested, leaving Blender only the textures the texture pool couldn't process.
+        skip_images = modify_textures_in_pool() if use_texture_pool else set()
+
         for edit_textures_dict in textures:
             texture_map = edit_textures_dict["texture_map"]
             texture_resolution = edit_textures_dict["texture_resolution"]
@@ -2448,10 +3721,10 @@ def modify_textures():
             image_quality = edit_textures_dict["image_quality"]
             
             if texture_resolution != "Default":
-                resize_textures(texture_map, texture_resolution, False)
+                resize_textures(texture_map, texture_resolution, False, skip_images)
             
             if texture_format != "Default":
-                reformat_images(texture_map, texture_format, image_quality, False, False)
+                reformat_images(texture_map, texture_format, image_quality, False, False, skip_images)
 
         print("Modified textures")
         logging.info("Modified textures")
@@ -2467,6 +3740,11 @@ def apply_textures_custom(item_dir, item_name, import_file, textures_dir, textur
         if regex_textures:
             regex_transparent_objects()
         
+        # Assign the materials shared by every item instead of building them again for this item, unless they'd be changed per item by optimizing or archived with the item's own textures as assets.
+        if use_shared_custom_materials and not optimize and not mark_as_assets:
+            apply_textures_custom_shared(item_dir, item_name, textures_dir, textures_temp_dir)
+            return
+
         # Clear all users of all materials.
         clear_materials_users()
 
@@ -2494,7 +3772,7 @@ def apply_textures_custom(item_dir, item_name, import_file, textures_dir, textur
                 clean_data_block(bpy.data.images)
 
             # Copy textures_temp from custom textures directory to item_name directory.
-            copy_file(item_dir, textures_temp_dir)
+            copy_file(item_dir, textures_temp_dir, stage=True)
 
             # Rename and use the local copy of textures_temp_dir so it's possible to archive assets later.
             textures_temp_dir = item_dir / textures_temp_dir.name
@@ -2527,7 +3805,7 @@ def apply_textures_custom(item_dir, item_name, import_file, textures_dir, textur
                 regex_textures_external(textures_temp_dir)
 
             # Copy textures_temp from custom textures directory to item_name directory.
-            copy_file(item_dir, textures_temp_dir)
+            copy_file(item_dir, textures_temp_dir, stage=True)
 
             # Rename and use the local copy of textures_temp_dir so it's possible to archive assets later.
             textures_temp_dir = item_dir / textures_temp_dir.name
@@ -2563,6 +3841,104 @@ def apply_textures_custom(item_dir, item_name, import_file, textures_dir, textur
         logging.exception("Could not apply custom textures to objects")
 
 
+# Get the materials shared by every item from the "Custom" textures source, or None if they haven't been built in this Blender session yet (e.g. after a restart or a reset of the scene).
+def get_shared_custom_materials():
+    if not shared_custom_materials or not all(material_name in bpy.data.materials for material_name in shared_custom_materials):
+        return None
+    return [bpy.data.materials[material_name] for material_name in shared_custom_materials]
+
+
+# Build the materials of the "Custom" textures source once for the batch conversion, with edited textures, and keep them and their images with fake users so they outlive every item.
+# A single texture set is named after the custom textures directory rather than the first item, so it fits every item.
+def build_shared_custom_materials(textures_temp_dir):
+    try:
+        # Start from no materials or images at all, so only the custom materials are shared.
+        clear_materials_users()
+        clean_data_block(bpy.data.materials)
+        clean_data_block(bpy.data.images)
+
+        # Create a temporary textures directory beside the custom textures directory.
+        create_textures_temp(Path(textures_custom_dir), Path(textures_custom_dir), textures_temp_dir)
+
+        # Regex external custom textures.
+        if regex_textures:
+            regex_textures_external(textures_temp_dir)
+
+        # Create materials.
+        create_materials(Path(textures_custom_dir).name, textures_temp_dir)
+
+        # Modify textures if requested.
+        modify_textures()
+
+        shared_custom_materials.clear()
+        for datablock in chain(bpy.data.materials, bpy.data.images):
+            datablock.use_fake_user = True
+            if isinstance(datablock, bpy.types.Material):
+                shared_custom_materials.add(datablock.name)
+
+        print(f"Built shared custom materials: {sorted(shared_custom_materials)}")
+        logging.info(f"Built shared custom materials: {sorted(shared_custom_materials)}")
+
+    except Exception as Argument:
+        logging.exception("Could not build shared custom materials")
+
+
+# Remove the materials and images an item was imported with, keeping the shared custom materials and their images.
+def clean_unshared_data_blocks():
+    try:
+        # Remove any imported materials.
+        remove_all_material_slots()
+
+        # Keep data linked from libraries for the rest of the batch when appending blend files with the cache.
+        ids = [data for block in [bpy.data.materials, bpy.data.images] for data in block if not data.use_fake_user and not (use_cached_append and data.library)]
+        if use_fast_reset:
+            bpy.data.batch_remove(ids)
+        else:
+            for data in ids:
+                if isinstance(data, bpy.types.Material):
+                    bpy.data.materials.remove(data)
+                else:
+                    bpy.data.images.remove(data)
+
+        print(f"Cleaned unshared data blocks: {len(ids)} entries")
+        logging.info(f"Cleaned unshared data blocks: {len(ids)} entries")
+
+    except Exception as Argument:
+        logging.exception("Could not clean unshared data blocks")
+
+
+# Apply "Custom" textures to objects with the materials shared by every item, building them first if this is the first item.
+def apply_textures_custom_shared(item_dir, item_name, textures_dir, textures_temp_dir):
+    try:
+        # Build the shared materials once per batch conversion, or again if they were lost.
+        if get_shared_custom_materials() is None:
+            build_shared_custom_materials(textures_temp_dir)
+
+        # Remove the item's own materials and images.
+        clean_unshared_data_blocks()
+
+        # Assign the shared materials to objects.
+        assign_materials(Path(textures_custom_dir).name)
+
+        # Only give the item its own copy of the textures if it's kept after the conversion.  The shared materials use the textures beside the custom textures directory.
+        if keep_temporary_textures:
+            copy_file(item_dir, textures_temp_dir, stage=True)
+            textures_temp_dir_renamed = item_dir / (f"textures_{item_name}")
+            if Path(textures_temp_dir_renamed).exists():  # Remove the local copy of temporary textures directory if it already exists from a prior conversion.
+                shutil.rmtree(textures_temp_dir_renamed)
+            Path(item_dir / textures_temp_dir.name).rename(textures_temp_dir_renamed)
+
+        # Copy original custom textures to item_name directory if elected.
+        if copy_textures_custom_dir:
+            copy_textures_from_custom_source(textures_custom_dir, item_dir, textures_dir)
+
+        print("Applied shared custom materials to objects")
+        logging.info("Applied shared custom materials to objects")
+
+    except Exception as Argument:
+        logging.exception("Could not apply shared custom materials to objects")
+
+
 # Rename textures_temp_dir and repath images inside the .blend.
 def repath_blend_textures(blend, path_new):
     try:
@@ -2749,10 +4125,9 @@ def export_a_uv_layout(item_name, name, directory, export_all):
             uv_path_png = uv_path.replace(uv_format.lower(), "png")
             export_uv_layout_options["filepath"] = uv_path_png
 
-        export_uv_layout_command = "bpy.ops.uv.export_layout(**" + str(export_uv_layout_options) + ")"
-        print(export_uv_layout_command)
-        logging.info(export_uv_layout_command)
-        exec(export_uv_layout_command)
+        seconds = call_operator("Export UV Layout", bpy.ops.uv.export_layout, export_uv_layout_options)
+        print(f"bpy.ops.uv.export_layout(**{export_uv_layout_options}) ({seconds:.2f} s)")
+        logging.info(f"bpy.ops.uv.export_layout(**{export_uv_layout_options}) ({seconds:.2f} s)")
         
         if uv_format not in uv_default_formats:
             import_uv_image(uv_path_png)
@@ -2897,10 +4272,15 @@ def generate_preview(asset):
         with bpy.context.temp_override(id=asset):
             bpy.ops.ed.lib_id_generate_preview()
         
-        while True:
+        # Wait up to a minute for the preview so that an asset whose preview never finishes can't stall the batch.
+        for attempt in range(600):
             if preview_finished(asset):
                 break
             time.sleep(0.1)
+        else:
+            print(f"Timed out generating Asset Preview: {asset.name}")
+            logging.warning(f"Timed out generating Asset Preview: {asset.name}")
+            return
 
         print(f"Generated Asset Preview: {asset.name}")
         logging.info(f"Generated Asset Preview: {asset.name}")
@@ -3055,10 +4435,15 @@ def mark_asset(asset, asset_type, assets_in_library, item_name, blend):
         if asset_add_metadata:
             add_metadata_to_asset(asset)  # Add metadata.
 
-        if can_preview_be_generated(asset):
+        # Previews are rendered by a job that never runs in background mode.
+        if bpy.app.background:
+            print(f"Skipped Asset Preview in background mode: {asset.name}")
+            logging.info(f"Skipped Asset Preview in background mode: {asset.name}")
+        
+        elif can_preview_be_generated(asset):
             generate_preview(asset)  # Generate preview.
 
-        if asset_extract_previews:
+        if asset_extract_previews and not bpy.app.background:
             extract_preview_to_disk(asset, asset_type, item_name, blend)  # Extract preview.
 
         print(f"Marked Asset: {asset.name}")
@@ -3236,9 +4621,11 @@ def converter_stage_import(import_settings_dict, import_file, item_name, item_di
         setup_scene(item_name)
 
         # Brute force-remove all materials and images.
-        if textures_source != "Custom":
-            clean_data_block(bpy.data.materials)
-            clean_data_block(bpy.data.images)
+        if textures_source != "Custom" and use_fast_reset:
+            batch_clean_data_blocks([bpy.data.materials, bpy.data.images])
+        elif textures_source != "Custom":
+            clean_data_block(bpy.data.materials, use_cached_append)
+            clean_data_block(bpy.data.images, use_cached_append)
 
         # Run custom scripts with triggers "Before Import".
         run_custom_scripts("Before_Import")
@@ -3265,8 +4652,8 @@ def converter_stage_import(import_settings_dict, import_file, item_name, item_di
             apply_textures(item_dir, item_name, import_file, textures_dir, textures_temp_dir, blend, conversion_count)
         elif not use_textures:
             clear_materials_users()  # Clear all users of all materials.
-            clean_data_block(bpy.data.materials)  # Brute force-remove all materials and images.
-            clean_data_block(bpy.data.images)
+            clean_data_block(bpy.data.materials, use_cached_append)  # Brute force-remove all materials and images.
+            clean_data_block(bpy.data.images, use_cached_append)
             
         # Set scene units.
         set_scene_units(unit_system, length_unit)
@@ -3293,29 +4680,109 @@ def converter_stage_import(import_settings_dict, import_file, item_name, item_di
         logging.exception("COULD NOT COMPLETE CONVERTER STAGE IMPORT")
 
 
-# Convert the file for every file found inside the given directory.
-def converter(import_settings_dict, import_file, item_name, item_dir, export_name, textures_dir, textures_temp_dir, blend, export_settings_dict, export_dir, export_file, conversion_count):
+# Snapshot the scene and temporary textures of an item after it has been imported, so that each export can start over from the snapshot instead of importing the item again.
+def save_snapshot(item_name, textures_temp_dir):
     try:
-        converter_stage_import(import_settings_dict, import_file, item_name, item_dir, textures_dir, textures_temp_dir, blend, conversion_count)
-        
-        converter_stage_export(import_settings_dict, import_file, item_name, item_dir, export_name, textures_dir, textures_temp_dir, blend, export_settings_dict, export_dir, export_file)
-    
-    except Exception as Argument:
-        logging.exception(f"COULD NOT CONVERT FILE: {import_file.name}")
-		
+        snapshot_dir = Path(tempfile.mkdtemp(prefix=f"Transmogrifier_Snapshot_{item_name}_"))
 
-# Write conversion report to a JSON file.
-def report_conversion_count(conversion_count):
-    try:
-        # Data to be written
-        conversion_report_dict = {
-            "conversion_count": conversion_count,
-        }
-        
-        json_file = Path(Path(__file__).parent.resolve(), "Converter_Report.json")
+        # Write only the scene's collections and objects and the data they use, so that they can be appended back into the open file.  Paths are made absolute since the snapshot is saved elsewhere.
+        snapshot_blend = snapshot_dir / "Snapshot.blend"
+        scene_collection = bpy.context.scene.collection
+        bpy.data.libraries.write(str(snapshot_blend), set(scene_collection.children) | set(scene_collection.objects), path_remap='ABSOLUTE')
 
-        with open(json_file, "w") as outfile:
-            json.dump(conversion_report_dict, outfile)
+        # Optimizing resizes and reformats the temporary textures on disk, so keep a copy of them too.
+        if textures_temp_dir.is_dir():
+            shutil.copytree(textures_temp_dir, snapshot_dir / "textures", copy_function=stage_file)
+
+        print(f"Saved snapshot: {item_name}")
+        logging.info(f"Saved snapshot: {item_name}")
+
+        return snapshot_dir
+
+    except Exception as Argument:
+        logging.exception(f"Could not save snapshot: {item_name}")
+
+
+# Restore the scene and temporary textures of an item from its snapshot.
+def restore_snapshot(snapshot_dir, textures_temp_dir):
+    try:
+        if (snapshot_dir / "textures").is_dir():
+            shutil.rmtree(textures_temp_dir, ignore_errors=True)
+            shutil.copytree(snapshot_dir / "textures", textures_temp_dir, copy_function=stage_file)
+
+        # Clear the scene and append the snapshot's collections and objects back into it.  The open file is never replaced, the same as when the scene is reset between items, since that would invalidate the data the Converter keeps between exports and items (e.g. libraries linked by Cached Append) and leave the file path pointing at the snapshot.
+        clear_data_blocks([bpy.data.objects, bpy.data.collections, bpy.data.meshes, bpy.data.materials, bpy.data.images])
+        with bpy.data.libraries.load(str(snapshot_dir / "Snapshot.blend"), link=False) as (data_from, data_to):
+            data_to.collections = list(data_from.collections)
+            data_to.objects = list(data_from.objects)
+
+        # Link the collections that aren't nested in another collection, and the objects that aren't in any collection, to the scene.
+        scene_collection = bpy.context.scene.collection
+        collections = [collection for collection in data_to.collections if collection is not None]
+        nested_collections = set(child for collection in collections for child in collection.children)
+        collections = [collection for collection in collections if collection not in nested_collections]
+        for collection in collections:
+            scene_collection.children.link(collection)
+        for object in data_to.objects:
+            if object is not None and not object.users_collection:
+                scene_collection.objects.link(object)
+
+        # Make the item's collection active again, and select everything like after importing.
+        layer_collections = bpy.context.view_layer.layer_collection.children
+        if collections and collections[0].name in layer_collections:
+            bpy.context.view_layer.active_layer_collection = layer_collections[collections[0].name]
+        select_all()
+
+        print("Restored snapshot")
+        logging.info("Restored snapshot")
+
+    except Exception as Argument:
+        logging.exception("Could not restore snapshot")
+
+
+# Delete the snapshot of an item after all of its exports are done.
+def delete_snapshot(snapshot_dir):
+    try:
+        shutil.rmtree(snapshot_dir, ignore_errors=True)
+
+        print("Deleted snapshot")
+        logging.info("Deleted snapshot")
+
+    except Exception as Argument:
+        logging.exception("Could not delete snapshot")
+
+
+# Convert the file for every file found inside the given directory.
+def converter(import_settings_dict, import_file, item_name, item_dir, export_name, textures_dir, textures_temp_dir, blend, export_settings_dict, export_dir, export_file, conversion_count):
+    try:
+        converter_stage_import(import_settings_dict, import_file, item_name, item_dir, textures_dir, textures_temp_dir, blend, conversion_count)
+        
+        converter_stage_export(import_settings_dict, import_file, item_name, item_dir, export_name, textures_dir, textures_temp_dir, blend, export_settings_dict, export_dir, export_file)
+    
+    except Exception as Argument:
+        logging.exception(f"COULD NOT CONVERT FILE: {import_file.name}")
+		
+
+# Write conversion report to a JSON file.
+def report_conversion_count(conversion_count, log_file):
+    try:
+        # Data to be written
+        conversion_report_dict = {
+            "conversion_count": conversion_count,
+            "stage_timings": stage_timings,
+            "texture_cache": texture_cache_stats,
+        }
+
+        # Workers also report their partial summary so that it can be merged with those of other workers.
+        if worker_index is not None and logging_save_summary:
+            conversion_report_dict["summary_file"] = str(get_summary_file(log_file))
+        
+        json_file = Path(Path(__file__).parent.resolve(), f"Converter_Report{get_worker_suffix()}.json")
+        if report_file:
+            json_file = Path(report_file)
+
+        with open(json_file, "w") as outfile:
+            json.dump(conversion_report_dict, outfile)
 
         print("Reported conversion count")
         logging.info("Reported conversion count")
@@ -3324,9 +4791,161 @@ def report_conversion_count(conversion_count):
         logging.exception("Could not report conversion count")
 		
 
+# Hash the contents of a file.  Cached for the rest of the batch so that files shared between items or exports are only read once.
+@functools.lru_cache(maxsize=None)
+def hash_file(file, size, mtime_ns):
+    try:
+        file_hash = hashlib.sha256()
+        with open(file, 'rb') as openfile:
+            for chunk in iter(lambda: openfile.read(1048576), b""):
+                file_hash.update(chunk)
+
+        return file_hash.hexdigest()
+
+    except Exception as Argument:
+        logging.exception(f"Could not hash file: {Path(file).name}")
+
+
+# Get the files an export depends upon: the import file, the files that accompany it, and its textures.
+def get_manifest_inputs(import_file, textures_dir):
+    try:
+        inputs = [import_file]
+        
+        # Include files that accompany some formats, e.g. an OBJ's MTL or a glTF's BIN.
+        for extension in [".mtl", ".bin"]:
+            sidecar_file = import_file.with_suffix(extension)
+            if sidecar_file.is_file():
+                inputs.append(sidecar_file)
+        
+        # Include textures from wherever they are sourced.
+        if use_textures:
+            if textures_source == "Custom":
+                textures_dir = Path(textures_custom_dir)
+            if textures_dir.is_dir():
+                inputs.extend(sorted(file for file in textures_dir.rglob("*") if file.is_file()))
+            else:
+                inputs.extend(sorted(file for file in import_file.parent.iterdir() if file.is_file() and file.suffix.lower() in supported_image_ext()))
+
+        return inputs
+
+    except Exception as Argument:
+        logging.exception(f"Could not get manifest inputs: {import_file.name}")
+
+
+# Fingerprint an export from the contents of its inputs and the settings it is converted with.  Files whose size and modification time match the manifest entry reuse the recorded hash instead of being read again.
+def get_manifest_fingerprint(import_file, textures_dir, import_settings_dict, export_settings_dict, manifest_entry):
+    try:
+        recorded_files = manifest_entry.get("files", {}) if manifest_entry else {}
+
+        files = {}
+        for file in get_manifest_inputs(import_file, textures_dir):
+            stat = file.stat()
+            recorded_file = recorded_files.get(str(file))
+            if recorded_file and recorded_file[0] == stat.st_size and recorded_file[1] == stat.st_mtime_ns:
+                files[str(file)] = recorded_file
+            else:
+                files[str(file)] = [stat.st_size, stat.st_mtime_ns, hash_file(str(file), stat.st_size, stat.st_mtime_ns)]
+
+        # Leave out settings that don't change the converted file.
+        ignored_settings = ["imports", "exports", "worker_index", "report_file", "overwrite_files", "use_manifest", "use_resume", "import_order", "use_isolation", "isolation_group_size", "isolation_timeout", "isolation_memory_limit", "use_worker_pool", "worker_count", "use_converter_service", "converter_service_port", "use_background_mode", "use_fast_reset", "use_memory_watermark", "memory_watermark", "use_linked_textures", "use_texture_cache", "texture_cache_size", "texture_cache_dir", "use_texture_pool", "texture_pool_workers"]
+        settings_fingerprint_dict = {name: globals()[name] for name in sorted(settings_names) if name not in ignored_settings and not name.startswith("logging_")}
+        settings_fingerprint_dict["import"] = {key: value for key, value in import_settings_dict.items() if key not in ["files", "files_manifest", "files_manifest_writer"]}
+        settings_fingerprint_dict["export"] = {key: value for key, value in export_settings_dict.items() if key not in ["overwrite_files", "determine_import", "export_name"]}
+
+        fingerprint = hashlib.sha256(json.dumps([settings_fingerprint_dict, [[file, recorded_file[2]] for file, recorded_file in files.items()]], sort_keys=True, default=str).encode()).hexdigest()
+
+        return {"fingerprint": fingerprint, "files": files}
+
+    except Exception as Argument:
+        logging.exception(f"Could not get manifest fingerprint: {import_file.name}")
+
+
+# Load the manifest of an export directory.  The manifest is a JSON Lines file of one entry per converted export, in which later entries replace earlier ones.
+# It's cached by its size and modification time, so a manifest that another worker or job appended to since is read again.
+def load_manifest(manifest_file):
+    try:
+        stat = Path(manifest_file).stat()
+    except OSError:
+        return {}
+
+    return read_manifest(manifest_file, stat.st_size, stat.st_mtime_ns)
+
+
+# Read the manifest of an export directory.
+@functools.lru_cache(maxsize=None)
+def read_manifest(manifest_file, size, mtime_ns):
+    try:
+        manifest = {}
+        if Path(manifest_file).is_file():
+            with open(manifest_file, 'r') as openfile:
+                for line in openfile:
+                    if not line.strip():
+                        continue
+                    entry = json.loads(line)
+                    manifest[entry["export_file"]] = entry
+
+        print(f"Loaded manifest: {manifest_file}")
+        logging.info(f"Loaded manifest: {manifest_file}")
+
+        return manifest
+
+    except Exception as Argument:
+        logging.exception(f"Could not load manifest: {manifest_file}")
+        return {}
+
+
+# Append an entry for a converted export to the manifest of its export directory.  Entries are appended rather than rewriting the manifest so that workers can share an export directory.
+def update_manifest(import_file, textures_dir, import_settings_dict, export_settings_dict, export_dir, export_file):
+    try:
+        manifest_file = str(Path(export_dir) / "Transmogrifier_Manifest.jsonl")
+        manifest = load_manifest(manifest_file)
+
+        entry = get_manifest_fingerprint(import_file, textures_dir, import_settings_dict, export_settings_dict, manifest.get(export_file.name))
+        entry["export_file"] = export_file.name
+        entry["import_file"] = str(import_file)
+        manifest[export_file.name] = entry
+
+        with open(manifest_file, 'a') as outfile:
+            outfile.write(json.dumps(entry) + "\n")
+
+        print(f"Updated manifest: {export_file.name}")
+        logging.info(f"Updated manifest: {export_file.name}")
+
+    except Exception as Argument:
+        logging.exception(f"Could not update manifest: {export_file.name}")
+
+
+# Determine whether an export is unchanged since it was last converted, i.e. it still exists and neither its inputs nor its settings have changed.
+def is_unchanged(import_file, textures_dir, import_settings_dict, export_settings_dict, export_dir, export_file):
+    try:
+        if not export_file.is_file():
+            return False
+
+        manifest = load_manifest(str(Path(export_dir) / "Transmogrifier_Manifest.jsonl"))
+        manifest_entry = manifest.get(export_file.name)
+        if not manifest_entry:
+            return False
+
+        entry = get_manifest_fingerprint(import_file, textures_dir, import_settings_dict, export_settings_dict, manifest_entry)
+        
+        return entry["fingerprint"] == manifest_entry["fingerprint"]
+
+    except Exception as Argument:
+        logging.exception(f"Could not determine whether unchanged: {export_file.name}")
+        return False
+
+
 # Determine whether to import a model before converting in order to save time.
-def determine_import(import_file, export_settings_dict, export_dir, export_file):    
+def determine_import(import_file, export_settings_dict, export_dir, export_file, import_settings_dict, textures_dir):    
     try:
+        # With the manifest, convert only what changed since the last conversion regardless of overwriting files.
+        if use_manifest:
+            if is_unchanged(import_file, textures_dir, import_settings_dict, export_settings_dict, export_dir, export_file):
+                print(f"Skipped unchanged export: {export_file.name}")
+                logging.info(f"Skipped unchanged export: {export_file.name}")
+                return False
+            return True
+
         if export_settings_dict["overwrite_files"]:
             # If export file exists and the target filter is set to only overwrite files above target, get the existing file's size and determine whether to import.
             if export_file.is_file() and optimize_overwrite_filter == "Only Above Target":
@@ -3552,6 +5171,9 @@ def get_export_info(import_settings_dict, import_file, export_settings_dict, exp
         if "File Path" in logging_summary_filter:
             export_file_path = str(export_file)
             export_info.extend([export_file_path])
+        if "Memory" in logging_summary_filter:
+            memory = get_memory_usage()
+            export_info.extend([round(memory / 1024 ** 2, 1) if memory else None])
 
         print(f"Got export info: {export_file.name}")
         logging.info(f"Got export info: {export_file.name}")
@@ -3562,6 +5184,17 @@ def get_export_info(import_settings_dict, import_file, export_settings_dict, exp
         logging.exception(f"Could not get export info: {export_file.name}")
 
 
+# Get the path of the summary CSV that accompanies a log file.
+def get_summary_file(log_file):
+    try:
+        log_summary_name = log_file.stem.replace("Log", "Summary") + ".csv"
+        
+        return log_file.parent / log_summary_name
+
+    except Exception as Argument:
+        logging.exception(f"Could not get summary file")
+
+
 # Tabulate and save a CSV of the summary of the conversion.
 def report_conversion_summary(log_file, export_info_list):
     try:
@@ -3594,9 +5227,11 @@ def report_conversion_summary(log_file, export_info_list):
             fields.extend(["Texture Count", "Textures"])
         if "File Path" in logging_summary_filter:
             fields.extend(["Export File Path"])
+        if "Memory" in logging_summary_filter:
+            fields.extend(["Memory (MB)"])
 
-        log_summary_name = log_file.stem.replace("Log", "Summary") + ".csv"
-        log_summary_file = log_file.parent / log_summary_name
+        log_summary_file = get_summary_file(log_file)
+        log_summary_name = log_summary_file.name
 
         # Write CSV file.
         with open(log_summary_file, 'w', newline='') as csvfile:
@@ -3612,15 +5247,156 @@ def report_conversion_summary(log_file, export_info_list):
         print(f"Reported conversion summary: {log_summary_name}")
         logging.info(f"Reported conversion summary: {log_summary_name}")
 
-        # Copy CSV file to each import directory.
-        if not link_import_settings and len(imports) > 1:
+        # Copy CSV file to each import directory.  Workers leave this to the add-on, which merges every worker's summary first.
+        if not link_import_settings and len(imports) > 1 and worker_index is None:
             copy_log_file(log_summary_file)
 
     except Exception as Argument:
         logging.exception(f"Could not report conversion summary")
 
+# Get the path of the journal of a batch conversion.  The journal accompanies the conversion report.
+def get_journal_file():
+    try:
+        if report_file:
+            return Path(report_file).with_suffix(".journal.jsonl")
+        
+        return Path(Path(__file__).parent.resolve(), f"Converter_Journal{get_worker_suffix()}.jsonl")
+
+    except Exception as Argument:
+        logging.exception("Could not get journal file")
+
+
+# Append an entry to the journal and flush it to disk immediately so that it survives Blender crashing partway through a batch conversion.
+def write_journal(journal_file, entry):
+    try:
+        with open(journal_file, 'a') as outfile:
+            outfile.write(json.dumps(entry, default=str) + "\n")
+            outfile.flush()
+            os.fsync(outfile.fileno())
+
+    except Exception as Argument:
+        logging.exception(f"Could not write journal: {entry['event']}")
+
+
+# Read the journal of an unfinished batch conversion to get the items and exports that already finished, and the conversion info of each export.
+def read_journal(journal_file):
+    try:
+        finished_items = set()
+        finished_exports = set()
+        export_info_list = []
+
+        if not journal_file.is_file():
+            return finished_items, finished_exports, export_info_list
+
+        with open(journal_file, 'r') as openfile:
+            for line in openfile:
+                # Ignore a partially written last line.
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                
+                if entry["event"] == "item":
+                    finished_items.add(entry["import_file"])
+                elif entry["event"] == "export":
+                    finished_exports.add(entry["export_file"])
+                    export_info_list.append(entry["export_info"])
+                # A finished batch conversion leaves nothing to resume.
+                elif entry["event"] == "end":
+                    return set(), set(), []
+
+        print(f"Read journal: {len(finished_items)} items and {len(finished_exports)} exports already finished")
+        logging.info(f"Read journal: {len(finished_items)} items and {len(finished_exports)} exports already finished")
+
+        return finished_items, finished_exports, export_info_list
+
+    except Exception as Argument:
+        logging.exception(f"Could not read journal: {journal_file.name}")
+        return set(), set(), []
+
+
+# Start the journal of a batch conversion.  When resuming, continue the journal of the last unfinished batch conversion instead of starting a new one.
+def start_journal(journal_file):
+    try:
+        finished_items, finished_exports, export_info_list = set(), set(), []
+        if use_resume:
+            finished_items, finished_exports, export_info_list = read_journal(journal_file)
+        
+        if not (finished_items or finished_exports):
+            journal_file.unlink(missing_ok=True)
+            write_journal(journal_file, {"event": "start"})
+
+        print(f"Started journal: {journal_file.name}")
+        logging.info(f"Started journal: {journal_file.name}")
+
+        return finished_items, finished_exports, export_info_list
+
+    except Exception as Argument:
+        logging.exception(f"Could not start journal: {journal_file.name}")
+        return set(), set(), []
+
+
+# Check whether this Blender process uses more memory than the watermark after converting an item.  Only a Converter started from the command line can restart itself, not a Converter service or queue worker.
+def check_memory_watermark(item_name):
+    try:
+        memory = get_memory_usage()
+        if memory:
+            print(f"Memory after item: {item_name}: {memory / 1024 ** 2:.1f} MB")
+            logging.info(f"Memory after item: {item_name}: {memory / 1024 ** 2:.1f} MB")
+
+        if not (use_memory_watermark and memory_watermark and memory and restart_argv):
+            return False
+
+        return memory > memory_watermark * 1024 ** 3
+
+    except Exception as Argument:
+        logging.exception(f"Could not check memory watermark: {item_name}")
+        return False
+
+
+# Restart the Converter in a new Blender process that resumes the batch conversion from its journal, so that memory Blender held on to is given back to the system.  On Linux and macOS the new Blender process replaces this one, so whatever started the Converter keeps waiting on the same process.
+def restart_converter():
+    try:
+        # Always resume in the new Blender process.
+        arguments = list(restart_argv[1:])
+        if "--" not in arguments:
+            arguments.append("--")
+        if "--resume" not in arguments[arguments.index("--"):]:
+            arguments.append("--resume")
+        command = [bpy.app.binary_path] + arguments
+
+        print("Restarting Converter in a new Blender process")
+        logging.info("Restarting Converter in a new Blender process")
+        sys.stdout.flush()
+        logging.shutdown()
+
+        # Windows can't replace a running process.  If the add-on started the Converter, exit so that the add-on starts the new Blender process and keeps waiting on it.  Otherwise start the new Blender process and exit straight away, so that this one's memory is freed.
+        if os.name == "nt":
+            restart_exit_code = os.environ.get("TRANSMOGRIFIER_RESTART_EXIT_CODE")
+            if restart_exit_code:
+                os._exit(int(restart_exit_code))
+            subprocess.Popen(command)
+            os._exit(0)
+        os.execv(command[0], command)
+
+    except Exception as Argument:
+        logging.exception("Could not restart Converter")
+
+
+# Record how long an item took to convert so that the add-on can estimate the cost of converting it again.  Every worker appends to the same timings file.
+def record_item_timing(import_file, seconds):
+    try:
+        timings_file = Path(Path(__file__).parent.resolve(), "Converter_Timings.jsonl")
+        with open(timings_file, 'a') as outfile:
+            outfile.write(json.dumps({"import_file": str(import_file), "seconds": round(seconds, 3)}) + "\n")
+
+    except Exception as Argument:
+        logging.exception(f"Could not record item timing: {import_file.name}")
+
+
 # Main function that loops through specified directory and creates variables for the converter
 def batch_converter(log_file):
+    global texture_cache_bytes
     try:
         print("-------------------------------------------------------------------")
         print("---------------------  BATCH CONVERTER START  ---------------------")
@@ -3630,8 +5406,25 @@ def batch_converter(log_file):
         logging.info("-------------------------------------------------------------------")
 
         # Set up a conversion count and list to report how many conversions took place and the final file sizes of each item_name.
-        conversion_count = 0
-        export_info_list = []
+        # Time each stage of this batch conversion from scratch.
+        stage_timings.clear()
+        texture_cache_stats.update({"hits": 0, "misses": 0})
+        shared_custom_materials.clear()
+
+        # Measure the texture cache again, since this batch conversion may keep it in another directory.
+        texture_cache_bytes = None
+
+        # Forget file hashes and manifests read by an earlier batch conversion in the same Blender session, e.g. of the Converter service.
+        hash_file.cache_clear()
+        read_manifest.cache_clear()
+
+        # Read Node Wrangler's tags again, in case the User changed them since the last batch conversion.
+        nw_tag_tables.clear()
+
+        # Start the journal, and pick up the count and list where the last batch conversion left off when resuming.
+        journal_file = get_journal_file()
+        finished_items, finished_exports, export_info_list = start_journal(journal_file)
+        conversion_count = len(export_info_list)
 
         # Create path to blender.exe and get version
         blender_dir = bpy.app.binary_path
@@ -3646,8 +5439,8 @@ def batch_converter(log_file):
         # Loop through every import instance dictionary defined in Settings.json > "imports" setting.
         for import_settings_dict in imports:
 
-            # Get a list of imports for the given import instance's format from the Imports.json dictionary.
-            imports_list = import_settings_dict["files"]
+            # Get a list of imports for the given import instance's format from the Imports.json dictionary, or stream them from its manifest.
+            imports_list = get_import_files(import_settings_dict)
 
             # Loop through files in the current imports list and determine imports/run converter for each.
             for import_file in imports_list:
@@ -3657,15 +5450,27 @@ def batch_converter(log_file):
                 textures_dir = item_dir / "textures"
                 textures_temp_dir = item_dir / f"{textures_dir}_{item_name}"
                 if textures_source == "Custom":  
-                    textures_temp_dir = Path(textures_custom_dir).parent / (f"{Path(textures_custom_dir).name}_temp")
+                    textures_temp_dir = Path(textures_custom_dir).parent / (f"{Path(textures_custom_dir).name}_temp{get_worker_suffix()}")
                 blend = item_dir / f"{item_name}_Assets.blend"
 
+                # Skip items that finished before the last batch conversion was interrupted.
+                if str(import_file) in finished_items:
+                    print(f"Skipped finished item: {item_name}")
+                    logging.info(f"Skipped finished item: {item_name}")
+                    continue
+
+                # Time the item so that later batch conversions can schedule it by how long it took.
+                item_start_time = time.monotonic()
+                item_conversion_count = conversion_count
 
-                # If auto-optimizing files, always re-import the import file for every export. 
-                # This will take longer to convert, but provides the flexibility required for optimizing only as much as needed per export format.
+                # If auto-optimizing files, start every export from the freshly imported file. 
+                # This provides the flexibility required for optimizing only as much as needed per export format.
                 # e.g. a model with a high polycount can simply be Draco-compressed when exporting a GLB, but would require a destructive Decimate
                 # modifier to achieve the same file size when exporting a USDZ.
+                # The file is only imported once: the scene is snapshot after importing and restored before each export after the first.
                 if optimize:
+                    snapshot_dir = None
+
                     # Loop through exports and determine whether to import the file for each.
                     for export_settings_dict in exports:
                         # Set export_name-dependent variables.
@@ -3677,11 +5482,21 @@ def batch_converter(log_file):
                         export_dir, export_file = get_export_file_and_directory(item_dir, export_settings_dict, export_name)
 
                         # Determine which models are eligible for conversion.
-                        import_check = determine_import(import_file, export_settings_dict, export_dir, export_file)
+                        import_check = determine_import(import_file, export_settings_dict, export_dir, export_file, import_settings_dict, textures_dir)
+                        if str(export_file) in finished_exports:
+                            import_check = False
                                         
                         # If item is eligible for export, run the converter.
                         if import_check:
-                            converter(import_settings_dict, import_file, item_name, item_dir, export_name, textures_dir, textures_temp_dir, blend, export_settings_dict, export_dir, export_file, conversion_count)
+                            # Import the file for the first export, or start over from the snapshot of the import for every other export.
+                            if snapshot_dir is None:
+                                converter_stage_import(import_settings_dict, import_file, item_name, item_dir, textures_dir, textures_temp_dir, blend, conversion_count)
+                                snapshot_dir = save_snapshot(item_name, textures_temp_dir)
+                            else:
+                                restore_snapshot(snapshot_dir, textures_temp_dir)
+
+                            # Convert, optimize and export the file.
+                            converter_stage_export(import_settings_dict, import_file, item_name, item_dir, export_name, textures_dir, textures_temp_dir, blend, export_settings_dict, export_dir, export_file)
                             
                             # Get export info after the model has been exported.
                             export_info = get_export_info(import_settings_dict, import_file, export_settings_dict, export_file)
@@ -3689,6 +5504,15 @@ def batch_converter(log_file):
                             export_info_list.append(export_info)
                             conversion_count += 1
 
+                            # Record the finished export in the journal.
+                            write_journal(journal_file, {"event": "export", "import_file": str(import_file), "export_file": str(export_file), "export_info": export_info})
+
+                            # Record the conversion in the manifest.
+                            if use_manifest:
+                                update_manifest(import_file, textures_dir, import_settings_dict, export_settings_dict, export_dir, export_file)
+
+                    if snapshot_dir:
+                        delete_snapshot(snapshot_dir)
                 
                 # If not auto-optimizing files, only import the file once and edit the textures once, then export the file in every requested format.
                 elif not optimize:
@@ -3704,7 +5528,9 @@ def batch_converter(log_file):
                         export_dir, export_file = get_export_file_and_directory(item_dir, export_settings_dict, export_name)
 
                         # Determine which models are eligible for conversion.
-                        import_check = determine_import(import_file, export_settings_dict, export_dir, export_file)
+                        import_check = determine_import(import_file, export_settings_dict, export_dir, export_file, import_settings_dict, textures_dir)
+                        if str(export_file) in finished_exports:
+                            import_check = False
                         
                         # Note eligibility on list.
                         import_checklist.append(import_check)
@@ -3738,6 +5564,13 @@ def batch_converter(log_file):
                                 # Append export info to conversion list.
                                 export_info_list.append(export_info)
                                 conversion_count += 1
+
+                                # Record the finished export in the journal.
+                                write_journal(journal_file, {"event": "export", "import_file": str(import_file), "export_file": str(export_file), "export_info": export_info})
+
+                                # Record the conversion in the manifest.
+                                if use_manifest:
+                                    update_manifest(import_file, textures_dir, import_settings_dict, export_settings_dict, export_dir, export_file)
         
                 # Copy files adjacent to the import_file to the custom export directory.
                 if link_export_settings and not export_adjacent and use_subdirectories and copy_original_contents:
@@ -3762,10 +5595,21 @@ def batch_converter(log_file):
                 # Modified or copied textures can now be deleted after the conversion is over.
                 if use_textures:
                     determine_keep_temporary_textures(item_dir, item_name, import_file, export_file, textures_dir, textures_temp_dir, blend)
+
+                # Record the finished item in the journal.
+                write_journal(journal_file, {"event": "item", "import_file": str(import_file)})
+
+                if conversion_count > item_conversion_count:
+                    record_item_timing(import_file, time.monotonic() - item_start_time)
+
+                # Checkpoint and continue the rest of the batch in a new Blender process once this one uses more memory than the watermark.
+                if check_memory_watermark(item_name):
+                    write_journal(journal_file, {"event": "restart", "import_file": str(import_file)})
+                    restart_converter()
                 
         # If using custom textures, delete temporary textures directory only after all items have been converted.
         if use_textures and textures_source == "Custom" and not keep_temporary_textures:
-            textures_temp_dir = Path(textures_custom_dir).parent / (f"{Path(textures_custom_dir).name}_temp")
+            textures_temp_dir = Path(textures_custom_dir).parent / (f"{Path(textures_custom_dir).name}_temp{get_worker_suffix()}")
             if Path(textures_temp_dir).exists():
                 delete_textures_temp(textures_temp_dir)
 
@@ -3773,15 +5617,28 @@ def batch_converter(log_file):
         run_custom_scripts("After_Batch")
 
         # Report conversion count to Converter_Report.json
-        report_conversion_count(conversion_count)
+        report_conversion_count(conversion_count, log_file)
 
         # Report final conversion count.
         print(f"{conversion_count} files were converted.")
         logging.info(f"{conversion_count} files were converted.")
 
+        # Report time spent in each stage.
+        for stage, stage_timing in stage_timings.items():
+            print(f"{stage}: {stage_timing['count']} calls in {stage_timing['seconds']:.2f} s")
+            logging.info(f"{stage}: {stage_timing['count']} calls in {stage_timing['seconds']:.2f} s")
+
+        # Report hits and misses of the texture cache.
+        if use_texture_cache:
+            print(f"Texture cache: {texture_cache_stats['hits']} hits, {texture_cache_stats['misses']} misses")
+            logging.info(f"Texture cache: {texture_cache_stats['hits']} hits, {texture_cache_stats['misses']} misses")
+
         # Output a summary table of the batch conversion.
         report_conversion_summary(log_file, export_info_list)
 
+        # Mark the batch conversion as finished so that it isn't resumed.
+        write_journal(journal_file, {"event": "end"})
+
         print("-----------------------------------------------------------------")
         print("---------------------  BATCH CONVERTER END  ---------------------")
         print("-----------------------------------------------------------------")
@@ -3789,10 +5646,572 @@ def batch_converter(log_file):
         logging.info("---------------------  BATCH CONVERTER END  ---------------------")
         logging.info("-----------------------------------------------------------------")
 
+        return conversion_count
+
     except Exception as Argument:
         logging.exception("Could not end Batch Converter")
 		
 
+# Assign a list of import files to the first import instance whose extension matches each file.
+def assign_files_to_imports(files):
+    try:
+        for import_settings_dict in imports:
+            import_settings_dict["files"] = []
+
+        for file in files:
+            for import_settings_dict in imports:
+                if str(file).lower().endswith(import_settings_dict["extension"].lower()):
+                    import_settings_dict["files"].append(str(file))
+                    break
+
+        print(f"Assigned {len(files)} files to imports")
+        logging.info(f"Assigned {len(files)} files to imports")
+
+    except Exception as Argument:
+        logging.exception("Could not assign files to imports")
+
+
+# Clear the scene and every data block left over from the previous job so that the next job starts from a clean Converter.blend.
+def reset_scene():
+    try:
+        clear_data_blocks([bpy.data.objects, bpy.data.collections, bpy.data.meshes, bpy.data.materials, bpy.data.images])
+
+        print("Reset scene")
+        logging.info("Reset scene")
+
+    except Exception as Argument:
+        logging.exception("Could not reset scene")
+
+
+# Run a batch conversion job received by the Converter service and return a report of it.
+def run_job(job):
+    try:
+        # Set global variables from the job's settings file and/or settings dictionary, starting over from the default settings rather than the previous job's.
+        reset_settings()
+        if "settings_file" in job:
+            get_settings([job["settings_file"]])
+        if "settings" in job:
+            set_settings(job["settings"])
+
+        # Replace the import files of the settings with the job's own list of files.
+        if "files" in job:
+            assign_files_to_imports(job["files"])
+
+        log_file = make_log_file()
+        conversion_count = batch_converter(log_file)
+
+        if logging_save_log and not link_import_settings and len(imports) > 1:
+            copy_log_file(log_file)
+
+        # Leave the warm Blender session clean for the next job.
+        reset_scene()
+
+        return {"conversion_count": conversion_count, "log_file": str(log_file)}
+
+    except Exception as Argument:
+        logging.exception("Could not run job")
+
+
+# Read a single job from a connection to the Converter service, run it and reply with the result.  Jobs without the service's access token are rejected.
+def handle_job(connection, token):
+    try:
+        request = connection.makefile("r").readline()
+        job = json.loads(request)
+
+        if not isinstance(job, dict) or not hmac.compare_digest(str(job.get("token", "")), token):
+            print("Rejected job without the Converter service's access token")
+            logging.warning("Rejected job without the Converter service's access token")
+            connection.sendall((json.dumps({"status": "unauthorized"}) + "\n").encode())
+            return True
+
+        if job.get("command") == "ping":
+            reply = {"status": "ready"}
+        elif job.get("command") == "stop":
+            reply = {"status": "stopped"}
+        else:
+            reply = run_job(job) or {"status": "failed"}
+
+        connection.sendall((json.dumps(reply) + "\n").encode())
+
+        return job.get("command") != "stop"
+
+    except Exception as Argument:
+        logging.exception("Could not handle job")
+        return True
+
+
+# Write a new access token to a file that only the current user can read.  An existing file is replaced rather than reused, so that nobody else can have created it beforehand.
+def write_token_file(token_file, token):
+    token_file = Path(token_file)
+    token_file.parent.mkdir(parents=True, exist_ok=True)
+    token_file.unlink(missing_ok=True)
+    descriptor = os.open(token_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(descriptor, 'w') as outfile:
+        outfile.write(token)
+
+
+# Keep Blender open and serve batch conversion jobs over a local socket until a "stop" command is received.
+# Any local process can connect to the port, so only jobs with the access token written to token_file are run.
+def serve_jobs(port, token_file):
+    try:
+        if not token_file:
+            print("The Converter service needs a --token-file to write its access token to")
+            logging.error("The Converter service needs a --token-file to write its access token to")
+            return
+
+        token = secrets.token_hex(32)
+        write_token_file(token_file, token)
+
+        with socket.create_server(("127.0.0.1", port)) as server:
+            print(f"Converter service listening on port {port}")
+            logging.info(f"Converter service listening on port {port}")
+
+            serving = True
+            while serving:
+                connection, address = server.accept()
+                with connection:
+                    serving = handle_job(connection, token)
+
+        Path(token_file).unlink(missing_ok=True)
+
+        print("Converter service stopped")
+        logging.info("Converter service stopped")
+
+    except Exception as Argument:
+        logging.exception("Could not serve jobs")
+
+
+# Write a JSON file to a queue directory.  The file is written under a temporary name and then renamed so that other workers never read it half-written.
+def write_queue_file(file, data):
+    try:
+        temporary_file = file.with_name(f"{file.name}.{os.getpid()}.tmp")
+        with open(temporary_file, 'w') as outfile:
+            json.dump(data, outfile)
+        os.replace(temporary_file, file)
+
+    except Exception as Argument:
+        logging.exception(f"Could not write queue file: {file.name}")
+
+
+# Create a queue directory holding the settings and import files of a batch conversion.  Only the first worker to get the queue's lock creates it, and the others wait until it's ready.  Returns whether the queue is ready.
+def make_queue(queue_dir, arguments):
+    try:
+        for subdirectory in ["pending", "claimed", "done", "failed", "workers"]:
+            (queue_dir / subdirectory).mkdir(parents=True, exist_ok=True)
+        
+        settings_file = queue_dir / "settings.json"
+        try:
+            os.close(os.open(queue_dir / "create.lock", os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+        except FileExistsError:
+            for attempt in range(600):
+                if settings_file.is_file():
+                    return True
+                time.sleep(0.1)
+
+            # The worker creating the queue quit before it was ready.
+            print(f"Queue was never made ready, delete it and start again: {queue_dir}")
+            logging.error(f"Queue was never made ready, delete it and start again: {queue_dir}")
+            return False
+
+        set_settings(default_settings)
+        get_settings([Path(arguments.settings).resolve() if arguments.settings else "Settings.json"])
+        if arguments.files_from:
+            assign_files_to_imports(read_files_list(arguments.files_from))
+
+        # Add an item to the queue for every import file.  Item names are the item's number and how many times it has been attempted.
+        item_index = 0
+        for import_index, import_settings_dict in enumerate(imports):
+            for file in get_import_files(import_settings_dict):
+                write_queue_file(queue_dir / "pending" / f"{item_index:06d}_0.json", {"import_index": import_index, "import_file": file})
+                item_index += 1
+
+        # Record how many items there are, so that workers can tell when every item is finished.
+        write_queue_file(queue_dir / "items.json", {"item_count": item_index})
+
+        # Write the settings last, which marks the queue as ready.
+        settings_dict = {name: globals()[name] for name in settings_names if name not in ["worker_index", "report_file", "use_resume"]}
+        write_queue_file(settings_file, settings_dict)
+
+        print(f"Made queue of {item_index} items: {queue_dir}")
+        logging.info(f"Made queue of {item_index} items: {queue_dir}")
+
+        return True
+
+    except Exception as Argument:
+        logging.exception(f"Could not make queue: {queue_dir}")
+        return False
+
+
+# Get the current time according to the queue's storage by touching a file of this worker.  Comparing lease times to the storage's clock rather than each host's own clock keeps hosts with skewed clocks from expiring each other's leases early.
+def get_queue_time(queue_dir, worker_id):
+    try:
+        worker_file = queue_dir / "workers" / f"{worker_id}.alive"
+        worker_file.touch()
+
+        return worker_file.stat().st_mtime
+
+    except Exception as Argument:
+        logging.exception("Could not get queue time")
+        return time.time()
+
+
+# Return items whose lease expired, i.e. whose worker stopped renewing it, to the queue.  Items that have been attempted too many times are moved to the failed items instead.
+def reclaim_queue_items(queue_dir, worker_id, lease, max_attempts=3):
+    try:
+        now = get_queue_time(queue_dir, worker_id)
+        for claim_file in (queue_dir / "claimed").iterdir():
+            try:
+                if now - claim_file.stat().st_mtime < lease:
+                    continue
+            except FileNotFoundError:
+                continue
+
+            item_id, attempt = claim_file.name.split(".json.")[0].split("_")
+            attempt = int(attempt) + 1
+            if attempt < max_attempts:
+                destination = queue_dir / "pending" / f"{item_id}_{attempt}.json"
+            else:
+                destination = queue_dir / "failed" / f"{item_id}.json"
+
+            # Another worker may have reclaimed the item first.
+            try:
+                os.rename(claim_file, destination)
+            except OSError:
+                continue
+
+            print(f"Reclaimed expired queue item: {item_id}")
+            logging.info(f"Reclaimed expired queue item: {item_id}")
+
+    except Exception as Argument:
+        logging.exception("Could not reclaim queue items")
+
+
+# Claim the next pending item of the queue by renaming it into the claimed items.  Renaming is atomic, so only one worker can claim each item.
+def claim_queue_item(queue_dir, worker_id, lease):
+    try:
+        reclaim_queue_items(queue_dir, worker_id, lease)
+
+        for pending_file in sorted((queue_dir / "pending").glob("*.json")):
+            claim_file = queue_dir / "claimed" / f"{pending_file.name}.{worker_id}"
+            try:
+                os.rename(pending_file, claim_file)
+            except OSError:
+                continue
+            
+            # Start the lease from the moment the item was claimed.
+            os.utime(claim_file)
+            with open(claim_file, 'r') as openfile:
+                item = json.load(openfile)
+
+            return claim_file, item
+
+        return None
+
+    except Exception as Argument:
+        logging.exception("Could not claim queue item")
+        return None
+
+
+# Convert a claimed queue item and publish its result to the finished items.
+def convert_queue_item(queue_dir, worker_id, lease, claim_file, item, log_file):
+    global held_claim_file
+    try:
+        item_id = claim_file.name.split("_")[0]
+
+        # Renew the lease after each stage while converting.
+        held_claim_file = claim_file
+
+        # Convert only the item's import file.
+        for import_settings_dict in imports:
+            import_settings_dict["files"] = []
+        imports[item["import_index"]]["files"] = [item["import_file"]]
+        conversion_count = batch_converter(log_file)
+        held_claim_file = None
+
+        # Get the conversion info of each export from the journal.
+        export_info_list = []
+        with open(get_journal_file(), 'r') as openfile:
+            for line in openfile:
+                # Ignore a partially written last line.
+                if not line.endswith("\n"):
+                    continue
+                entry = json.loads(line)
+                if entry["event"] == "export":
+                    export_info_list.append(entry["export_info"])
+
+        # Take the claim out of the claimed items before publishing the result.  Renaming is atomic, so if the lease expired and another worker reclaimed the item, this fails and the result of whichever worker holds the item is published instead.
+        finishing_file = queue_dir / "done" / f"{item_id}.json.{worker_id}.tmp"
+        try:
+            os.rename(claim_file, finishing_file)
+        except OSError:
+            print(f"Lost the lease of queue item: {item_id}")
+            logging.warning(f"Lost the lease of queue item: {item_id}")
+            reset_scene()
+            return
+
+        with open(finishing_file, 'w') as outfile:
+            json.dump({
+                "import_file": item["import_file"],
+                "conversion_count": conversion_count or 0,
+                "export_info": export_info_list,
+                "worker": worker_id,
+            }, outfile)
+        os.replace(finishing_file, queue_dir / "done" / f"{item_id}.json")
+
+        reset_scene()
+
+        print(f"Converted queue item: {item_id}")
+        logging.info(f"Converted queue item: {item_id}")
+
+    except Exception as Argument:
+        held_claim_file = None
+        logging.exception(f"Could not convert queue item: {claim_file.name}")
+
+
+# Check whether every item of the queue is finished or failed.  Finished and failed items only ever grow, so unlike checking for pending and claimed items, this can't be fooled by an item moving between them, e.g. when an expired claim is returned to the queue.
+def is_queue_finished(queue_dir):
+    try:
+        items_file = queue_dir / "items.json"
+        if items_file.is_file():
+            with open(items_file, 'r') as openfile:
+                item_count = json.load(openfile)["item_count"]
+            finished_items = set(file.stem for file in (queue_dir / "done").glob("*.json")) | set(file.stem for file in (queue_dir / "failed").glob("*.json"))
+            return len(finished_items) >= item_count
+
+        # Queues made before the item count was recorded.  Check claimed items before pending items, so that an item returned to the queue in between is still seen.
+        return not any((queue_dir / "claimed").iterdir()) and not any((queue_dir / "pending").glob("*.json"))
+
+    except Exception as Argument:
+        logging.exception(f"Could not check whether queue is finished: {queue_dir}")
+        return False
+
+
+# Report the whole queue once every item is finished or failed.  Only the first worker to get the queue's finish lock reports it.  Returns whether the queue is finished, by this worker or another.
+def finish_queue(queue_dir, save_summary):
+    try:
+        if not is_queue_finished(queue_dir):
+            return False
+
+        try:
+            os.close(os.open(queue_dir / "finish.lock", os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+        except FileExistsError:
+            return True
+
+        # Check again while holding the lock, in case an item was returned to the queue since.
+        if not is_queue_finished(queue_dir):
+            (queue_dir / "finish.lock").unlink(missing_ok=True)
+            return False
+
+        conversion_count = 0
+        export_info_list = []
+        for done_file in sorted((queue_dir / "done").glob("*.json")):
+            with open(done_file, 'r') as openfile:
+                done_item = json.load(openfile)
+            conversion_count += done_item["conversion_count"]
+            export_info_list.extend(done_item["export_info"])
+
+        failed = []
+        for failed_file in sorted((queue_dir / "failed").glob("*.json")):
+            with open(failed_file, 'r') as openfile:
+                failed.append(json.load(openfile)["import_file"])
+
+        write_queue_file(queue_dir / "report.json", {"conversion_count": conversion_count, "failed": failed})
+
+        # Output a summary table of the whole queue.
+        if save_summary:
+            set_settings({"logging_save_summary": True})
+            report_conversion_summary(queue_dir / "Transmogrifier_Log_Queue.txt", export_info_list)
+
+        print(f"Finished queue: {conversion_count} files were converted and {len(failed)} items failed.")
+        logging.info(f"Finished queue: {conversion_count} files were converted and {len(failed)} items failed.")
+
+        return True
+
+    except Exception as Argument:
+        logging.exception(f"Could not finish queue: {queue_dir}")
+        return True
+
+
+# Work on a queue shared with any number of other workers on any host until every item is finished.  Workers can join or leave at any time.
+def work_queue(queue_dir, arguments):
+    try:
+        if not (queue_dir / "settings.json").is_file() and not make_queue(queue_dir, arguments):
+            return
+
+        worker_id = f"{socket.gethostname()}_{os.getpid()}"
+        lease = arguments.lease
+
+        # Convert with the queue's settings.  Each item's summary is published with its result instead of saved by the worker.
+        set_settings(default_settings)
+        get_settings([queue_dir / "settings.json"])
+        save_summary = logging_save_summary
+        set_settings({
+            "worker_index": worker_id,
+            "report_file": str(queue_dir / "workers" / f"{worker_id}.json"),
+            "logging_save_summary": False,
+        })
+        log_file = make_log_file()
+
+        print(f"Working on queue: {queue_dir}")
+        logging.info(f"Working on queue: {queue_dir}")
+
+        while True:
+            claim = claim_queue_item(queue_dir, worker_id, lease)
+            if claim:
+                convert_queue_item(queue_dir, worker_id, lease, claim[0], claim[1], log_file)
+                continue
+
+            # Stop once every item is finished, otherwise wait in case another worker's items are returned to the queue.
+            if finish_queue(queue_dir, save_summary):
+                break
+            time.sleep(min(lease / 4, 10))
+
+    except Exception as Argument:
+        logging.exception(f"Could not work on queue: {queue_dir}")
+
+
+# Get the import operator Blender uses for a geometry-only format, which moved from Python to C++ over Blender versions.
+def get_stock_import_operator(extension):
+    try:
+        operator_names = {
+            ".stl": [("wm", "stl_import"), ("import_mesh", "stl")],
+            ".obj": [("wm", "obj_import"), ("import_scene", "obj")],
+            ".ply": [("wm", "ply_import"), ("import_mesh", "ply")],
+        }
+        for operator_module, operator_name in operator_names[extension]:
+            if operator_name in dir(getattr(bpy.ops, operator_module)):
+                return getattr(getattr(bpy.ops, operator_module), operator_name)
+
+    except Exception as Argument:
+        logging.exception(f"Could not get stock import operator: {extension}")
+
+
+# Benchmark the fast importer against the import operator by importing each file a number of times with each, and report the best time and resulting geometry of each.
+def benchmark_importers(files, repeat):
+    try:
+        results = []
+        for file in files:
+            file = Path(file).resolve()
+            operator = get_stock_import_operator(file.suffix.lower())
+            importers = {
+                "Operator": lambda: operator(filepath=str(file)),
+                "Fast": lambda: fast_import_file(file, {}),
+            }
+
+            for importer, import_file in importers.items():
+                seconds = []
+                for attempt in range(repeat):
+                    reset_scene()
+                    start_time = time.perf_counter()
+                    import_file()
+                    seconds.append(time.perf_counter() - start_time)
+
+                result = {
+                    "file": str(file),
+                    "importer": importer,
+                    "seconds": round(min(seconds), 4),
+                    "vertices": sum(len(mesh.vertices) for mesh in bpy.data.meshes),
+                    "faces": sum(len(mesh.polygons) for mesh in bpy.data.meshes),
+                }
+                results.append(result)
+
+                print(f"{file.name} | {importer}: {result['seconds']} s, {result['vertices']} vertices, {result['faces']} faces")
+                logging.info(f"{file.name} | {importer}: {result['seconds']} s, {result['vertices']} vertices, {result['faces']} faces")
+
+        reset_scene()
+
+        return results
+
+    except Exception as Argument:
+        logging.exception("Could not benchmark importers")
+
+
+# Get the resident memory of this Blender process in bytes, or None if it can't be determined.
+def get_memory_usage():
+    return get_process_memory(os.getpid()) or None
+
+
+# Fill the scene with a stand-in for an item: a subdivided grid mesh per object, each with its own material and image.
+def add_benchmark_item(item_name, object_count=10, grid_size=100, image_size=512):
+    try:
+        add_collection(item_name)
+        collection = bpy.data.collections[item_name]
+
+        vertices = [(x, y, 0) for y in range(grid_size) for x in range(grid_size)]
+        faces = [(y * grid_size + x, y * grid_size + x + 1, (y + 1) * grid_size + x + 1, (y + 1) * grid_size + x) for y in range(grid_size - 1) for x in range(grid_size - 1)]
+        for index in range(object_count):
+            mesh = bpy.data.meshes.new(f"{item_name}_{index}")
+            mesh.from_pydata(vertices, [], faces)
+            material = bpy.data.materials.new(f"{item_name}_{index}")
+            material.use_nodes = True
+            image_node = material.node_tree.nodes.new("ShaderNodeTexImage")
+            image_node.image = bpy.data.images.new(f"{item_name}_{index}", image_size, image_size)
+            mesh.materials.append(material)
+            collection.objects.link(bpy.data.objects.new(f"{item_name}_{index}", mesh))
+
+    except Exception as Argument:
+        logging.exception(f"Could not add benchmark item: {item_name}")
+
+
+# Benchmark one reset mode ("Standard" or "Fast") in this Blender process: convert the given number of stand-in items, timing every reset and measuring how much resident memory grew over the batch.
+def benchmark_reset_mode(item_count, reset_mode):
+    try:
+        set_settings({"use_fast_reset": reset_mode == "Fast"})
+        reset_scene()
+        start_memory = get_memory_usage()
+
+        seconds = []
+        for index in range(item_count):
+            item_name = f"Benchmark_{index}"
+            start_time = time.perf_counter()
+            setup_scene(item_name)
+            clear_data_blocks([bpy.data.materials, bpy.data.images])
+            seconds.append(time.perf_counter() - start_time)
+            add_benchmark_item(item_name)
+
+        reset_scene()
+        end_memory = get_memory_usage()
+
+        result = {
+            "reset": reset_mode,
+            "items": item_count,
+            "total_seconds": round(sum(seconds), 4),
+            "mean_seconds": round(sum(seconds) / len(seconds), 6) if seconds else 0,
+            "max_seconds": round(max(seconds), 6) if seconds else 0,
+            "rss_growth_bytes": end_memory - start_memory if start_memory and end_memory else None,
+        }
+
+        print(f"{result['reset']} reset: {result['total_seconds']} s over {item_count} items, {result['mean_seconds']} s mean, RSS growth {result['rss_growth_bytes']} bytes")
+        logging.info(f"{result['reset']} reset: {result['total_seconds']} s over {item_count} items, {result['mean_seconds']} s mean, RSS growth {result['rss_growth_bytes']} bytes")
+
+        return result
+
+    except Exception as Argument:
+        logging.exception(f"Could not benchmark {reset_mode} reset")
+
+
+# Benchmark resetting the scene between items with and without Fast Reset.  Each reset mode runs in a fresh Blender process, so that memory left over by one mode doesn't count against the other.
+def benchmark_reset(item_count, reset_mode=None):
+    try:
+        if reset_mode:
+            return [benchmark_reset_mode(item_count, reset_mode)]
+
+        results = []
+        for reset_mode in ["Standard", "Fast"]:
+            with tempfile.TemporaryDirectory() as temp_dir:
+                report_json = Path(temp_dir, "Benchmark_Reset.json")
+                command = [bpy.app.binary_path, "--background"] + ([bpy.data.filepath] if bpy.data.filepath else []) + ["--python", str(Path(__file__).resolve()), "--", "--benchmark-reset", str(item_count), "--reset-mode", reset_mode, "--output-report", str(report_json)]
+                subprocess.run(command)
+                if report_json.is_file():
+                    with open(report_json, 'r') as openfile:
+                        results.extend(result for result in json.load(openfile) if result)
+
+        return results
+
+    except Exception as Argument:
+        logging.exception("Could not benchmark reset")
+
+
 # Quit Blender after batch conversion is complete.
 def quit_blender():
     try:
@@ -3807,8 +6226,41 @@ def quit_blender():
 
 # Transmogrify.
 def transmogrify():
+    arguments = get_arguments()
+
+    # Serve jobs from this Blender session instead of converting once if requested.
+    if arguments.serve:
+        serve_jobs(arguments.serve, arguments.token_file)
+        quit_blender()
+        return
+
+    # Benchmark instead of converting if requested.
+    if arguments.benchmark or arguments.benchmark_reset:
+        set_settings(default_settings)
+        if arguments.benchmark:
+            results = benchmark_importers(arguments.benchmark, arguments.repeat)
+        else:
+            results = benchmark_reset(arguments.benchmark_reset, arguments.reset_mode)
+        if arguments.output_report:
+            with open(arguments.output_report, "w") as outfile:
+                json.dump(results, outfile, indent=4)
+        quit_blender()
+        return
+
+    # Work on a shared queue instead of converting once if requested.
+    if arguments.queue:
+        work_queue(Path(arguments.queue).resolve(), arguments)
+        quit_blender()
+        return
+
     # Step 1: Set global variables.
-    get_settings(["Settings.json"])
+    set_settings(default_settings)
+    get_settings([Path(arguments.settings).resolve() if arguments.settings else "Settings.json"])
+    apply_arguments(arguments)
+
+    # Allow restarting with the same command line when Blender uses more memory than the watermark.
+    global restart_argv
+    restart_argv = sys.argv
 
     # Step 2: Start logging conversion if requested by User.
     log_file = make_log_file()
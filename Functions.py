@@ -33,7 +33,17 @@ from pathlib import Path
 import glob
 import re
 import json
+import csv
+import shutil
+import socket
+import subprocess
+import os
+import struct
+import datetime
+import time
+import numpy as np
 from mathutils import Vector, Euler
+from . import Textures
 
 
 
@@ -300,6 +310,51 @@ def get_import_files_list(import_instance):
     return files
 
 
+# Walk a directory for files of a given extension, yielding each file as soon as it's found instead of waiting for the whole directory to be searched.
+# Since Converter.py is already converting while the directory is walked, skip anything it writes: export directories, asset .blend files, and any file modified after the batch conversion started (e.g. exports adjacent to their import files).
+def iter_import_files(directory, extension, excluded_dirs=(), started=None):
+    try:
+        entries = os.scandir(directory)
+    except OSError:
+        return
+
+    with entries:
+        for entry in entries:
+            # Skip hidden files and directories, the same as glob.
+            if entry.name.startswith("."):
+                continue
+            if entry.is_dir():
+                if str(Path(entry.path).resolve()) in excluded_dirs:
+                    continue
+                yield from iter_import_files(entry.path, extension, excluded_dirs, started)
+            elif entry.name.endswith(extension) and not entry.name.endswith("_Assets.blend"):
+                if started is not None and entry.stat().st_mtime >= started:
+                    continue
+                yield entry.path
+
+
+# Get the import directory and extension of each import instance, and the export directories that Converter.py writes to, for finding import files away from Blender's main thread.
+def get_import_files_sources(settings_dict):
+    import_sources = [(str(Path(bpy.path.abspath(import_settings_dict["directory"])).resolve()), import_settings_dict["extension"]) for import_settings_dict in settings_dict["imports"]]
+    excluded_dirs = set(str(Path(bpy.path.abspath(export_settings_dict["directory"])).resolve()) for export_settings_dict in settings_dict["exports"] if not export_settings_dict["export_adjacent"])
+
+    return import_sources, excluded_dirs
+
+
+# Write the import files of each import instance to its streaming manifest as they are found.  Each file is flushed straight away so that Converter.py can start converting while files are still being found.
+def write_import_files_manifests(import_sources, manifest_files, excluded_dirs=(), started=None):
+    for (directory, extension), manifest_file in zip(import_sources, manifest_files):
+        with open(manifest_file, 'a') as outfile:
+            try:
+                for file in iter_import_files(directory, extension, excluded_dirs, started):
+                    outfile.write(json.dumps({"file": file}) + "\n")
+                    outfile.flush()
+            
+            # Always mark the end of the manifest so that Converter.py doesn't wait for more files.
+            finally:
+                outfile.write(json.dumps({"end": True}) + "\n")
+
+
 # Traverse a given directory for a given file type and return a dictionary of files.
 def get_import_files(self, context):
     imports = bpy.context.scene.transmogrifier_imports
@@ -848,6 +903,597 @@ def set_texture_settings(self, context):
 
 
 
+# ░█░█░█▀█░█▀▄░█░█░█▀▀░█▀▄░░░█▀█░█▀█░█▀█░█░░
+# ░█▄█░█░█░█▀▄░█▀▄░█▀▀░█▀▄░░░█▀▀░█░█░█░█░█░░
+# ░▀░▀░▀▀▀░▀░▀░▀░▀░▀▀▀░▀░▀░░░▀░░░▀▀▀░▀▀▀░▀▀▀
+
+# Split the import files of a batch conversion between a number of workers and return a settings dictionary for each worker.
+def get_worker_settings_dicts(settings_dict, worker_count, item_costs=None):
+    worker_settings_dicts = []
+
+    # Give each worker the same settings with its own index and an empty list of files for every import instance.
+    for worker_index in range(worker_count):
+        worker_settings_dict = dict(settings_dict)
+        worker_settings_dict["worker_index"] = worker_index
+        worker_settings_dict["imports"] = [dict(import_settings_dict, files=[]) for import_settings_dict in settings_dict["imports"]]
+        worker_settings_dicts.append(worker_settings_dict)
+
+    # Give the most costly file left to the worker with the least work so far so that every worker finishes at about the same time.
+    if item_costs:
+        worker_costs = [0] * worker_count
+        files = [(file, import_index) for import_index, import_settings_dict in enumerate(settings_dict["imports"]) for file in import_settings_dict["files"]]
+        for file, import_index in sorted(files, key=lambda file: item_costs[file[0]], reverse=True):
+            worker_index = worker_costs.index(min(worker_costs))
+            worker_settings_dicts[worker_index]["imports"][import_index]["files"].append(file)
+            worker_costs[worker_index] += item_costs[file]
+
+    # Deal the import files out to the workers one at a time so that each worker gets a similar share of every import instance.
+    else:
+        file_index = 0
+        for import_index, import_settings_dict in enumerate(settings_dict["imports"]):
+            for file in import_settings_dict["files"]:
+                worker_settings_dicts[file_index % worker_count]["imports"][import_index]["files"].append(file)
+                file_index += 1
+
+    # Don't start workers that have nothing to convert.
+    worker_settings_dicts = [worker_settings_dict for worker_settings_dict in worker_settings_dicts if any(import_settings_dict["files"] for import_settings_dict in worker_settings_dict["imports"])]
+
+    return worker_settings_dicts
+
+
+# Split the import files of a batch conversion into small groups of consecutive files and return a settings dictionary for each group, so that each group can be converted in its own isolated Blender process.
+def get_isolated_settings_dicts(settings_dict, group_size):
+    isolated_settings_dicts = []
+
+    for import_index, import_settings_dict in enumerate(settings_dict["imports"]):
+        files = import_settings_dict["files"]
+        for start in range(0, len(files), group_size):
+            # Give each group the same settings with its own index and only its own files.
+            isolated_settings_dict = dict(settings_dict)
+            isolated_settings_dict["worker_index"] = len(isolated_settings_dicts)
+            isolated_settings_dict["imports"] = [dict(other_import_settings_dict, files=[]) for other_import_settings_dict in settings_dict["imports"]]
+            isolated_settings_dict["imports"][import_index]["files"] = files[start:start + group_size]
+            isolated_settings_dicts.append(isolated_settings_dict)
+
+    return isolated_settings_dicts
+
+
+# Get the import files that finished converting according to a Converter journal, e.g. of a process that crashed partway through its items.
+def get_journal_finished_items(journal_file):
+    finished_items = set()
+    if not Path(journal_file).is_file():
+        return finished_items
+
+    with open(journal_file, 'r') as openfile:
+        for line in openfile:
+            # Ignore a partially written last line.
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if entry.get("event") == "item":
+                finished_items.add(entry["import_file"])
+
+    return finished_items
+
+
+# Exit code of a Converter that asks to be restarted, since Windows can't replace a running process with a new Blender process the way Linux and macOS can.
+converter_restart_exit_code = 75
+
+
+# Start Converter.py, letting it know that it can exit with the restart exit code to be restarted by the add-on.
+def start_converter_process(command, cwd):
+    return subprocess.Popen(
+        command,
+        cwd=cwd,
+        env=dict(os.environ, TRANSMOGRIFIER_RESTART_EXIT_CODE=str(converter_restart_exit_code)),
+    )
+
+
+# Start Converter.py again, resuming the batch conversion that exited with the restart exit code.
+def restart_converter_process(command, cwd):
+    command = [str(argument) for argument in command]
+    if "--" not in command:
+        command.append("--")
+    if "--resume" not in command[command.index("--"):]:
+        command.append("--resume")
+
+    return start_converter_process(command, cwd)
+
+
+# Wait for every Converter process to finish, restarting any that exit to be restarted.
+def wait_converter_processes(processes, commands, cwd):
+    processes = list(processes)
+    while True:
+        for index, process in enumerate(processes):
+            if process.poll() == converter_restart_exit_code:
+                processes[index] = restart_converter_process(commands[index], cwd)
+        if all(process.poll() is not None for process in processes):
+            return
+        time.sleep(0.5)
+
+
+# Add up the conversion counts and stage timings reported by each worker into a single report and return the list of partial summaries to merge.
+def merge_worker_reports(worker_report_jsons, converter_report_json, failed_items=None):
+    conversion_count = 0
+    stage_timings = {}
+    texture_cache = {"hits": 0, "misses": 0}
+    summary_files = []
+
+    for worker_report_json in worker_report_jsons:
+        # Skip workers that quit before reporting, e.g. after a crash.
+        if not worker_report_json.is_file():
+            continue
+
+        worker_report_dict = read_json(worker_report_json)
+        conversion_count += worker_report_dict["conversion_count"]
+        for stage, worker_stage_timing in worker_report_dict.get("stage_timings", {}).items():
+            stage_timing = stage_timings.setdefault(stage, {"count": 0, "seconds": 0})
+            stage_timing["count"] += worker_stage_timing["count"]
+            stage_timing["seconds"] += worker_stage_timing["seconds"]
+        for key, count in worker_report_dict.get("texture_cache", {}).items():
+            texture_cache[key] += count
+        if "summary_file" in worker_report_dict:
+            summary_files.append(Path(worker_report_dict["summary_file"]))
+        
+        worker_report_json.unlink()
+
+    converter_report_dict = {"conversion_count": conversion_count, "stage_timings": stage_timings, "texture_cache": texture_cache}
+    if failed_items:
+        converter_report_dict["failed"] = failed_items
+    write_json(converter_report_dict, converter_report_json)
+
+    return summary_files
+
+
+# Merge the summary CSV of each worker into a single summary CSV and copy it to each import directory.  Items that failed are added as rows marked as failed.
+def merge_worker_summaries(summary_files, settings_dict, failed_items=None):
+    summary_files = [summary_file for summary_file in summary_files if summary_file.is_file()]
+    if not summary_files and not failed_items:
+        return
+
+    # Name the merged summary after the first worker's summary without the worker suffix.
+    if summary_files:
+        summary_name = re.sub(r"_Worker_\d+$", "", summary_files[0].stem) + ".csv"
+        summary_file = summary_files[0].parent / summary_name
+
+    # If there's no summary from any worker (e.g. every process crashed, or summaries aren't saved), still save a summary of the failed items.
+    else:
+        timestamp = str(datetime.datetime.now().strftime("%Y%m%d_%H%M%S"))
+        summary_file = Path(settings_dict["imports"][0]["directory"], f"Transmogrifier_Summary_{timestamp}.csv")
+
+    with open(summary_file, 'w', newline='') as outfile:
+        csvwriter = csv.writer(outfile)
+        fields = ["Import File", "Import Format", "Export File", "Export Format"]
+
+        for index, worker_summary_file in enumerate(summary_files):
+            with open(worker_summary_file, 'r', newline='') as infile:
+                csvreader = csv.reader(infile)
+
+                # Only write the fields once.
+                worker_fields = next(csvreader, None)
+                if index == 0 and worker_fields:
+                    fields = worker_fields
+                    csvwriter.writerow(fields)
+                
+                csvwriter.writerows(csvreader)
+            
+            worker_summary_file.unlink()
+
+        if not summary_files:
+            csvwriter.writerow(fields)
+
+        # Mark the exports of failed items as failed under the fields every summary has.
+        if failed_items:
+            for failed_item in failed_items:
+                row = [""] * len(fields)
+                row[fields.index("Import File")] = Path(failed_item["import_file"]).name
+                row[fields.index("Import Format")] = failed_item["import_format"]
+                row[fields.index("Export File")] = f"Failed: {failed_item['reason']}"
+                csvwriter.writerow(row)
+
+    # Copy CSV file to each import directory.
+    if not settings_dict["link_import_settings"] and len(settings_dict["imports"]) > 1:
+        for import_settings_dict in settings_dict["imports"]:
+            directory = Path(import_settings_dict["directory"])
+            if directory == summary_file.parent:
+                continue
+            shutil.copy(summary_file, directory)
+
+
+# ░█▀█░█▀▄░█▀▀░█▀▀░█▀▀░█▀█░█▀█
+# ░█▀▀░█▀▄░█▀▀░▀▀█░█░░░█▀█░█░█
+# ░▀░░░▀░▀░▀▀▀░▀▀▀░▀▀▀░▀░▀░▀░▀
+
+# Get the triangle count of an STL file.  A binary STL stores it in its header, and an ASCII STL has one facet per triangle.
+def scan_stl(import_file):
+    size = import_file.stat().st_size
+    with open(import_file, 'rb') as openfile:
+        header = openfile.read(84)
+        if size >= 84 and 84 + 50 * struct.unpack("<I", header[80:84])[0] == size:
+            return {"triangles": struct.unpack("<I", header[80:84])[0]}
+
+        openfile.seek(0)
+        return {"triangles": sum(line.lstrip().startswith(b"facet") for line in openfile)}
+
+
+# Get the mesh, image and triangle counts of a glTF or GLB file from its JSON, without reading its binary buffers.
+def scan_gltf(import_file):
+    with open(import_file, 'rb') as openfile:
+        # A GLB is a 12 byte header followed by a JSON chunk and a binary chunk.
+        if openfile.read(4) == b"glTF":
+            openfile.seek(12)
+            chunk_length, chunk_type = struct.unpack("<II", openfile.read(8))
+            gltf = json.loads(openfile.read(chunk_length))
+        else:
+            openfile.seek(0)
+            gltf = json.load(openfile)
+
+    # Count the triangles of every triangle primitive from its indices, or its vertices if it has no indices.
+    accessors = gltf.get("accessors", [])
+    triangles = 0
+    for mesh in gltf.get("meshes", []):
+        for primitive in mesh.get("primitives", []):
+            if primitive.get("mode", 4) != 4:
+                continue
+            accessor_index = primitive.get("indices", primitive.get("attributes", {}).get("POSITION"))
+            if accessor_index is not None and accessor_index < len(accessors):
+                triangles += accessors[accessor_index].get("count", 0) // 3
+
+    return {"triangles": triangles, "meshes": len(gltf.get("meshes", [])), "images": len(gltf.get("images", []))}
+
+
+# Get the vertex and triangle counts of an OBJ file by counting its lines, without parsing its numbers.
+def scan_obj(import_file):
+    vertices = 0
+    triangles = 0
+    with open(import_file, 'rb') as openfile:
+        for line in openfile:
+            if line.startswith(b"v "):
+                vertices += 1
+            elif line.startswith(b"f "):
+                triangles += len(line.split()) - 3
+
+    return {"vertices": vertices, "triangles": triangles}
+
+
+# Get the vertex and face counts of a PLY file from its header.
+def scan_ply(import_file):
+    scan = {}
+    with open(import_file, 'rb') as openfile:
+        for line in openfile:
+            words = line.split()
+            if words[:2] == [b"element", b"vertex"]:
+                scan["vertices"] = int(words[2])
+            elif words[:2] == [b"element", b"face"]:
+                scan["triangles"] = int(words[2])
+            elif words[:1] == [b"end_header"]:
+                break
+
+    return scan
+
+
+# Get the geometry counts of a binary FBX file by walking its node headers and reading only the lengths of its vertex and polygon arrays, not the arrays themselves.
+def scan_fbx(import_file):
+    with open(import_file, 'rb') as openfile:
+        if openfile.read(21) != b"Kaydara FBX Binary  \x00":
+            return {}
+        openfile.seek(23)
+        version = struct.unpack("<I", openfile.read(4))[0]
+
+        # Node headers have 64 bit offsets from FBX 7.5.
+        node_header = struct.Struct("<QQQB" if version >= 7500 else "<IIIB")
+
+        # Read the nodes of one level of the tree, returning the name, the start of the properties, and the end of each node.
+        def read_nodes(offset):
+            nodes = []
+            while True:
+                openfile.seek(offset)
+                header = openfile.read(node_header.size)
+                if len(header) < node_header.size:
+                    return nodes
+                end_offset, property_count, property_list_length, name_length = node_header.unpack(header)
+                if end_offset == 0:
+                    return nodes
+                name = openfile.read(name_length).decode("ascii", "ignore")
+                nodes.append((name, openfile.tell(), offset + node_header.size + name_length + property_list_length, end_offset))
+                offset = end_offset
+
+        # Get the length of a node's first property if it's an array, without reading the array.
+        def read_array_length(property_offset):
+            openfile.seek(property_offset)
+            if openfile.read(1) not in [b"d", b"f", b"i", b"l", b"b"]:
+                return 0
+            return struct.unpack("<I", openfile.read(4))[0]
+
+        scan = {"version": version, "meshes": 0, "vertices": 0, "triangles": 0}
+        for name, property_offset, children_offset, end_offset in read_nodes(27):
+            if name != "Objects":
+                continue
+            for child_name, child_property_offset, child_children_offset, child_end_offset in read_nodes(children_offset):
+                if child_name != "Geometry":
+                    continue
+                scan["meshes"] += 1
+                for geometry_name, geometry_property_offset, geometry_children_offset, geometry_end_offset in read_nodes(child_children_offset):
+                    if geometry_name == "Vertices":
+                        scan["vertices"] += read_array_length(geometry_property_offset) // 3
+                    # Estimated as triangles, the most common face.
+                    elif geometry_name == "PolygonVertexIndex":
+                        scan["triangles"] += read_array_length(geometry_property_offset) // 3
+
+    return scan
+
+
+# Get the texture count and total megapixels of the textures of an import file, i.e. the images in its "textures" directory or next to it.
+def scan_textures(import_file):
+    image_extensions = [".png", ".jpg", ".jpeg", ".tga", ".exr", ".webp"]
+    textures_dir = get_textures_dir(import_file)
+    if textures_dir != import_file.parent:
+        image_files = [file for file in textures_dir.rglob("*") if file.suffix.lower() in image_extensions]
+    else:
+        image_files = [file for file in import_file.parent.iterdir() if file.suffix.lower() in image_extensions]
+
+    megapixels = 0
+    for image_file in image_files:
+        with open(image_file, 'rb') as openfile:
+            image_header = Textures.read_image_header(openfile, image_file.suffix)
+        if image_header:
+            megapixels += image_header["width"] * image_header["height"] / 1000000
+
+    return {"textures": len(image_files), "texture_megapixels": round(megapixels, 2)}
+
+
+# Get the directory an import file's textures are scanned from: its "textures" directory, or else the directory it's in.
+def get_textures_dir(import_file):
+    textures_dir = Path(import_file).parent / "textures"
+    return textures_dir if textures_dir.is_dir() else Path(import_file).parent
+
+
+# Get the modification time of an import file's textures directory, which changes when textures are added, removed or renamed.
+def get_textures_mtime_ns(import_file):
+    try:
+        return get_textures_dir(import_file).stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+# Pre-scan an import file by reading the cheap header information of its format and its textures, without starting Blender.
+def scan_import_file(import_file):
+    import_file = Path(import_file)
+    scanners = {
+        ".stl": scan_stl,
+        ".glb": scan_gltf,
+        ".gltf": scan_gltf,
+        ".obj": scan_obj,
+        ".ply": scan_ply,
+        ".fbx": scan_fbx,
+    }
+
+    stat = import_file.stat()
+    scan = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "textures_mtime_ns": get_textures_mtime_ns(import_file)}
+    try:
+        if import_file.suffix.lower() in scanners:
+            scan.update(scanners[import_file.suffix.lower()](import_file))
+        scan.update(scan_textures(import_file))
+    except (OSError, ValueError, struct.error):
+        pass
+
+    return scan
+
+
+# Get the pre-scan index of the given import files, scanning only files that are new or changed, or whose textures changed, since they were last indexed.  The index is saved as a JSON file in the Transmogrifier add-on directory.
+def get_prescan_index(files):
+    index_file = Path(__file__).parent.resolve() / "Prescan_Index.json"
+    index = read_json(index_file) if index_file.is_file() else {}
+
+    changed = False
+    for file in files:
+        try:
+            stat = os.stat(file)
+        except OSError:
+            continue
+        entry = index.get(file)
+        if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns and entry.get("textures_mtime_ns") == get_textures_mtime_ns(file):
+            continue
+        index[file] = scan_import_file(file)
+        changed = True
+
+    if changed:
+        write_json(index, index_file)
+
+    return {file: index[file] for file in files if file in index}
+
+
+# ░█▀▀░█▀▀░█░█░█▀▀░█▀▄░█░█░█░░░▀█▀░█▀█░█▀▀
+# ░▀▀█░█░░░█▀█░█▀▀░█░█░█░█░█░░░░█░░█░█░█░█
+# ░▀▀▀░▀▀▀░▀░▀░▀▀▀░▀▀░░▀▀▀░▀▀▀░▀▀▀░▀░▀░▀▀▀
+
+# Sizes of the directories walked for the current batch conversion, cleared when the next one orders its import files.
+directory_sizes = {}
+
+
+# Get the total size in bytes of the files in a directory and its subdirectories.
+def get_directory_size(directory):
+    if directory in directory_sizes:
+        return directory_sizes[directory]
+
+    size = 0
+    for root, dirs, files in os.walk(directory):
+        for file in files:
+            try:
+                size += os.path.getsize(os.path.join(root, file))
+            except OSError:
+                pass
+
+    directory_sizes[directory] = size
+    return size
+
+
+# Get the size in bytes of everything an item converts: the import file and its textures.
+def get_item_size(import_file):
+    import_file = Path(import_file)
+    size = import_file.stat().st_size if import_file.is_file() else 0
+    
+    textures_dir = import_file.parent / "textures"
+    if textures_dir.is_dir():
+        size += get_directory_size(str(textures_dir))
+
+    return size
+
+
+# Read the time each item took to convert in previous batch conversions.  The timings file is a JSON Lines file of one entry per converted item, in which later entries replace earlier ones.
+def read_item_timings(timings_file):
+    item_timings = {}
+    if not timings_file.is_file():
+        return item_timings
+
+    with open(timings_file, 'r') as openfile:
+        for line in openfile:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            item_timings[entry["import_file"]] = entry["seconds"]
+
+    return item_timings
+
+
+# Rewrite the timings file with only the latest timing of each item, so that it doesn't grow with every batch conversion.  Call it before any worker starts appending to it.
+# The compacted timings replace the file in one step, so the file is left as it was if they can't be written.
+def compact_item_timings(timings_file):
+    if not timings_file.is_file():
+        return
+
+    item_timings = read_item_timings(timings_file)
+    compacted_file = timings_file.with_name(f"{timings_file.stem}_Compacted.jsonl")
+    try:
+        with open(compacted_file, 'w') as outfile:
+            for import_file, seconds in item_timings.items():
+                outfile.write(json.dumps({"import_file": import_file, "seconds": seconds}) + "\n")
+        os.replace(compacted_file, timings_file)
+    except OSError:
+        pass
+
+
+# Estimate how long each of the given import files will take to convert.  Files converted before use their previous timing.  Other files are estimated from their pre-scanned triangles, texture megapixels and size, weighted by how long previous files with those took to convert.
+def estimate_item_seconds(files, timings_file):
+    item_timings = read_item_timings(timings_file)
+    prescan_index = get_prescan_index(files)
+    item_sizes = {file: get_item_size(file) for file in files}
+
+    # Describe each file by the pre-scanned quantities that drive conversion time.
+    def get_features(file):
+        scan = prescan_index.get(file, {})
+        return [scan.get("triangles", 0) / 1000000, scan.get("texture_megapixels", 0), item_sizes.get(file, 0) / 1000000, 1]
+
+    # Fit seconds to the features of the files timed before, or fall back to a rate per byte if too few were.
+    timed_files = [file for file in files if file in item_timings]
+    weights = None
+    if len(timed_files) >= 4:
+        weights = np.linalg.lstsq(np.array([get_features(file) for file in timed_files]), np.array([item_timings[file] for file in timed_files]), rcond=None)[0].clip(min=0)
+    timed_size = sum(item_sizes[file] for file in timed_files)
+    seconds_per_byte = sum(item_timings[file] for file in timed_files) / timed_size if timed_size else None
+
+    item_seconds = {}
+    for file in files:
+        if file in item_timings:
+            item_seconds[file] = item_timings[file]
+        elif weights is not None:
+            item_seconds[file] = float(np.dot(weights, get_features(file)))
+        elif seconds_per_byte is not None:
+            item_seconds[file] = item_sizes[file] * seconds_per_byte
+        else:
+            item_seconds[file] = None
+
+    return item_seconds
+
+
+# Estimate how long each import file will take to convert, for ordering and balancing them.  Files that can't be estimated in seconds yet are ranked by their size.
+def get_item_costs(settings_dict, timings_file):
+    files = [file for import_settings_dict in settings_dict["imports"] for file in import_settings_dict["files"]]
+    item_seconds = estimate_item_seconds(files, timings_file)
+
+    item_costs = {}
+    for file in files:
+        item_costs[file] = item_seconds[file] if item_seconds[file] is not None else get_item_size(file)
+
+    return item_costs
+
+
+# Order the import files of each import instance according to the given import order.  Return the estimated cost of every file for balancing workers with "Estimated Cost", or None otherwise.
+def order_import_files(settings_dict, import_order, timings_file):
+    # Measure import and texture directories afresh, since they may have changed since the last batch conversion.
+    directory_sizes.clear()
+
+    if import_order == "Found":
+        return None
+
+    if import_order == "Size":
+        item_costs = {file: get_item_size(file) for import_settings_dict in settings_dict["imports"] for file in import_settings_dict["files"]}
+    else:
+        item_costs = get_item_costs(settings_dict, timings_file)
+
+    # Convert the most costly files first so that they don't hold up the end of the batch conversion.
+    for import_settings_dict in settings_dict["imports"]:
+        import_settings_dict["files"] = sorted(import_settings_dict["files"], key=lambda file: item_costs[file], reverse=True)
+
+    if import_order != "Cost":
+        return None
+
+    return item_costs
+
+
+# ░█▀▀░█▀█░█▀█░█░█░█▀▀░█▀▄░▀█▀░█▀▀░█▀▄░░░█▀▀░█▀▀░█▀▄░█░█░▀█▀░█▀▀░█▀▀
+# ░█░░░█░█░█░█░▀▄▀░█▀▀░█▀▄░░█░░█▀▀░█▀▄░░░▀▀█░█▀▀░█▀▄░▀▄▀░░█░░█░░░█▀▀
+# ░▀▀▀░▀▀▀░▀░▀░░▀░░▀▀▀░▀░▀░░▀░░▀▀▀░▀░▀░░░▀▀▀░▀▀▀░▀░▀░░▀░░▀▀▀░▀▀▀░▀▀▀
+
+# Get the directory of files Transmogrifier keeps between sessions, e.g. the Converter service's access token.  It's in the User's Blender configuration rather than the add-on's directory, which may not be writable and is replaced when the add-on is updated.
+def get_user_data_dir():
+    try:
+        return Path(bpy.utils.extension_path_user(__package__, create=True))
+    except (AttributeError, ValueError):
+        return Path(bpy.utils.user_resource('CONFIG', path="transmogrifier", create=True))
+
+
+# Get the file the Converter service on a local port writes its access token to.
+def get_converter_service_token_file(port):
+    return get_user_data_dir() / f"Converter_Service_{port}.token"
+
+
+# Send a job to the Converter service listening on a local port and return its reply.  The job is sent with the service's access token, if the service has written one.
+def send_converter_service_job(port, job, timeout=None):
+    token_file = get_converter_service_token_file(port)
+    if token_file.is_file():
+        job = dict(job, token=token_file.read_text().strip())
+
+    with socket.create_connection(("127.0.0.1", port), timeout=timeout) as connection:
+        connection.sendall((json.dumps(job) + "\n").encode())
+        reply = connection.makefile("r").readline()
+
+    return json.loads(reply)
+
+
+# Check whether a local port is taken, e.g. by a Converter service that's too busy converting to answer a ping.  Binding the port is what decides whether a new service could listen on it.
+def is_port_in_use(port):
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+        try:
+            probe.bind(("127.0.0.1", port))
+        except OSError:
+            return True
+
+    return False
+
+
+# Check whether a Converter service is listening on a local port and ready for a job.  A service converting a job only answers once the job is done.
+def ping_converter_service(port):
+    try:
+        reply = send_converter_service_job(port, {"command": "ping"}, timeout=1)
+    except (OSError, ValueError):
+        return False
+    
+    return reply.get("status") == "ready"
+
+
 # ░▀▀█░█▀▀░█▀█░█▀█░░░█░█░▀█▀░▀█▀░█░░░▀█▀░▀█▀░▀█▀░█▀▀░█▀▀
 # ░░░█░▀▀█░█░█░█░█░░░█░█░░█░░░█░░█░░░░█░░░█░░░█░░█▀▀░▀▀█
 # ░▀▀░░▀▀▀░▀▀▀░▀░▀░░░▀▀▀░░▀░░▀▀▀░▀▀▀░▀▀▀░░▀░░▀▀▀░▀▀▀░▀▀▀
@@ -38,12 +38,16 @@ from bpy.props import (
 )
 import os
 import subprocess
+import threading
+import time
 import shutil
+import tempfile
 from pathlib import Path
 from bpy_extras.io_utils import ImportHelper
 import webbrowser
 import json
 from . import Functions
+from . import Textures
 
 
 
@@ -82,6 +86,7 @@ class TRANSMOGRIFIER_OT_transmogrify(Operator):
     bl_idname = "transmogrifier.transmogrify"
     bl_label = "Batch Convert"
     file_count = 0
+    item_costs = None
 
     def execute(self, context):
         settings = bpy.context.scene.transmogrifier_settings
@@ -147,6 +152,11 @@ class TRANSMOGRIFIER_OT_transmogrify(Operator):
                 self.report({'INFO'}, f"Conversion complete. {conversion_count} file was converted.")
             else:
                 self.report({'INFO'}, f"Could not convert or no items needed conversion. {conversion_count} files were converted.")
+            if "failed" in converter_report_dict:
+                self.report({'WARNING'}, f"{len(converter_report_dict['failed'])} files failed to convert. See the Conversion Summary.")
+            texture_cache = converter_report_dict.get("texture_cache", {})
+            if texture_cache.get("hits") or texture_cache.get("misses"):
+                self.report({'INFO'}, f"Texture cache: {texture_cache['hits']} hits, {texture_cache['misses']} misses.")
 
         return {'FINISHED'}
 
@@ -159,8 +169,20 @@ class TRANSMOGRIFIER_OT_transmogrify(Operator):
 
 
     def transmogrify(self, context):
+        settings = bpy.context.scene.transmogrifier_settings
+
+        # Stream import files to Converter.py as they're found, unless they need to be known up front to split them between processes or order them.
+        stream_import_files = not (settings.use_converter_service or settings.use_isolation or (settings.use_worker_pool and settings.worker_count > 1) or settings.import_order != "Found")
+
         # Create settings_dict dictionary from transmogrifier_settings to pass to write_json function later.
-        settings_dict = Functions.get_settings_dict(self, context, True, True)
+        settings_dict = Functions.get_settings_dict(self, context, True, not stream_import_files)
+        settings_dict["worker_index"] = None
+
+        # Keep the texture cache in the User's Blender configuration unless the User chose a directory for it.
+        if settings_dict["texture_cache_dir"]:
+            settings_dict["texture_cache_dir"] = str(Path(bpy.path.abspath(settings_dict["texture_cache_dir"])).resolve())
+        else:
+            settings_dict["texture_cache_dir"] = str(Functions.get_user_data_dir() / "Texture_Cache")
 
         # Create path to blender.exe
         blender_dir = bpy.app.binary_path
@@ -174,27 +196,268 @@ class TRANSMOGRIFIER_OT_transmogrify(Operator):
         # Create path to Transmogrifier directory
         transmogrifier_dir = Path(__file__).parent.resolve()
 
+        # Point each import instance to an empty manifest that its files will be streamed to.  The manifests are kept in a temporary directory of this batch conversion, so that batch conversions running at the same time don't overwrite each other's.
+        # Converter.py stops waiting for more files if this Blender process quits before the end of a manifest is written.
+        manifest_files = []
+        manifest_dir = None
+        if stream_import_files:
+            manifest_dir = Path(tempfile.mkdtemp(prefix="Transmogrifier_Import_Files_"))
+            for index, import_settings_dict in enumerate(settings_dict["imports"]):
+                manifest_file = manifest_dir / f"Import_Files_{index}.jsonl"
+                open(manifest_file, 'w').close()
+                import_settings_dict["files_manifest"] = str(manifest_file)
+                import_settings_dict["files_manifest_writer"] = os.getpid()
+                manifest_files.append(manifest_file)
+
+        # Keep only the latest timing of each item before the workers record new ones.
+        Functions.compact_item_timings(transmogrifier_dir / "Converter_Timings.jsonl")
+
+        # Order the import files by their estimated cost if requested by User.
+        self.item_costs = Functions.order_import_files(settings_dict, settings.import_order, transmogrifier_dir / "Converter_Timings.jsonl")
+
         # Write settings to JSON file.
         settings_json = Path(__file__).parent.resolve() / "Settings.json"
         Functions.write_json(settings_dict, settings_json)
 
 
-        # Run Converter.py
-        subprocess.call(
-            [
-                blender_dir,
-                converter_blend,
-                "--python",
-                converter_py,
-            ],
-            cwd=transmogrifier_dir
-        ) 
+        # Command to run Converter.py, without a user interface if requested by User.
+        converter_command = [blender_dir, converter_blend, "--python", converter_py]
+        if settings.use_background_mode:
+            converter_command.insert(1, "--background")
+
+
+        # Run Converter.py as a job of the Converter service if requested by User.
+        if settings.use_converter_service:
+            if not self.transmogrify_service(context, settings_dict, converter_command, transmogrifier_dir):
+                return
+
+        # Run Converter.py in an isolated process for each item or group of items if requested by User.
+        elif settings.use_isolation:
+            self.transmogrify_isolated(context, settings_dict, converter_command, transmogrifier_dir)
+
+        # Run Converter.py in a pool of workers if requested by User.
+        elif settings.use_worker_pool and settings.worker_count > 1:
+            self.transmogrify_worker_pool(context, settings_dict, converter_command, transmogrifier_dir)
+
+        # Run Converter.py, finding the import files while it converts the files found so far.
+        else:
+            # Find the import files in a thread so that walking the import directories doesn't block Blender.  Only files that existed before the Converter started are listed.
+            started = time.time()
+            process = Functions.start_converter_process(converter_command, transmogrifier_dir)
+            if stream_import_files:
+                import_sources, excluded_dirs = Functions.get_import_files_sources(settings_dict)
+                thread = threading.Thread(target=Functions.write_import_files_manifests, args=(import_sources, manifest_files, excluded_dirs, started), daemon=True)
+                thread.start()
+            Functions.wait_converter_processes([process], [converter_command], transmogrifier_dir)
+            if stream_import_files:
+                thread.join()
+
+            # Clean up the manifests.
+            if manifest_dir:
+                shutil.rmtree(manifest_dir, ignore_errors=True)
         
 
         print("Conversion Complete")
         self.file_count += 1
 
 
+    def transmogrify_service(self, context, settings_dict, converter_command, transmogrifier_dir):
+        settings = bpy.context.scene.transmogrifier_settings
+        port = settings.converter_service_port
+
+        # Start the Converter service if it isn't already running, then wait for it to be ready.  A service busy with another job doesn't answer pings but still holds its port, and takes this job once it's done.
+        if not Functions.ping_converter_service(port) and not Functions.is_port_in_use(port):
+            subprocess.Popen(
+                converter_command + [
+                    "--",
+                    "--serve",
+                    str(port),
+                    "--token-file",
+                    str(Functions.get_converter_service_token_file(port)),
+                ],
+                cwd=transmogrifier_dir
+            )
+            for attempt in range(600):
+                if Functions.ping_converter_service(port):
+                    break
+                time.sleep(0.1)
+
+        # Send the batch conversion to the Converter service and wait for it to finish.
+        try:
+            reply = Functions.send_converter_service_job(port, {"settings": settings_dict})
+        except OSError:
+            self.report({'ERROR'}, f"Could not reach Converter service on port {port}")
+            return False
+
+        # A service started by someone else, or from a terminal with another token file, doesn't run this job.
+        if reply.get("status") == "unauthorized":
+            self.report({'ERROR'}, f"Converter service on port {port} rejected the job's access token")
+            return False
+
+        return True
+
+
+    def transmogrify_worker_pool(self, context, settings_dict, converter_command, transmogrifier_dir):
+        settings = bpy.context.scene.transmogrifier_settings
+
+        # Split the import files between the workers.
+        worker_settings_dicts = Functions.get_worker_settings_dicts(settings_dict, settings.worker_count, self.item_costs)
+
+        # Write settings of each worker to its own JSON file and start a Blender process for each without waiting for the others.
+        processes = []
+        worker_commands = []
+        worker_report_jsons = []
+        for worker_settings_dict in worker_settings_dicts:
+            worker_index = worker_settings_dict["worker_index"]
+            worker_settings_json = transmogrifier_dir / f"Settings_Worker_{worker_index}.json"
+            Functions.write_json(worker_settings_dict, worker_settings_json)
+
+            # Remove a report left over from a previous batch so it isn't counted again.
+            worker_report_json = transmogrifier_dir / f"Converter_Report_Worker_{worker_index}.json"
+            if worker_report_json.is_file():
+                worker_report_json.unlink()
+            worker_report_jsons.append(worker_report_json)
+
+            worker_command = converter_command + [
+                "--",
+                "--settings",
+                worker_settings_json,
+            ]
+            processes.append(Functions.start_converter_process(worker_command, transmogrifier_dir))
+            worker_commands.append(worker_command)
+
+        # Wait for every worker to finish.
+        Functions.wait_converter_processes(processes, worker_commands, transmogrifier_dir)
+
+        # Merge the workers' reports and summaries.
+        converter_report_json = transmogrifier_dir / "Converter_Report.json"
+        summary_files = Functions.merge_worker_reports(worker_report_jsons, converter_report_json)
+        Functions.merge_worker_summaries(summary_files, settings_dict)
+
+        # Clean up the workers' settings.
+        for worker_settings_dict in worker_settings_dicts:
+            worker_settings_json = transmogrifier_dir / f"Settings_Worker_{worker_settings_dict['worker_index']}.json"
+            if worker_settings_json.is_file():
+                worker_settings_json.unlink()
+
+
+    def transmogrify_isolated(self, context, settings_dict, converter_command, transmogrifier_dir):
+        settings = bpy.context.scene.transmogrifier_settings
+
+        # Split the import files into small groups, each converted by its own Blender process.  Run as many processes at a time as there are workers.
+        pending_settings_dicts = Functions.get_isolated_settings_dicts(settings_dict, settings.isolation_group_size)
+        if self.item_costs:
+            pending_settings_dicts.sort(key=lambda isolated_settings_dict: sum(self.item_costs[file] for import_settings_dict in isolated_settings_dict["imports"] for file in import_settings_dict["files"]), reverse=True)
+        isolated_settings_dicts = list(pending_settings_dicts)
+        process_count = settings.worker_count if settings.use_worker_pool else 1
+        timeout = settings.isolation_timeout
+        memory_limit = settings.isolation_memory_limit * 1024 ** 3
+
+        running = []
+        worker_report_jsons = []
+        failed_items = []
+        while pending_settings_dicts or running:
+            # Start processes until as many are running as allowed.
+            while pending_settings_dicts and len(running) < process_count:
+                isolated_settings_dict = pending_settings_dicts.pop(0)
+                worker_index = isolated_settings_dict["worker_index"]
+                worker_settings_json = transmogrifier_dir / f"Settings_Worker_{worker_index}.json"
+                Functions.write_json(isolated_settings_dict, worker_settings_json)
+
+                # Remove a report left over from a previous batch so it isn't counted again.
+                worker_report_json = transmogrifier_dir / f"Converter_Report_Worker_{worker_index}.json"
+                if worker_report_json.is_file():
+                    worker_report_json.unlink()
+                worker_report_jsons.append(worker_report_json)
+
+                # Likewise remove a journal left over from a previous batch, so that only items this process finishes count as finished.
+                (transmogrifier_dir / f"Converter_Journal_Worker_{worker_index}.jsonl").unlink(missing_ok=True)
+
+                process = Functions.start_converter_process(
+                    converter_command + [
+                        "--",
+                        "--settings",
+                        worker_settings_json,
+                    ],
+                    transmogrifier_dir
+                )
+                running.append((process, isolated_settings_dict, worker_report_json, time.monotonic()))
+
+            time.sleep(0.5)
+
+            # Kill processes that take too long or use too much memory, and mark the items of processes that didn't finish as failed.
+            for process, isolated_settings_dict, worker_report_json, start_time in list(running):
+                # Restart a process that exits to be restarted on Windows, keeping its time so far towards the timeout.
+                if process.poll() == Functions.converter_restart_exit_code:
+                    worker_settings_json = transmogrifier_dir / f"Settings_Worker_{isolated_settings_dict['worker_index']}.json"
+                    restarted_process = Functions.restart_converter_process(converter_command + ["--", "--settings", worker_settings_json], transmogrifier_dir)
+                    running[running.index((process, isolated_settings_dict, worker_report_json, start_time))] = (restarted_process, isolated_settings_dict, worker_report_json, start_time)
+                    continue
+
+                reason = None
+                if process.poll() is not None:
+                    if not worker_report_json.is_file():
+                        reason = f"Crashed (exit code {process.returncode})"
+                elif timeout and time.monotonic() - start_time > timeout:
+                    reason = f"Timed out after {timeout} seconds"
+                elif memory_limit and Textures.get_process_memory(process.pid) > memory_limit:
+                    reason = f"Exceeded memory limit of {settings.isolation_memory_limit} GB"
+                else:
+                    continue
+
+                if process.poll() is None:
+                    process.kill()
+                    process.wait()
+
+                # Only mark the items that the process didn't finish as failed.
+                if reason:
+                    finished_items = Functions.get_journal_finished_items(transmogrifier_dir / f"Converter_Journal_Worker_{isolated_settings_dict['worker_index']}.jsonl")
+                    for import_settings_dict in isolated_settings_dict["imports"]:
+                        for file in import_settings_dict["files"]:
+                            if str(Path(file)) in finished_items:
+                                continue
+                            failed_items.append({"import_file": file, "import_format": import_settings_dict["name"], "reason": reason})
+                    print(f"Could not convert isolated item(s): {reason}")
+
+                running.remove((process, isolated_settings_dict, worker_report_json, start_time))
+
+        # Merge the reports and summaries of every process.
+        converter_report_json = transmogrifier_dir / "Converter_Report.json"
+        summary_files = Functions.merge_worker_reports(worker_report_jsons, converter_report_json, failed_items)
+        Functions.merge_worker_summaries(summary_files, settings_dict, failed_items)
+
+        # Clean up the settings of every process.
+        for isolated_settings_dict in isolated_settings_dicts:
+            worker_settings_json = transmogrifier_dir / f"Settings_Worker_{isolated_settings_dict['worker_index']}.json"
+            if worker_settings_json.is_file():
+                worker_settings_json.unlink()
+
+
+# Stop the Converter service so that its Blender process quits.
+class TRANSMOGRIFIER_OT_stop_converter_service(Operator):
+    """Stop the Converter service and quit its Blender process"""
+    bl_idname = "transmogrifier.stop_converter_service"
+    bl_label = "Stop Converter Service"
+
+    def execute(self, context):
+        settings = bpy.context.scene.transmogrifier_settings
+        port = settings.converter_service_port
+
+        if not Functions.ping_converter_service(port):
+            if not Functions.is_port_in_use(port):
+                self.report({'INFO'}, f"No Converter service is running on port {port}")
+                return {'FINISHED'}
+
+            # A busy service only reads the stop command after its current job, so send it without waiting.
+            threading.Thread(target=Functions.send_converter_service_job, args=(port, {"command": "stop"}), daemon=True).start()
+            self.report({'INFO'}, "Converter service is busy and will stop after its current job")
+            return {'FINISHED'}
+
+        Functions.send_converter_service_job(port, {"command": "stop"}, timeout=5)
+        self.report({'INFO'}, "Stopped Converter service")
+        return {'FINISHED'}
+
+
 class TRANSMOGRIFIER_OT_forecast(Operator):
     """Calculate batch conversion and display info message of the forecast"""
     bl_idname = "transmogrifier.forecast"
@@ -246,6 +509,19 @@ class TRANSMOGRIFIER_OT_forecast(Operator):
         # Info message.
         message = f"{imports_string}  ⇒  {exports_string}"
 
+        # Estimate triangles, texture megapixels and conversion time from the pre-scan index of the import files.
+        files = [file for files in import_files_dict.values() for file in files]
+        prescan_index = Functions.get_prescan_index(files)
+        triangles = sum(scan.get("triangles", 0) for scan in prescan_index.values())
+        texture_megapixels = sum(scan.get("texture_megapixels", 0) for scan in prescan_index.values())
+        message += f"  |  ~{triangles:,} tris, ~{round(texture_megapixels):,} MP textures"
+
+        # Only forecast time once there are previous conversions to learn from.
+        item_seconds = Functions.estimate_item_seconds(files, Path(__file__).parent.resolve() / "Converter_Timings.jsonl")
+        if files and None not in item_seconds.values():
+            minutes = sum(item_seconds.values()) / 60
+            message += f", ~{minutes:.0f} min" if minutes >= 1 else ", <1 min"
+
         # Report message.
         self.popup_message(context, message=message, title="Forecast", icon='INFO')
         self.report({'INFO'}, message)
@@ -649,6 +925,7 @@ class TRANSMOGRIFIER_OT_remove_custom_script(Operator):
 classes = (
     TRANSMOGRIFIER_OT_help,
     TRANSMOGRIFIER_OT_transmogrify,
+    TRANSMOGRIFIER_OT_stop_converter_service,
     TRANSMOGRIFIER_OT_forecast,
     TRANSMOGRIFIER_OT_install_presets,
     TRANSMOGRIFIER_OT_add_preset,
@@ -761,6 +761,7 @@ class TRANSMOGRIFIER_PG_TransmogrifierSettings(PropertyGroup):
             ("Materials", 'Materials', "Record the number and names of materials applied to each exported model.", "MATERIAL", 32),
             ("Textures", 'Textures', "Record the number and names of the textures applied to each exported model.", "TEXTURE", 64),
             ("File Path", 'File Path', "Record the file path of each exported model.", "NETWORK_DRIVE", 128),
+            ("Memory", 'Memory', "Record how much memory Blender uses after each model is exported.", "MEMORY", 256),
         ],
         description="Filter additional properties to document in the log summary CSV.\nImport file + format, export file + format will always be recorded",
         default={
@@ -827,6 +828,165 @@ class TRANSMOGRIFIER_PG_TransmogrifierSettings(PropertyGroup):
         soft_max=10000.0,
         step=100,
     )
+    # Run Blender without a user interface while converting.
+    use_background_mode: BoolProperty(
+        name="Background Mode",
+        description="Convert in Blender's background mode, without opening a window. Starts faster, uses less memory and works on computers without a display. Asset previews are not generated in background mode",
+        default=False,
+    )
+    # Order in which to convert import files.
+    import_order: EnumProperty(
+        name="Order",
+        description="Order in which to convert import files",
+        items=[
+            ("Found", "As Found", "Convert import files in the order they are found in the import directories", 0),
+            ("Size", "Largest First", "Convert the largest import files, including their textures, first", 1),
+            ("Cost", "Estimated Cost", "Convert the import files estimated to take longest first. Files are estimated by how long they took to convert before, or by their size otherwise. With Worker Pool, files are also split so that every worker finishes at about the same time", 2),
+        ],
+        default="Found",
+    )
+    # Reuse data shared between blend files.
+    use_cached_append: BoolProperty(
+        name="Cached Append",
+        description="When importing blend files, link their objects and make only the objects and their meshes local. Materials, node groups and images stay linked to their library, so data shared between blend files is read once and reused for the whole batch instead of being appended again for every item. Linked materials can't be edited, e.g. by Edit Textures",
+        default=False,
+    )
+    # Reset the scene between items in bulk.
+    use_fast_reset: BoolProperty(
+        name="Fast Reset",
+        description="Clear the scene between items by removing all objects, collections, materials and images in one batch and purging orphaned data through the data API, instead of removing them one at a time and purging through the Outliner operator. Faster on heavy scenes and keeps memory from fragmenting over long batches",
+        default=False,
+    )
+    # Stage textures without duplicating their data.
+    use_linked_textures: BoolProperty(
+        name="Link Textures",
+        description="Stage textures in temporary textures directories as reflinks or hard links to the original textures instead of copies, where the file system supports it. A texture only gets its own copy when it's resized, so the original textures are never changed",
+        default=False,
+    )
+    # Reuse textures resized or reformatted the same way before.
+    use_texture_cache: BoolProperty(
+        name="Texture Cache",
+        description="Keep every resized or reformatted texture in a cache directory. The same texture resized or reformatted the same way again, by another item or another batch conversion, is taken from the cache instead of being processed by Blender again",
+        default=False,
+    )
+    # Location of the texture cache.
+    texture_cache_dir: StringProperty(
+        name="Cache Directory",
+        description="Directory to keep the texture cache in. Leave empty to keep it in Transmogrifier's directory of your Blender user configuration, where it's kept when the add-on is updated or reinstalled",
+        default="",
+        subtype='DIR_PATH',
+    )
+    # Size limit of the texture cache.
+    texture_cache_size: FloatProperty(
+        name="Cache Size (GB)",
+        description="Delete the least recently used textures from the texture cache when it grows larger than this",
+        default=10,
+        min=0.1,
+        soft_max=1000,
+    )
+    # Edit textures outside Blender in parallel.
+    use_texture_pool: BoolProperty(
+        name="Texture Pool",
+        description="Resize and reformat textures for Edit Textures in a pool of Python processes outside Blender, using every processor core, instead of one at a time inside Blender. Requires Pillow to be installed for Blender's Python. Textures the pool can't process (e.g. EXR, HDR or 16-bit images) are still edited by Blender",
+        default=False,
+    )
+    # Number of processes in the texture pool.
+    texture_pool_workers: IntProperty(
+        name="Processes",
+        description="Number of processes editing textures in parallel. 0 is one per processor core",
+        default=0,
+        min=0,
+        soft_max=64,
+    )
+    # Build the materials of the Custom textures source once per batch.
+    use_shared_custom_materials: BoolProperty(
+        name="Share Custom Materials",
+        description="When textures come from a Custom directory, build its materials and images once per batch conversion and assign the same materials to every item, instead of copying the textures and building the materials again for each item. Items only get their own copy of the textures if Keep Temporary Textures is enabled. Doesn't apply when auto-optimizing files or marking assets, which change or archive each item's own textures",
+        default=False,
+    )
+    # Skip exports whose inputs and settings are unchanged since they were last converted.
+    use_manifest: BoolProperty(
+        name="Skip Unchanged",
+        description="Keep a manifest in each export directory of the files and settings each export was converted from, and only convert exports whose import file, textures or settings changed since. Takes precedence over Overwrite Files",
+        default=False,
+    )
+    # Resume an interrupted batch conversion.
+    use_resume: BoolProperty(
+        name="Resume",
+        description="Resume the last batch conversion if it was interrupted, e.g. by Blender crashing, skipping the items that already finished. Every finished item and export is recorded in a journal as soon as it finishes",
+        default=False,
+    )
+    # Restart Blender when it uses too much memory.
+    use_memory_watermark: BoolProperty(
+        name="Memory Watermark",
+        description="Check how much memory Blender uses after each item. When it uses more than the watermark, record progress in the journal and continue the rest of the batch conversion in a new Blender process, so that long batch conversions run at constant memory",
+        default=False,
+    )
+    # Memory after which Blender is restarted.
+    memory_watermark: FloatProperty(
+        name="Watermark (GB)",
+        description="Restart Blender after an item when it uses more than this much memory",
+        default=8,
+        min=0.5,
+        soft_max=64,
+    )
+    # Convert each item in its own Blender process.
+    use_isolation: BoolProperty(
+        name="Isolate Items",
+        description="Convert each item, or small group of items, in its own Blender process. A process that crashes, takes too long or uses too much memory is stopped and its items are marked as failed in the Conversion Summary, while the rest of the batch continues",
+        default=False,
+    )
+    # Number of items converted by each isolated Blender process.
+    isolation_group_size: IntProperty(
+        name="Items per Process",
+        description="Number of items converted by each isolated Blender process. Larger groups start Blender less often, but a failure stops more items",
+        default=1,
+        min=1,
+        soft_max=100,
+    )
+    # Time each isolated Blender process is allowed to run.
+    isolation_timeout: IntProperty(
+        name="Timeout (s)",
+        description="Stop an isolated Blender process that runs for longer than this many seconds. 0 is no limit",
+        default=600,
+        min=0,
+    )
+    # Memory each isolated Blender process is allowed to use.
+    isolation_memory_limit: FloatProperty(
+        name="Memory Limit (GB)",
+        description="Stop an isolated Blender process that uses more than this much memory. 0 is no limit",
+        default=0,
+        min=0,
+        soft_max=64,
+    )
+    # Convert with a pool of Blender processes working in parallel.
+    use_worker_pool: BoolProperty(
+        name="Worker Pool",
+        description="Split the import files between multiple Blender processes that convert them in parallel. Each worker saves its own log, and the summaries of all workers are merged into one",
+        default=False,
+    )
+    # Number of Blender processes in the worker pool.
+    worker_count: IntProperty(
+        name="Workers",
+        description="Number of Blender processes to convert with in parallel. Every worker holds its own models and textures in memory",
+        default=2,
+        min=1,
+        soft_max=32,
+    )
+    # Keep a Blender process open between batch conversions.
+    use_converter_service: BoolProperty(
+        name="Converter Service",
+        description="Convert with a Blender process that stays open between batch conversions instead of starting a new one each time. The service is started automatically with the first batch conversion",
+        default=False,
+    )
+    # Local port the Converter service listens on.
+    converter_service_port: IntProperty(
+        name="Port",
+        description="Local port the Converter service listens on for batch conversion jobs",
+        default=52525,
+        min=1024,
+        max=65535,
+    )
 
 
 # Adapted from Bystedts Blender Baker (GPL-3.0 License, https://3dbystedt.gumroad.com/l/JAqLT), bake_passes.py
@@ -900,6 +1060,16 @@ class TRANSMOGRIFIER_PG_TransmogrifierImports(PropertyGroup):
         default="bpy.ops.import_scene.fbx(**",
     )
 
+    importer: EnumProperty(
+        name="Importer",
+        description="How to import files of geometry-only formats",
+        items=[
+            ("Operator", "Blender", "Import with Blender's import operator and preset", 1),
+            ("Fast", "Fast", "Read vertices and faces directly with NumPy, which is much faster for large files. Only geometry is imported: UVs, normals, colors, materials and separate objects are not, and preset options other than scale are ignored. Falls back to Blender's import operator for files the fast importer can't read", 2),
+        ],
+        default="Operator",
+    )
+
     options: StringProperty(
         name="Options",
         description="Dictionary of import operator options from preset",
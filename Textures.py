@@ -0,0 +1,366 @@
+#  █████       █████   █████████  ██████████ ██████   █████  █████████  ██████████
+# ░░███       ░░███   ███░░░░░███░░███░░░░░█░░██████ ░░███  ███░░░░░███░░███░░░░░█
+#  ░███        ░███  ███     ░░░  ░███  █ ░  ░███░███ ░███ ░███    ░░░  ░███  █ ░ 
+#  ░███        ░███ ░███          ░██████    ░███░░███░███ ░░█████████  ░██████   
+#  ░███        ░███ ░███          ░███░░█    ░███ ░░██████  ░░░░░░░░███ ░███░░█   
+#  ░███      █ ░███ ░░███     ███ ░███ ░   █ ░███  ░░█████  ███    ░███ ░███ ░   █
+#  ███████████ █████ ░░█████████  ██████████ █████  ░░█████░░█████████  ██████████
+# ░░░░░░░░░░░ ░░░░░   ░░░░░░░░░  ░░░░░░░░░░ ░░░░░    ░░░░░  ░░░░░░░░░  ░░░░░░░░░░ 
+
+##### BEGIN GPL LICENSE BLOCK #####
+
+# This program is free software: you can redistribute it and/or modify it under the terms of the GNU General Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License along with this program. If not, see <https://www.gnu.org/licenses/>. 
+
+##### END GPL LICENSE BLOCK #####
+
+
+
+#  █████       █████ ███████████  ███████████     █████████   ███████████   █████ ██████████  █████████ 
+# ░░███       ░░███ ░░███░░░░░███░░███░░░░░███   ███░░░░░███ ░░███░░░░░███ ░░███ ░░███░░░░░█ ███░░░░░███
+#  ░███        ░███  ░███    ░███ ░███    ░███  ░███    ░███  ░███    ░███  ░███  ░███  █ ░ ░███    ░░░ 
+#  ░███        ░███  ░██████████  ░██████████   ░███████████  ░██████████   ░███  ░██████   ░░█████████ 
+#  ░███        ░███  ░███░░░░░███ ░███░░░░░███  ░███░░░░░███  ░███░░░░░███  ░███  ░███░░█    ░░░░░░░░███
+#  ░███      █ ░███  ░███    ░███ ░███    ░███  ░███    ░███  ░███    ░███  ░███  ░███ ░   █ ███    ░███
+#  ███████████ █████ ███████████  █████   █████ █████   █████ █████   █████ █████ ██████████░░█████████ 
+# ░░░░░░░░░░░ ░░░░░ ░░░░░░░░░░░  ░░░░░   ░░░░░ ░░░░░   ░░░░░ ░░░░░   ░░░░░ ░░░░░ ░░░░░░░░░░  ░░░░░░░░░  
+
+import os
+import sys
+import json
+import struct
+import subprocess
+import argparse
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+
+
+#  ███████████ █████  █████ ██████   █████   █████████  ███████████ █████    ███████    ██████   █████  █████████ 
+# ░░███░░░░░░█░░███  ░░███ ░░██████ ░░███   ███░░░░░███░█░░░███░░░█░░███   ███░░░░░███ ░░██████ ░░███  ███░░░░░███
+#  ░███   █ ░  ░███   ░███  ░███░███ ░███  ███     ░░░ ░   ░███  ░  ░███  ███     ░░███ ░███░███ ░███ ░███    ░░░ 
+#  ░███████    ░███   ░███  ░███░░███░███ ░███             ░███     ░███ ░███      ░███ ░███░░███░███ ░░█████████ 
+#  ░███░░░█    ░███   ░███  ░███ ░░██████ ░███             ░███     ░███ ░███      ░███ ░███ ░░██████  ░░░░░░░░███
+#  ░███  ░     ░███   ░███  ░███  ░░█████ ░░███     ███    ░███     ░███ ░░███     ███  ░███  ░░█████  ███    ░███
+#  █████       ░░████████   █████  ░░█████ ░░█████████     █████    █████ ░░░███████░   █████  ░░█████░░█████████ 
+# ░░░░░         ░░░░░░░░   ░░░░░    ░░░░░   ░░░░░░░░░     ░░░░░    ░░░░░    ░░░░░░░    ░░░░░    ░░░░░  ░░░░░░░░░  
+
+
+# Texture formats that can be written outside Blender, by their name in Blender and in Pillow.
+pillow_formats = {
+    "BMP": "BMP",
+    "PNG": "PNG",
+    "JPEG": "JPEG",
+    "TARGA": "TGA",
+    "TIFF": "TIFF",
+    "WEBP": "WEBP",
+}
+
+# Image extensions that can be read outside Blender, by their texture format in Blender.
+pillow_extensions = {
+    ".bmp": "BMP",
+    ".png": "PNG",
+    ".jpg": "JPEG",
+    ".jpeg": "JPEG",
+    ".tga": "TARGA",
+    ".tif": "TIFF",
+    ".tiff": "TIFF",
+    ".webp": "WEBP",
+}
+
+# Image modes that can be resized and written as 8-bit textures.  Other modes (e.g. 16-bit and float) are left to Blender.
+pillow_modes = ["1", "L", "LA", "P", "RGB", "RGBA"]
+
+
+# Read the header of a PNG: width, height, bit depth and color type from the IHDR chunk.
+def read_png_header(openfile):
+    header = openfile.read(33)
+    if len(header) < 26 or not header.startswith(b"\x89PNG\r\n\x1a\n"):
+        return None
+    width, height, bit_depth, color_type = struct.unpack(">IIBB", header[16:26])
+    channels = {0: 1, 2: 3, 3: 3, 4: 2, 6: 4}.get(color_type, 0)
+
+    return {"width": width, "height": height, "channels": channels, "bit_depth": bit_depth}
+
+
+# Read the header of a JPEG: precision, height, width and components from the first start of frame segment.
+def read_jpeg_header(openfile):
+    if openfile.read(2) != b"\xff\xd8":
+        return None
+    while True:
+        marker = openfile.read(2)
+        if len(marker) < 2 or marker[0] != 0xFF:
+            return None
+        if marker[1] == 0x01 or 0xD0 <= marker[1] <= 0xD8:
+            continue
+        length = struct.unpack(">H", openfile.read(2))[0]
+        if 0xC0 <= marker[1] <= 0xCF and marker[1] not in [0xC4, 0xC8, 0xCC]:
+            bit_depth, height, width, channels = struct.unpack(">BHHB", openfile.read(6))
+            return {"width": width, "height": height, "channels": channels, "bit_depth": bit_depth}
+        openfile.seek(length - 2, 1)
+
+
+# Read the header of a TGA.  TGA has no signature, so only read files known to be TGA.
+def read_tga_header(openfile):
+    header = openfile.read(18)
+    if len(header) < 18:
+        return None
+    image_type = header[2]
+    width, height, pixel_depth = struct.unpack("<HHB", header[12:17])
+    if image_type in [1, 9]:
+        channels = 4 if header[7] == 32 else 3  # Color-mapped, by the depth of the color map.
+    elif image_type in [2, 10]:
+        channels = 4 if pixel_depth == 32 or header[17] & 0x0F else 3
+    elif image_type in [3, 11]:
+        channels = 1
+    else:
+        return None
+
+    return {"width": width, "height": height, "channels": channels, "bit_depth": 8}
+
+
+# Read the header of an OpenEXR: the data window and channel list attributes.  Bit depth is 16 for half float and 32 for float and unsigned int channels.
+def read_exr_header(openfile):
+    if openfile.read(8)[:4] != b"\x76\x2f\x31\x01":
+        return None
+
+    def read_string():
+        characters = bytearray()
+        while True:
+            character = openfile.read(1)
+            if not character or character == b"\x00":
+                return characters.decode("ascii", "ignore")
+            characters += character
+
+    header = {}
+    while True:
+        name = read_string()
+        if not name:
+            break
+        read_string()  # Attribute type.
+        size = struct.unpack("<I", openfile.read(4))[0]
+        value = openfile.read(size)
+        if name == "dataWindow":
+            x_min, y_min, x_max, y_max = struct.unpack("<iiii", value)
+            header["width"] = x_max - x_min + 1
+            header["height"] = y_max - y_min + 1
+        elif name == "channels":
+            # Each channel is a null-terminated name followed by 16 bytes, the first 4 being its pixel type.
+            pixel_types = []
+            offset = 0
+            while offset < len(value) and value[offset] != 0:
+                offset = value.index(b"\x00", offset) + 1
+                pixel_types.append(struct.unpack("<i", value[offset:offset + 4])[0])
+                offset += 16
+            header["channels"] = len(pixel_types)
+            header["bit_depth"] = 16 if pixel_types and all(pixel_type == 1 for pixel_type in pixel_types) else 32
+
+    if "width" not in header:
+        return None
+    header.setdefault("channels", 0)
+    header.setdefault("bit_depth", 32)
+
+    return header
+
+
+# Read the header of a WebP: the canvas of an extended WebP, or the frame header of a lossy or lossless WebP.
+def read_webp_header(openfile):
+    header = openfile.read(30)
+    if len(header) < 30 or header[:4] != b"RIFF" or header[8:12] != b"WEBP":
+        return None
+    chunk = header[12:16]
+    if chunk == b"VP8X":
+        width = int.from_bytes(header[24:27], "little") + 1
+        height = int.from_bytes(header[27:30], "little") + 1
+        channels = 4 if header[20] & 0x10 else 3
+    elif chunk == b"VP8 ":
+        width, height = struct.unpack("<HH", header[26:30])
+        width, height, channels = width & 0x3FFF, height & 0x3FFF, 3
+    elif chunk == b"VP8L":
+        bits = struct.unpack("<I", header[21:25])[0]
+        width, height = (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+        channels = 4 if bits >> 28 & 1 else 3
+    else:
+        return None
+
+    return {"width": width, "height": height, "channels": channels, "bit_depth": 8}
+
+
+# Read the width, height, channel count and bit depth of an image from its header only, without decoding its pixels.
+# Works on an open image file or the bytes of a packed image wrapped in io.BytesIO.  The extension identifies TGA images, which have no signature.  Returns None for images whose header can't be read.
+def read_image_header(openfile, extension=""):
+    try:
+        if extension.lower() in [".tga", ".targa"]:
+            return read_tga_header(openfile)
+
+        signature = openfile.read(12)
+        openfile.seek(-len(signature), 1)
+        if signature.startswith(b"\x89PNG"):
+            return read_png_header(openfile)
+        if signature.startswith(b"\xff\xd8"):
+            return read_jpeg_header(openfile)
+        if signature.startswith(b"\x76\x2f\x31\x01"):
+            return read_exr_header(openfile)
+        if signature.startswith(b"RIFF") and signature[8:12] == b"WEBP":
+            return read_webp_header(openfile)
+
+    except (OSError, ValueError, struct.error):
+        pass
+
+    return None
+
+
+# Resize and/or reformat a single texture with Pillow.  Runs in a process of the texture pool.
+def process_texture(job):
+    from PIL import Image
+
+    file = Path(job["file"])
+    output_file = Path(job["output_file"])
+    texture_format = job["format"] or pillow_extensions[file.suffix.lower()]
+
+    with Image.open(file) as image:
+        if image.mode not in pillow_modes:
+            return {"file": str(file), "error": f"Unsupported image mode: {image.mode}"}
+        image.load()
+
+        # Resize to a square of the resolution if the width is larger, the same as Blender's resize_textures(), with the same box filter Blender scales images down with.  Never upscale.
+        width, height = image.size
+        if image.mode in ["1", "P"]:
+            image = image.convert("RGBA" if "transparency" in image.info else "RGB")
+        if job["resolution"] and width > job["resolution"]:
+            image = image.resize((job["resolution"], job["resolution"]), Image.BOX)
+
+        # Formats without an alpha channel drop it, the same as Blender saving an RGB image.  Alpha stays straight, i.e. not premultiplied, the same as Blender's 8-bit formats.
+        if pillow_formats[texture_format] in ["JPEG", "BMP"] and image.mode in ["LA", "RGBA"]:
+            image = image.convert("RGB")
+
+        # Write under a temporary name first, so that a texture staged as a hard link is replaced instead of written through to the original.
+        options = {"quality": job["quality"]} if pillow_formats[texture_format] in ["JPEG", "WEBP"] else {}
+        output_file_temp = output_file.with_name(f"{output_file.name}.{os.getpid()}.tmp")
+        image.save(output_file_temp, format=pillow_formats[texture_format], **options)
+        os.replace(output_file_temp, output_file)
+
+        return {"file": str(file), "output_file": str(output_file), "size": list(image.size)}
+
+
+# Process every texture job in a pool of processes, one per processor core unless told otherwise.  A job that fails is reported with its error so that Blender can process that texture instead.
+def process_textures(jobs, workers=None):
+    results = []
+    with ProcessPoolExecutor(max_workers=workers or None) as executor:
+        futures = {executor.submit(process_texture, job): job for job in jobs}
+        for future in as_completed(futures):
+            try:
+                results.append(future.result())
+            except Exception as Argument:
+                results.append({"file": futures[future]["file"], "error": str(Argument)})
+
+    return results
+
+
+# Get the resident memory (RSS) of a process in bytes, or 0 if it can't be determined.
+def get_process_memory(pid):
+    try:
+        # Linux
+        if Path(f"/proc/{pid}/status").is_file():
+            with open(f"/proc/{pid}/status", 'r') as openfile:
+                for line in openfile:
+                    if line.startswith("VmRSS:"):
+                        return int(line.split()[1]) * 1024
+        
+        # Windows
+        elif sys.platform == "win32":
+            import ctypes
+            from ctypes import wintypes
+
+            class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+                _fields_ = [
+                    ("cb", wintypes.DWORD),
+                    ("PageFaultCount", wintypes.DWORD),
+                    ("PeakWorkingSetSize", ctypes.c_size_t),
+                    ("WorkingSetSize", ctypes.c_size_t),
+                    ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                    ("PagefileUsage", ctypes.c_size_t),
+                    ("PeakPagefileUsage", ctypes.c_size_t),
+                ]
+
+            handle = ctypes.windll.kernel32.OpenProcess(0x1000 | 0x0010, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION | PROCESS_VM_READ
+            if not handle:
+                return 0
+            try:
+                counters = PROCESS_MEMORY_COUNTERS()
+                counters.cb = ctypes.sizeof(PROCESS_MEMORY_COUNTERS)
+                if ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+                    return counters.WorkingSetSize
+            finally:
+                ctypes.windll.kernel32.CloseHandle(handle)
+
+        # macOS and other Unix
+        else:
+            rss = subprocess.run(["ps", "-o", "rss=", "-p", str(pid)], capture_output=True, text=True).stdout.strip()
+            if rss:
+                return int(rss) * 1024
+
+    except (OSError, ValueError):
+        pass
+
+    return 0
+
+
+# Check whether a process is still running, e.g. the add-on writing a manifest that Converter.py reads.
+def is_process_alive(pid):
+    # Windows, where os.kill() would terminate the process instead.
+    if sys.platform == "win32":
+        import ctypes
+        handle = ctypes.windll.kernel32.OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
+        if not handle:
+            return False
+        try:
+            exit_code = ctypes.c_ulong()
+            if not ctypes.windll.kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code)):
+                return False
+            return exit_code.value == 259  # STILL_ACTIVE
+        finally:
+            ctypes.windll.kernel32.CloseHandle(handle)
+
+    # GNU/Linux, macOS and other Unix.
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+
+    return True
+
+
+# Process the texture jobs of a JSON file and write the results to another JSON file.  Run with the Python that comes with Blender, e.g. by Converter.py.
+def main():
+    parser = argparse.ArgumentParser(prog="Textures.py", description="Resize and reformat textures in a pool of processes outside Blender.")
+    parser.add_argument("jobs_file", help="JSON file listing the texture jobs")
+    parser.add_argument("results_file", help="JSON file to write the result of each job to")
+    parser.add_argument("--workers", type=int, default=0, help="Number of processes in the pool (default: one per processor core)")
+    arguments = parser.parse_args()
+
+    with open(arguments.jobs_file, 'r') as openfile:
+        jobs = json.load(openfile)
+
+    # Without Pillow, leave every texture to Blender.
+    try:
+        import PIL
+    except ImportError:
+        results = [{"file": job["file"], "error": "Pillow is not installed"} for job in jobs]
+    else:
+        results = process_textures(jobs, arguments.workers)
+
+    with open(arguments.results_file, 'w') as outfile:
+        json.dump(results, outfile)
+
+
+if __name__ == "__main__":
+    main()
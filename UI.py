@@ -156,6 +156,10 @@ def draw_settings_general(self, context):
             if Functions.operator_dict[instance.format][0][0] != "NO_OPERATOR":
                 col.prop(instance, "preset_enum")
 
+            # Importer options for geometry-only formats.
+            if instance.format in ["STL", "OBJ", "PLY"]:
+                col.prop(instance, "importer")
+
             # Directory
             if not settings.link_import_settings:
                 col = box.column(align=True)
@@ -763,6 +767,101 @@ def draw_settings_logging(self, context):
             row.prop(settings, 'logging_bounds_z', text=f"Z ({settings.logging_length_unit_abbr})")
 
 
+# Set performance options.
+def draw_settings_performance(self, context):
+    settings = bpy.context.scene.transmogrifier_settings
+    self.layout.use_property_split = False
+    self.layout.use_property_decorate = False
+    box_performance = self.layout.box()
+    row = box_performance.row(align=False)
+    row.label(text="Performance", icon="SORTTIME")
+
+    # Import order options.
+    col = box_performance.column(align=True)
+    col.use_property_split = True
+    col.prop(settings, 'import_order')
+
+    # Background mode options.
+    row = box_performance.row(align=False)
+    row.prop(settings, 'use_background_mode', icon="CHECKBOX_HLT" if settings.use_background_mode else "CHECKBOX_DEHLT")
+
+    # Cached append options.
+    row = box_performance.row(align=False)
+    row.prop(settings, 'use_cached_append', icon="CHECKBOX_HLT" if settings.use_cached_append else "CHECKBOX_DEHLT")
+
+    # Fast reset options.
+    row = box_performance.row(align=False)
+    row.prop(settings, 'use_fast_reset', icon="CHECKBOX_HLT" if settings.use_fast_reset else "CHECKBOX_DEHLT")
+
+    # Linked textures options.
+    row = box_performance.row(align=False)
+    row.prop(settings, 'use_linked_textures', icon="CHECKBOX_HLT" if settings.use_linked_textures else "CHECKBOX_DEHLT")
+
+    # Texture cache options.
+    row = box_performance.row(align=False)
+    row.prop(settings, 'use_texture_cache', icon="CHECKBOX_HLT" if settings.use_texture_cache else "CHECKBOX_DEHLT")
+    if settings.use_texture_cache:
+        col = box_performance.column(align=True)
+        col.use_property_split = True
+        col.prop(settings, 'texture_cache_dir')
+        col.prop(settings, 'texture_cache_size')
+
+    # Texture pool options.
+    row = box_performance.row(align=False)
+    row.prop(settings, 'use_texture_pool', icon="CHECKBOX_HLT" if settings.use_texture_pool else "CHECKBOX_DEHLT")
+    if settings.use_texture_pool:
+        col = box_performance.column(align=True)
+        col.use_property_split = True
+        col.prop(settings, 'texture_pool_workers')
+
+    # Shared custom materials options.
+    row = box_performance.row(align=False)
+    row.prop(settings, 'use_shared_custom_materials', icon="CHECKBOX_HLT" if settings.use_shared_custom_materials else "CHECKBOX_DEHLT")
+
+    # Manifest options.
+    row = box_performance.row(align=False)
+    row.prop(settings, 'use_manifest', icon="CHECKBOX_HLT" if settings.use_manifest else "CHECKBOX_DEHLT")
+
+    # Resume options.
+    row = box_performance.row(align=False)
+    row.prop(settings, 'use_resume', icon="CHECKBOX_HLT" if settings.use_resume else "CHECKBOX_DEHLT")
+
+    # Memory watermark options.
+    row = box_performance.row(align=False)
+    row.prop(settings, 'use_memory_watermark', icon="CHECKBOX_HLT" if settings.use_memory_watermark else "CHECKBOX_DEHLT")
+    if settings.use_memory_watermark:
+        col = box_performance.column(align=True)
+        col.use_property_split = True
+        col.prop(settings, 'memory_watermark')
+
+    # Isolation options.
+    row = box_performance.row(align=False)
+    row.prop(settings, 'use_isolation', icon="CHECKBOX_HLT" if settings.use_isolation else "CHECKBOX_DEHLT")
+    if settings.use_isolation:
+        col = box_performance.column(align=True)
+        col.use_property_split = True
+        col.prop(settings, 'isolation_group_size')
+        col.prop(settings, 'isolation_timeout')
+        col.prop(settings, 'isolation_memory_limit')
+
+    # Worker pool options.
+    row = box_performance.row(align=False)
+    row.prop(settings, 'use_worker_pool', icon="CHECKBOX_HLT" if settings.use_worker_pool else "CHECKBOX_DEHLT")
+    if settings.use_worker_pool:
+        col = box_performance.column(align=True)
+        col.use_property_split = True
+        col.prop(settings, 'worker_count')
+
+    # Converter service options.
+    row = box_performance.row(align=False)
+    row.prop(settings, 'use_converter_service', icon="CHECKBOX_HLT" if settings.use_converter_service else "CHECKBOX_DEHLT")
+    if settings.use_converter_service:
+        col = box_performance.column(align=True)
+        col.use_property_split = True
+        col.prop(settings, 'converter_service_port')
+        col.operator('transmogrifier.stop_converter_service', icon="CANCEL")
+
+
 # Draws the button and popover dropdown button used in the
 # 3D Viewport Header or Top Bar
 def draw_popover(self, context):
@@ -873,6 +972,16 @@ class VIEW3D_PT_transmogrifier_logging(Panel):
         draw_settings_logging(self, context)
 
 
+class VIEW3D_PT_transmogrifier_performance(Panel):
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "Transmogrifier"
+    bl_label = "Performance"
+
+    def draw(self, context):
+        draw_settings_performance(self, context)
+
+
 # Popover panel (used on 3D Viewport Header or Top Bar option)
 class POPOVER_PT_transmogrifier(Panel):
     bl_space_type = 'TOPBAR'
@@ -893,6 +1002,7 @@ class POPOVER_PT_transmogrifier(Panel):
         if settings.advanced_ui:
             draw_settings_scripts(self, context)
             draw_settings_logging(self, context)
+            draw_settings_performance(self, context)
 
 
 # Addon settings that are NOT specific to a .blend file
@@ -914,6 +1024,7 @@ class TransmogrifierPreferences(AddonPreferences):
                 bpy.utils.unregister_class(VIEW3D_PT_transmogrifier_transformations)
                 bpy.utils.unregister_class(VIEW3D_PT_transmogrifier_scripts)
                 bpy.utils.unregister_class(VIEW3D_PT_transmogrifier_logging)
+                bpy.utils.unregister_class(VIEW3D_PT_transmogrifier_performance)
         if self.addon_location == 'TOPBAR':
             bpy.types.TOPBAR_MT_editor_menus.append(draw_popover)
         elif self.addon_location == '3DHEADER':
@@ -929,6 +1040,7 @@ class TransmogrifierPreferences(AddonPreferences):
                 bpy.utils.register_class(VIEW3D_PT_transmogrifier_transformations)
                 bpy.utils.register_class(VIEW3D_PT_transmogrifier_scripts)
                 bpy.utils.register_class(VIEW3D_PT_transmogrifier_logging)
+                bpy.utils.register_class(VIEW3D_PT_transmogrifier_performance)
 
 
     addon_location: EnumProperty(
@@ -979,6 +1091,7 @@ class TRANSMOGRIFIER_OT_advanced_ui(Operator):
             VIEW3D_PT_transmogrifier_transformations, 
             VIEW3D_PT_transmogrifier_scripts, 
             VIEW3D_PT_transmogrifier_logging, 
+            VIEW3D_PT_transmogrifier_performance, 
         ]
         
         if settings.advanced_ui:
@@ -67,6 +67,7 @@ bl_info = {
 
 # Adapted from Bystedts Blender Baker (GPL-3.0 License, https://3dbystedt.gumroad.com/l/JAqLT), __init__.py
 modules = (
+    '.Textures',
     '.Functions',
     '.Operators',
     '.Settings',